@@ -0,0 +1,74 @@
+from apps.attendees.models import EventAttendee, Participant
+from apps.attendees.utils import make_check_in_token
+from apps.common.benchmarks import measure, report, summarize
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from django.test import tag
+from rest_framework.test import APITestCase
+import datetime
+import time
+
+
+# a door burst: 1,000 attendees scanned in as fast as the server answers, which
+# has to fit well within the 60 s the burst is spread over at a real event;
+# the signed-token endpoint vs PATCHing the attendee through the generic api
+@tag("benchmark")
+class CheckInBurstBenchmark(APITestCase):
+    attendees = 1000
+    burst_seconds = 60
+
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(organization)
+        Participant.objects.bulk_create([
+            Participant(organization=organization, unique_id=f"p-{i}")
+            for i in range(cls.attendees)
+        ])
+        EventAttendee.objects.bulk_create([
+            EventAttendee(event=cls.event, participant=participant, attendance_status="absent")
+            for participant in Participant.objects.all()
+        ])
+        cls.event_attendee_ids = list(cls.event.event_attendees.values_list("id", flat=True))
+
+    # time each scan of the burst; reports & checks it fits the window
+    def run_burst(self, label, scan):
+        pending = iter(self.event_attendee_ids)
+        start = time.perf_counter()
+        durations = measure(lambda: scan(next(pending)), self.attendees)
+        total = time.perf_counter() - start
+
+        self.assertLess(total, self.burst_seconds)
+        report(
+            f"{self.attendees} check-ins, {label}", 
+            total_s=round(total, 2), 
+            check_ins_per_s=round(self.attendees / total), 
+            **summarize(durations)
+        )
+
+    def patch_attendee(self, event_attendee_id):
+        response = self.client.patch(
+            f"/api/eventattendee/{event_attendee_id}/", 
+            {"attendance_status": "attended"}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def scan_token(self, event_attendee_id):
+        response = self.client.post(
+            f"/apps/attendees/events/{self.event.pk}/check-in/", 
+            {"token": make_check_in_token(self.event.pk, event_attendee_id, "participant")}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_check_in_burst(self):
+        self.run_burst("PATCH /api/eventattendee/<id>/ each", self.patch_attendee)
+        EventAttendee.objects.update(attendance_status="absent", checked_in_at=None)
+
+        self.run_burst("signed token check-in", self.scan_token)
+        self.assertFalse(self.event.event_attendees.filter(checked_in_at__isnull=True).exists())
+
+        # everyone scanned again: the repeat path reads checked_in_at back
+        self.run_burst("signed token, repeat scans", self.scan_token)
@@ -0,0 +1,31 @@
+from apps.attendees.utils import get_check_in_tokens
+from apps.events.models import Event
+from django.core.management.base import BaseCommand, CommandError
+import csv
+
+
+class Command(BaseCommand):
+    help = "Write signed QR check-in tokens for an event's attendees as CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("event", type=int, help="Event id")
+        parser.add_argument(
+            "--output", 
+            help="File to write to; defaults to stdout"
+        )
+
+    def handle(self, *args, **options):
+        if not Event.objects.filter(pk=options["event"]).exists():
+            raise CommandError(f"Event {options['event']} does not exist")
+
+        tokens = get_check_in_tokens(options["event"])
+        fieldnames = ["event_attendee", "attendee_type", "unique_id", "name", "token"]
+        if options["output"]:
+            with open(options["output"], "w", newline="") as output:
+                writer = csv.DictWriter(output, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(tokens)
+        else:
+            writer = csv.DictWriter(self.stdout, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(tokens)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0001_initial'),
+        ('events', '0001_initial'),
+        ('organizations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventattendee',
+            index=models.Index(fields=['is_deleted', 'created_at'], name='attendee_deleted_created_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0002_eventattendee_attendee_deleted_created_idx'),
+        ('events', '0001_initial'),
+        ('organizations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='eventattendee',
+            unique_together={('event', 'facilitator'), ('event', 'participant')},
+        ),
+        migrations.AddIndex(
+            model_name='eventattendee',
+            index=models.Index(fields=['event', 'attendee_type', 'attendance_status'], name='attendee_event_type_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['organization', 'unique_id'], name='participant_org_unique_id_idx'),
+        ),
+    ]
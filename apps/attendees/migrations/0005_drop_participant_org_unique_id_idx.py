@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0004_eventattendee_checked_in_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='participant',
+            name='participant_org_unique_id_idx',
+        ),
+    ]
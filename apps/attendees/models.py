@@ -66,6 +66,27 @@ class CustomAttendeeType(BaseModel, AttendeeInfoModel):
         verbose_name_plural = "Custom Attendee Types"
 
 
+# organization ids per event, loaded once per event on first lookup;
+# share one instance across a request or batch so each event is queried once
+class EventOrganizationCache(dict):
+    def __missing__(self, event_id):
+        # through table holds the ids; no need to load Organization rows
+        Event = EventAttendee._meta.get_field("event").related_model
+        organization_ids = frozenset(Event.organizations.through.objects.filter(
+            event_id=event_id
+        ).values_list("organization_id", flat=True))
+        self[event_id] = organization_ids
+        return organization_ids
+
+    # validation check that attendee's organization in event's organization(s)
+    def validate(self, event_id, attendee_type, organization_id):
+        if organization_id not in self[event_id]:
+            raise ValidationError(
+                f"{attendee_type.capitalize()} does not belong to any "
+                "of the organizations running the event"
+            )
+
+
 class EventAttendee(BaseModel):
     
     EVENT_ATTENDEE_TYPES = [
@@ -74,31 +95,43 @@ class EventAttendee(BaseModel):
         ("other", "Other"), # custom types
     ]
 
-    ### VALIDATION CHECK ###
+    # map attendee types to their specific attendee fields
+    ATTENDEE_FIELDS = {
+        "participant": "participant",
+        "facilitator": "facilitator",
+        "other": "custom_attendee_type",
+    }
 
-    # validation check that facilitator's organization in event's organization(s)
-    def clean(self):
-        # map attendee types to their specific instances
-        attendee_map = {
-            "participant": self.participant,
-            "facilitator": self.facilitator,
-            "other": self.custom_attendee_type,
-        }
+    ### VALIDATION CHECK ###
 
-        # get current attendee instance based on type
-        attendee_instance = attendee_map.get(self.attendee_type)
+    # validation check that attendee's organization in event's organization(s)
+    # pass event_organizations to reuse one EventOrganizationCache across a batch
+    def clean(self, event_organizations=None):
+        organization_id = self.get_attendee_organization_id()
 
         # conditional validation check if attendee instance exists
-        if attendee_instance is not None:
-            if attendee_instance.organization not in self.event.organizations.all():
-                raise ValidationError(
-                    f"{self.attendee_type.capitalize()} does not belong to any "
-                    "of the organizations running the event"
-                )
+        if organization_id is not None:
+            if event_organizations is None:
+                event_organizations = EventOrganizationCache()
+            event_organizations.validate(self.event_id, self.attendee_type, organization_id)
+
+    # organization id of the current attendee, by id only where not already loaded
+    def get_attendee_organization_id(self):
+        field = self._meta.get_field(self.ATTENDEE_FIELDS.get(self.attendee_type, "participant"))
+        if field.is_cached(self):
+            attendee_instance = field.get_cached_value(self)
+            return attendee_instance.organization_id if attendee_instance else None
+
+        attendee_id = getattr(self, field.attname)
+        if attendee_id is None:
+            return None
+        return field.related_model.objects.all_with_deleted().filter(
+            pk=attendee_id
+        ).values_list("organization_id", flat=True).first()
     
     # run validation on save
-    def save(self, *args, **kwargs):
-        self.clean()
+    def save(self, *args, event_organizations=None, **kwargs):
+        self.clean(event_organizations)
         super().save(*args, **kwargs)
 
     ### FIELDS ###    
@@ -151,6 +184,12 @@ class EventAttendee(BaseModel):
         ], 
         default="attended"
     )
+    # set on QR check-in (apps.attendees.utils.check_in_attendee); 
+    # None until the attendee has checked in
+    checked_in_at = models.DateTimeField(null=True, blank=True)
+
+    # responses first: counters read the attendee's demographics when decrementing
+    soft_delete_cascade = ("responses", "demographics")
 
     def __str__(self):
         attendee = self.participant or self.facilitator or self.custom_attendee_type
@@ -159,12 +198,23 @@ class EventAttendee(BaseModel):
     class Meta:
         # avoid duplicate registrations: 
         # ensure each attendee assigned to specific event only once
+        # (event, custom_attendee_type, participant/facilitator) were implied by these
         unique_together = (
             ("event", "participant"),
             ("event", "facilitator"),
-            ("event", "custom_attendee_type", "participant"),
-            ("event", "custom_attendee_type", "facilitator"),
         )
+        indexes = [
+            # live rows filtered & ordered on every list request
+            models.Index(
+                fields=["is_deleted", "created_at"], 
+                name="attendee_deleted_created_idx"
+            ),
+            # rosters & check-in lists by event, type & status
+            models.Index(
+                fields=["event", "attendee_type", "attendance_status"], 
+                name="attendee_event_type_status_idx"
+            ),
+        ]
         verbose_name = "Event Attendee"
         verbose_name_plural = "Event Attendees"
         
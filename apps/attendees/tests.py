@@ -1,3 +1,280 @@
-from django.test import TestCase
+from apps.attendees.models import CustomAttendeeType, EventAttendee, Participant
+from apps.attendees.utils import make_check_in_token
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+import datetime
 
-# Create your tests here.
+
+# soft deleted rows still hold their unique slots in the db,
+# so reusing one is a validation error, not an IntegrityError
+class SoftDeletedUniqueTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(cls.organization)
+
+    def test_unique_field_includes_deleted(self):
+        Participant.objects.create(organization=self.organization, unique_id="a2").delete_record()
+
+        response = self.client.post(
+            "/api/participant/", 
+            {"unique_id": "a2", "organization": self.organization.pk}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("unique_id", response.json())
+
+    def test_unique_type_name_includes_deleted(self):
+        CustomAttendeeType.objects.create(
+            organization=self.organization, 
+            type_name="Volunteer"
+        ).delete_record()
+
+        response = self.client.post(
+            "/api/customattendeetype/", 
+            {"type_name": "Volunteer", "organization": self.organization.pk}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("type_name", response.json())
+
+    def test_unique_together_includes_deleted(self):
+        participant = Participant.objects.create(organization=self.organization)
+        EventAttendee.objects.create(event=self.event, participant=participant).delete_record()
+
+        response = self.client.post(
+            "/api/eventattendee/", 
+            {
+                "event": self.event.pk, 
+                "organizations": [self.organization.pk], 
+                "participant": participant.pk,
+            }, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class BulkIngestTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(cls.organization)
+
+    # rejected before any INSERT: MariaDB checks FKs immediately, 
+    # so an unknown organization must never reach the db
+    def test_unknown_organization_rejected_before_insert(self):
+        other_organization = Organization.objects.create(name="Other")
+        for organization_id in (999999, other_organization.pk):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    f"/apps/attendees/events/{self.event.pk}/bulk/", 
+                    [
+                        {"first_name": "Ada", "organization": organization_id},
+                        {"attendee_type": "Volunteer", "organization": organization_id},
+                    ], 
+                    format="json"
+                )
+            self.assertEqual(response.status_code, 400)
+            self.assertFalse([
+                query for query in queries.captured_queries 
+                if query["sql"].startswith("INSERT")
+            ])
+        self.assertFalse(Participant.objects.all_with_deleted().exists())
+
+    def test_roster_linked(self):
+        response = self.client.post(
+            f"/apps/attendees/events/{self.event.pk}/bulk/", 
+            [{"first_name": "Ada"}, {"first_name": "Grace", "attendee_type": "facilitator"}], 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["linked"], 2)
+        self.assertEqual(self.event.event_attendees.count(), 2)
+
+    def ingest(self, rows):
+        return self.client.post(
+            f"/apps/attendees/events/{self.event.pk}/bulk/", 
+            rows, 
+            format="json"
+        )
+
+    # each custom type row is one attendee; re-uploading the roster adds none
+    def test_custom_type_rows_each_linked(self):
+        rows = [
+            {"attendee_type": "Volunteer"}, 
+            {"attendee_type": "Volunteer"}, 
+            {"attendee_type": "Volunteer"}, 
+            {"attendee_type": "Staff"},
+        ]
+        response = self.ingest(rows)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["linked"], 4)
+        self.assertEqual(
+            self.event.event_attendees.filter(custom_attendee_type__type_name="Volunteer").count(), 
+            3
+        )
+
+        repeat = self.ingest(rows).json()
+        self.assertEqual((repeat["linked"], repeat["already_linked"]), (0, 4))
+        self.assertEqual(self.event.event_attendees.count(), 4)
+
+    # rows without a unique_id resolve to the attendee holding their email
+    def test_rows_matched_by_email(self):
+        participant = Participant.objects.create(
+            organization=self.organization, 
+            email="ada@example.com"
+        )
+        rows = [
+            {"first_name": "Ada", "email": "ada@example.com"}, 
+            {"first_name": "Grace", "email": "grace@example.com"}, 
+            {"first_name": "Grace", "email": "grace@example.com"},
+        ]
+        response = self.ingest(rows)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"created": 1, "linked": 2, "already_linked": 0})
+        self.assertTrue(self.event.event_attendees.filter(participant=participant).exists())
+
+        # a re-upload without unique_ids creates nobody
+        repeat = self.ingest(rows)
+        self.assertEqual(repeat.status_code, 201)
+        self.assertEqual(repeat.json(), {"created": 0, "linked": 0, "already_linked": 2})
+        self.assertEqual(Participant.objects.count(), 2)
+
+    # an email held by a different attendee fails its own row, before any INSERT
+    def test_email_clash_rejected_per_row(self):
+        Participant.objects.create(
+            organization=self.organization, 
+            unique_id="x", 
+            email="ada@example.com"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.ingest([
+                {"unique_id": "y", "email": "ada@example.com"}, 
+                {"first_name": "Grace"}, 
+                {"unique_id": "p", "email": "kat@example.com"}, 
+                {"unique_id": "q", "email": "kat@example.com"},
+            ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["attendees"]), {"0", "3"})
+        self.assertFalse([
+            query for query in queries.captured_queries 
+            if query["sql"].startswith("INSERT")
+        ])
+
+    def test_non_object_rows_rejected(self):
+        response = self.ingest(["Ada", 1, {"first_name": "Grace"}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["attendees"]), {"0", "1"})
+        self.assertEqual(self.ingest({"attendees": "Ada"}).status_code, 400)
+        self.assertFalse(Participant.objects.exists())
+
+
+# a request validates every attendee against one EventOrganizationCache
+class EventOrganizationCacheTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(cls.organization)
+        cls.participant = Participant.objects.create(organization=cls.organization)
+
+    # queries reading the event's organizations while fn runs
+    def get_organization_lookups(self, fn):
+        with CaptureQueriesContext(connection) as queries:
+            response = fn()
+        self.assertLess(response.status_code, 300)
+        table = Event.organizations.through._meta.db_table
+        return [
+            query for query in queries.captured_queries 
+            if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+        ]
+
+    def test_create(self):
+        lookups = self.get_organization_lookups(lambda: self.client.post(
+            "/api/eventattendee/", 
+            {
+                "event": self.event.pk, 
+                "organizations": [self.organization.pk], 
+                "participant": self.participant.pk,
+            }, 
+            format="json"
+        ))
+        self.assertEqual(len(lookups), 1)
+        event_attendee = self.event.event_attendees.get()
+        self.assertEqual(list(event_attendee.organizations.all()), [self.organization])
+
+    # the attendee's own save & the roster it brings share the cache
+    def test_update_with_roster(self):
+        event_attendee = EventAttendee.objects.create(event=self.event, participant=self.participant)
+        lookups = self.get_organization_lookups(lambda: self.client.patch(
+            f"/api/eventattendee/{event_attendee.pk}/", 
+            {
+                "organizations": [self.organization.pk], 
+                "attendees": [
+                    {"first_name": "Ada"}, 
+                    {"first_name": "Grace", "attendee_type": "facilitator"}, 
+                    {"attendee_type": "Volunteer"},
+                ],
+            }, 
+            format="json"
+        ))
+        self.assertEqual(len(lookups), 1)
+        self.assertEqual(self.event.event_attendees.count(), 4)
+        self.assertEqual(list(event_attendee.organizations.all()), [self.organization])
+
+
+class CheckInTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(organization)
+
+    def setUp(self):
+        self.client.post(
+            f"/apps/attendees/events/{self.event.pk}/bulk/", 
+            [{"first_name": "Ada"}], 
+            format="json"
+        )
+        self.event_attendee = self.event.event_attendees.get()
+
+    def check_in(self):
+        return self.client.post(
+            f"/apps/attendees/events/{self.event.pk}/check-in/", 
+            {"token": make_check_in_token(self.event.pk, self.event_attendee.pk, "participant")}, 
+            format="json"
+        )
+
+    # roster attendees are absent until scanned; a repeat scan changes nothing
+    def test_check_in_recorded_once(self):
+        self.assertEqual(self.event_attendee.attendance_status, "absent")
+        self.assertIsNone(self.event_attendee.checked_in_at)
+
+        # the signed token stands in for every lookup: one UPDATE
+        with self.assertNumQueries(1):
+            first = self.check_in().json()
+        self.assertFalse(first["already_checked_in"])
+        self.event_attendee.refresh_from_db()
+        self.assertEqual(self.event_attendee.attendance_status, "attended")
+        self.assertIsNotNone(self.event_attendee.checked_in_at)
+
+        repeat = self.check_in().json()
+        self.assertTrue(repeat["already_checked_in"])
+        self.assertEqual(repeat["checked_in_at"], first["checked_in_at"])
+
+    def test_removed_attendee_not_found(self):
+        self.event_attendee.delete_record()
+        self.assertEqual(self.check_in().status_code, 404)
+
+    def test_tampered_token_rejected(self):
+        response = self.client.post(
+            f"/apps/attendees/events/{self.event.pk}/check-in/", 
+            {"token": make_check_in_token(self.event.pk, self.event_attendee.pk, "participant") + "x"}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,26 @@
+from django.urls import path
+from .views import (
+    EventAttendeeBulkIngestView, 
+    EventAttendeeCheckInTokensView, 
+    EventAttendeeCheckInView
+)
+
+app_name = 'attendees'
+
+urlpatterns = [
+    path(
+        'events/<int:event_id>/bulk/', 
+        EventAttendeeBulkIngestView.as_view(), 
+        name='event-attendee-bulk-ingest'
+    ),
+    path(
+        'events/<int:event_id>/check-in/', 
+        EventAttendeeCheckInView.as_view(), 
+        name='event-attendee-check-in'
+    ),
+    path(
+        'events/<int:event_id>/check-in-tokens/', 
+        EventAttendeeCheckInTokensView.as_view(), 
+        name='event-attendee-check-in-tokens'
+    ),
+]
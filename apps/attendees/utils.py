@@ -0,0 +1,402 @@
+from .models import (
+    CustomAttendeeType, 
+    EventAttendee, 
+    EventOrganizationCache, 
+    Facilitator, 
+    Participant
+)
+from apps.common.signals import post_bulk_create
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework import serializers
+import uuid
+
+
+### BULK ATTENDEE INGEST ###
+# rows per INSERT & per IN (...) lookup; keeps statements under db packet limits
+BULK_BATCH_SIZE = 1000
+
+# map standard attendee types to models; any other type is a CustomAttendeeType
+ATTENDEE_MODELS = {
+    "participant": Participant,
+    "facilitator": Facilitator,
+}
+
+ATTENDEE_INFO_FIELDS = ["first_name", "last_name", "email", "phone_number"]
+
+
+# split a list into batch-sized chunks
+def chunked(items, size=BULK_BATCH_SIZE):
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# resolve unique_id -> (id, organization_id) for existing attendees,
+# one query per batch instead of one get_or_create per attendee
+# soft deleted rows included: unique_id is unique across all rows
+def get_existing_attendees(model, unique_ids):
+    existing = {}
+    for batch in chunked(unique_ids):
+        for unique_id, pk, organization_id in model.objects.all_with_deleted().filter(
+            unique_id__in=batch
+        ).values_list("unique_id", "id", "organization_id"):
+            existing[unique_id] = (pk, organization_id)
+    return existing
+
+
+# resolve email -> unique_id for existing attendees; email is unique too
+def get_existing_emails(model, emails):
+    existing = {}
+    for batch in chunked(emails):
+        existing.update(model.objects.all_with_deleted().filter(
+            email__in=batch
+        ).values_list("email", "unique_id"))
+    return existing
+
+
+# add a whole roster of attendees to an event in one transaction;
+# each row is a dict with optional attendee_type (participant, facilitator,
+# or a custom type name), unique_id, organization & ATTENDEE_INFO_FIELDS
+# rows without a unique_id are matched to existing attendees by email;
+# invalid rows are reported per row index & nothing is written
+# bulk_create skips EventAttendee.clean(), so organizations are validated here
+def bulk_ingest_attendees(event, attendees_data, organization_id=None, event_organizations=None):
+    if event_organizations is None:
+        event_organizations = EventOrganizationCache()
+    event_organization_ids = event_organizations[event.pk]
+
+    if not isinstance(attendees_data, list):
+        raise serializers.ValidationError({"attendees": "Expected a list of attendees"})
+
+    # default organization: given explicitly, or the event's only organization
+    if organization_id is None and len(event_organization_ids) == 1:
+        organization_id = next(iter(event_organization_ids))
+
+    # group rows by attendee type, with their index for error reporting
+    indexed_rows_by_type = {attendee_type: [] for attendee_type in ATTENDEE_MODELS}
+    custom_rows = {}
+    errors = {}
+
+    for index, row in enumerate(attendees_data):
+        if not isinstance(row, dict):
+            errors[index] = ["Expected an object of attendee fields"]
+            continue
+        attendee_type = (row.get("attendee_type") or "participant").strip()
+        row_organization_id = row.get("organization") or organization_id
+        if row_organization_id is None:
+            errors[index] = [
+                "An organization is required for each attendee "
+                "when the event has more than one organization"
+            ]
+            continue
+        try:
+            row = {**row, "organization": int(row_organization_id)}
+        except (TypeError, ValueError):
+            errors[index] = [f"Invalid organization: {row_organization_id}"]
+            continue
+
+        if attendee_type in ATTENDEE_MODELS:
+            indexed_rows_by_type[attendee_type].append((index, row))
+        else:
+            # custom types have no per-attendee record: each row is one more link
+            custom_rows.setdefault(attendee_type, []).append(row)
+
+    # key rows by unique_id to drop duplicates in payload
+    rows_by_type = {
+        attendee_type: get_rows_by_unique_id(ATTENDEE_MODELS[attendee_type], indexed_rows, errors)
+        for attendee_type, indexed_rows in indexed_rows_by_type.items()
+    }
+    if errors:
+        raise serializers.ValidationError({"attendees": errors})
+
+    summary = {"created": 0, "linked": 0, "already_linked": 0}
+
+    with transaction.atomic():
+        links_to_create = []
+
+        for attendee_type, rows in rows_by_type.items():
+            if not rows:
+                continue
+            model = ATTENDEE_MODELS[attendee_type]
+            existing = get_existing_attendees(model, rows.keys())
+
+            # bulk create attendees not already in the db
+            attendees_to_create = [
+                model(
+                    unique_id=unique_id,
+                    organization_id=row["organization"],
+                    **{
+                        field: row[field]
+                        for field in ATTENDEE_INFO_FIELDS
+                        if row.get(field)
+                    }
+                )
+                for unique_id, row in rows.items()
+                if unique_id not in existing
+            ]
+            # before inserting: an unknown organization id would otherwise fail 
+            # the FK check (immediate on MariaDB) as an IntegrityError
+            validate_attendee_organizations(
+                event,
+                attendee_type,
+                [attendee.organization_id for attendee in attendees_to_create],
+                event_organizations
+            )
+            model.objects.bulk_create(attendees_to_create, batch_size=BULK_BATCH_SIZE)
+            summary["created"] += len(attendees_to_create)
+
+            # mysql doesn't return pks from bulk_create, so resolve the new ones again
+            if attendees_to_create:
+                existing.update(get_existing_attendees(
+                    model,
+                    [attendee.unique_id for attendee in attendees_to_create]
+                ))
+
+            validate_attendee_organizations(
+                event,
+                attendee_type,
+                [organization_id for _, organization_id in existing.values()],
+                event_organizations
+            )
+
+            links_to_create += get_links_to_create(
+                event,
+                attendee_type,
+                attendee_type,
+                [pk for pk, _ in existing.values()],
+                summary
+            )
+
+        if custom_rows:
+            # resolve custom types by name in one query, create the rest in bulk
+            custom_types = get_custom_attendee_types(custom_rows)
+            types_to_create = [
+                CustomAttendeeType(
+                    type_name=type_name,
+                    unique_id=str(uuid.uuid4()),
+                    organization_id=rows[0]["organization"],
+                )
+                for type_name, rows in custom_rows.items()
+                if type_name not in custom_types
+            ]
+            validate_attendee_organizations(
+                event,
+                "other",
+                [custom_type.organization_id for custom_type in types_to_create],
+                event_organizations
+            )
+            CustomAttendeeType.objects.bulk_create(types_to_create, batch_size=BULK_BATCH_SIZE)
+            if types_to_create:
+                custom_types = get_custom_attendee_types(custom_rows)
+
+            validate_attendee_organizations(
+                event,
+                "other",
+                [organization_id for _, organization_id in custom_types.values()],
+                event_organizations
+            )
+
+            links_to_create += get_custom_links_to_create(
+                event,
+                {
+                    custom_types[type_name][0]: len(rows) 
+                    for type_name, rows in custom_rows.items()
+                },
+                summary
+            )
+
+        EventAttendee.objects.bulk_create(links_to_create, batch_size=BULK_BATCH_SIZE)
+        post_bulk_create.send(sender=EventAttendee, instances=links_to_create)
+
+    return summary
+
+
+# unique_id -> row for one attendee model's (index, row) pairs; rows without 
+# a unique_id take the one of the attendee holding their email, in the db or 
+# earlier in the roster, else a new one; an email held by a different attendee 
+# is an error on that row, not an IntegrityError on insert
+def get_rows_by_unique_id(model, indexed_rows, errors):
+    existing_emails = get_existing_emails(
+        model, 
+        {row["email"] for _, row in indexed_rows if row.get("email")}
+    )
+    roster_emails = {}
+    rows = {}
+
+    for index, row in indexed_rows:
+        email = row.get("email") or None
+        unique_id = row.get("unique_id")
+        if not unique_id:
+            # automatically assign a unique identifier if not matched or provided
+            unique_id = (
+                existing_emails.get(email) 
+                or roster_emails.get(email) 
+                or str(uuid.uuid4())
+            )
+        elif existing_emails.get(email, unique_id) != unique_id:
+            errors[index] = [f"Email {email} already belongs to another attendee"]
+            continue
+
+        if email and roster_emails.setdefault(email, unique_id) != unique_id:
+            errors[index] = [f"Email {email} is used by another attendee in this roster"]
+            continue
+        rows[unique_id] = row
+
+    return rows
+
+
+# type_name -> (id, organization_id) for custom attendee types
+def get_custom_attendee_types(type_names):
+    return {
+        type_name: (pk, organization_id)
+        for type_name, pk, organization_id in CustomAttendeeType.objects.all_with_deleted().filter(
+            type_name__in=type_names
+        ).values_list("type_name", "id", "organization_id")
+    }
+
+
+# raise if any attendee's organization isn't running the event;
+# same check as EventAttendee.clean(), by organization id only
+def validate_attendee_organizations(event, attendee_type, organization_ids, event_organizations):
+    try:
+        for organization_id in set(organization_ids):
+            event_organizations.validate(event.pk, attendee_type, organization_id)
+    except ValidationError as e:
+        raise serializers.ValidationError(e.messages)
+
+
+# build EventAttendee rows for attendees not yet registered to the event;
+# a roster is pre-registration, so attendees are absent until they check in
+def get_links_to_create(event, attendee_type, field_name, attendee_ids, summary):
+    attendee_ids = set(attendee_ids)
+    already_linked = set()
+    for batch in chunked(attendee_ids):
+        # soft deleted links still hold the unique (event, attendee) slot
+        already_linked.update(EventAttendee.objects.all_with_deleted().filter(
+            event=event,
+            **{f"{field_name}_id__in": batch}
+        ).values_list(f"{field_name}_id", flat=True))
+
+    summary["already_linked"] += len(already_linked)
+    links = [
+        EventAttendee(
+            event=event,
+            attendee_type=attendee_type,
+            attendance_status="absent",
+            **{f"{field_name}_id": attendee_id}
+        )
+        for attendee_id in attendee_ids - already_linked
+    ]
+    summary["linked"] += len(links)
+    return links
+
+
+# build EventAttendee rows for custom type attendees, from a count per type id;
+# custom type attendees have no identity of their own, so the roster's count
+# is kept: re-uploading it links only the attendees beyond those already linked
+def get_custom_links_to_create(event, counts_by_type, summary):
+    # soft deleted links counted too, as for the other attendee types
+    already_linked = dict(EventAttendee.objects.all_with_deleted().filter(
+        event=event,
+        custom_attendee_type_id__in=counts_by_type
+    ).values("custom_attendee_type_id").annotate(
+        count=Count("id")
+    ).values_list("custom_attendee_type_id", "count"))
+
+    links = []
+    for custom_type_id, count in counts_by_type.items():
+        linked = min(count, already_linked.get(custom_type_id, 0))
+        summary["already_linked"] += linked
+        links += [
+            EventAttendee(
+                event=event,
+                attendee_type="other",
+                attendance_status="absent",
+                custom_attendee_type_id=custom_type_id
+            )
+            for _ in range(count - linked)
+        ]
+    summary["linked"] += len(links)
+    return links
+
+
+### QR CHECK-IN ###
+# salt scoping check-in signatures, so no other signed value passes as a token
+CHECK_IN_SALT = "attendees.check_in"
+
+
+# self-contained signed token for an attendee's QR code: carries the event, 
+# EventAttendee id & attendee type, so checking in needs no lookup to resolve it;
+# deterministic, so tokens can be printed ahead of the event & regenerated at will
+def make_check_in_token(event_id, event_attendee_id, attendee_type):
+    return signing.Signer(salt=CHECK_IN_SALT).sign_object(
+        [event_id, event_attendee_id, attendee_type]
+    )
+
+
+# (event_attendee_id, attendee_type) for a token issued for this event;
+# raises serializers.ValidationError for tampered tokens or other events' tokens
+def read_check_in_token(event_id, token):
+    try:
+        token_event_id, event_attendee_id, attendee_type = signing.Signer(
+            salt=CHECK_IN_SALT
+        ).unsign_object(str(token))
+    except (signing.BadSignature, TypeError, ValueError):
+        raise serializers.ValidationError({"token": "Invalid check-in token"})
+    if token_event_id != event_id:
+        raise serializers.ValidationError({"token": "Token is for a different event"})
+    return event_attendee_id, attendee_type
+
+
+# mark the attendee as attended & stamp checked_in_at with a single UPDATE on 
+# the pk (no clean(), no signals), matching only attendees not yet checked in;
+# returns (checked_in_at, already_checked_in), or None if the attendee 
+# was removed from the event since
+def check_in_attendee(event_id, event_attendee_id):
+    event_attendees = EventAttendee.objects.filter(pk=event_attendee_id, event_id=event_id)
+    now = timezone.now()
+    if event_attendees.filter(checked_in_at__isnull=True).update(
+        attendance_status="attended", 
+        checked_in_at=now, 
+        last_modified=now
+    ):
+        return now, False
+
+    # repeat scan: only now look up when they first checked in
+    checked_in_at = event_attendees.values_list("checked_in_at", flat=True).first()
+    if checked_in_at is None:
+        return None
+    return checked_in_at, True
+
+
+# tokens for every attendee of an event, for printing badges/QR codes
+def get_check_in_tokens(event_id):
+    event_attendees = EventAttendee.objects.filter(event_id=event_id).select_related(
+        "participant", 
+        "facilitator", 
+        "custom_attendee_type"
+    ).order_by("id")
+
+    tokens = []
+    for event_attendee in event_attendees:
+        attendee = (
+            event_attendee.participant 
+            or event_attendee.facilitator 
+            or event_attendee.custom_attendee_type
+        )
+        tokens.append({
+            "event_attendee": event_attendee.pk,
+            "attendee_type": event_attendee.attendee_type,
+            "unique_id": attendee.unique_id if attendee else None,
+            "name": f"{attendee.first_name} {attendee.last_name}".strip() if attendee else "",
+            "token": make_check_in_token(
+                event_id, 
+                event_attendee.pk, 
+                event_attendee.attendee_type
+            ),
+        })
+    return tokens
@@ -1,3 +1,62 @@
-from django.shortcuts import render
+from .utils import (
+    bulk_ingest_attendees, 
+    check_in_attendee, 
+    get_check_in_tokens, 
+    read_check_in_token
+)
+from apps.common.utils import CSVParser
+from apps.events.models import Event
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from rest_framework import parsers, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+
+# add a whole roster of attendees to an event in one request;
+# accepts a JSON array (or {"organization": id, "attendees": [...]}) or a CSV body
+class EventAttendeeBulkIngestView(APIView):
+    parser_classes = [parsers.JSONParser, CSVParser]
+
+    def post(self, request, event_id):
+        event = get_object_or_404(Event, pk=event_id)
+        organization_id = request.query_params.get("organization")
+
+        if isinstance(request.data, dict):
+            organization_id = request.data.get("organization", organization_id)
+            attendees_data = request.data.get("attendees", [])
+        else:
+            attendees_data = request.data
+
+        summary = bulk_ingest_attendees(event, attendees_data, organization_id)
+        return Response(summary, status=status.HTTP_201_CREATED)
+
+
+# door check-in from a scanned QR code: POST {"token": "..."}; the signed token
+# resolves the attendee, so a first scan is one UPDATE & no event or attendee 
+# lookups; repeat scans report when the attendee first checked in
+class EventAttendeeCheckInView(APIView):
+
+    def post(self, request, event_id):
+        event_attendee_id, attendee_type = read_check_in_token(
+            event_id, 
+            request.data.get("token")
+        )
+        checked_in = check_in_attendee(event_id, event_attendee_id)
+        if checked_in is None:
+            raise Http404("Attendee is no longer registered for this event")
+        checked_in_at, already_checked_in = checked_in
+        return Response({
+            "event_attendee": event_attendee_id, 
+            "attendee_type": attendee_type,
+            "checked_in_at": checked_in_at,
+            "already_checked_in": already_checked_in,
+        })
+
+
+# check-in tokens for all of an event's attendees, to print as QR codes
+class EventAttendeeCheckInTokensView(APIView):
+
+    def get(self, request, event_id):
+        event = get_object_or_404(Event, pk=event_id)
+        return Response(get_check_in_tokens(event.pk))
@@ -7,7 +7,16 @@ class BaseModelConfig(AppConfig):
     name = "apps.common"
 
     # startup logic that requires access to models
+    # every app config inherits this; registry is shared so only built once
     def ready(self):
-        from .utils import generate_serializers, generate_viewsets
-        self.serializers_dict = generate_serializers()
-        self.viewsets_dict = generate_viewsets(self.serializers_dict)
\ No newline at end of file
+        from .models import BaseModel
+        from .signals import connect_m2m_last_modified
+        from .utils import get_serializers, get_viewsets
+        self.serializers_dict = get_serializers()
+        self.viewsets_dict = get_viewsets()
+
+        # ETags of this app's models follow their m2m fields too
+        for model in self.get_models():
+            if issubclass(model, BaseModel):
+                for field in model._meta.local_many_to_many:
+                    connect_m2m_last_modified(field)
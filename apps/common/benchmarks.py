@@ -0,0 +1,343 @@
+from apps.attendees.models import EventAttendee, Participant
+from apps.common.renderers import FastJSONRenderer, orjson
+from apps.common.utils import (
+    get_fast_columns, 
+    get_readable_fields, 
+    get_request_converter, 
+    get_serializers
+)
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from apps.questions.models import Question
+from apps.responses.models import Response
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase, tag
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+import datetime
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+### BENCHMARKS ###
+# not collected by a plain `manage.py test` (only tests.py is); run with
+#   DB_ENGINE=django.db.backends.sqlite3 python manage.py test apps --pattern="benchmarks.py"
+# & record the printed numbers in documentation/benchmarks.txt
+
+
+# seconds per call of fn, repeat times
+def measure(fn, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+# median & p95 in ms of measured durations
+def summarize(durations):
+    durations = sorted(durations)
+    return {
+        "median_ms": round(statistics.median(durations) * 1000, 2),
+        "p95_ms": round(durations[max(0, int(len(durations) * 0.95) - 1)] * 1000, 2),
+    }
+
+
+def report(label, **values):
+    print(f"\n[benchmark] {label}: " + ", ".join(f"{key}={value}" for key, value in values.items()))
+
+
+# one event, question & attendee with n responses, bulk inserted
+def seed_responses(n):
+    organization = Organization.objects.create(name="Org")
+    event = Event.objects.create(name="Event", date=datetime.date.today())
+    event.organizations.add(organization)
+    question = Question.objects.create(text="How was today's session?", organization=organization)
+    event.questions.add(question)
+    event_attendee = EventAttendee.objects.create(
+        event=event, 
+        participant=Participant.objects.create(organization=organization)
+    )
+    Response.objects.bulk_create([
+        Response(
+            text=f"Response {i}: the session was useful & well paced", 
+            event_attendee=event_attendee, 
+            question=question
+        )
+        for i in range(n)
+    ], batch_size=1000)
+    return event, question, event_attendee
+
+
+# run in a fresh interpreter: startup to a loaded urlconf, the eager per-app 
+# build ready() used to do, then workers forked from the loaded process 
+# (as a preloading server does) timed until every api route's serializer 
+# is built, with the parent's registry left lazy & warmed before forking
+STARTUP_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+import obwob.urls
+setup_s = time.perf_counter() - start
+
+from apps.common.apps import BaseModelConfig
+from apps.common.utils import MODELS_LIST, generate_serializers, generate_viewsets, get_viewsets
+from django.apps import apps
+
+def build_all(viewsets_dict):
+    for viewset_class in viewsets_dict.values():
+        viewset_class().get_serializer_class()().fields
+
+def fork_to_ready(workers=4):
+    durations = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        forked = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            build_all(get_viewsets())
+            os.write(write_fd, str(time.perf_counter() - forked).encode())
+            os._exit(0)
+        os.waitpid(pid, 0)
+        durations.append(float(os.read(read_fd, 64)))
+        os.close(read_fd)
+        os.close(write_fd)
+    return durations
+
+# pre-change ready(): every app config built the whole registry eagerly
+start = time.perf_counter()
+for app_config in apps.get_app_configs():
+    if isinstance(app_config, BaseModelConfig):
+        serializers_dict = generate_serializers()
+        for key in MODELS_LIST:
+            serializers_dict[key]
+        generate_viewsets(serializers_dict)
+eager_s = time.perf_counter() - start
+
+lazy = fork_to_ready()
+build_all(get_viewsets())
+warmed = fork_to_ready()
+print(json.dumps({"setup_s": setup_s, "eager_s": eager_s, "lazy": lazy, "warmed": warmed}))
+"""
+
+
+# cold start & fork-to-ready of the serializer/viewset registry; 
+# os.fork stands in for a preforking server (gunicorn isn't a dependency)
+@tag("benchmark")
+class RegistryBenchmark(SimpleTestCase):
+    runs = 5
+
+    def test_cold_start_and_fork(self):
+        results = []
+        process_s = []
+        for _ in range(self.runs):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, "-c", STARTUP_SCRIPT], 
+                capture_output=True, 
+                check=True, 
+                text=True
+            ).stdout
+            process_s.append(time.perf_counter() - start)
+            results.append(json.loads(output.splitlines()[-1]))
+
+        report("process start to exit (startup script)", **summarize(process_s))
+        report("django.setup() & urlconf", **summarize([result["setup_s"] for result in results]))
+        report(
+            "eager registry build per app config (pre-change ready())", 
+            **summarize([result["eager_s"] for result in results])
+        )
+        report(
+            "fork to ready, lazy registry", 
+            **summarize([duration for result in results for duration in result["lazy"]])
+        )
+        report(
+            "fork to ready, registry warmed before fork", 
+            **summarize([duration for result in results for duration in result["warmed"]])
+        )
+
+
+# serve GET /api/question/ through Django's WSGI handler, so request_started &
+# request_finished close or keep the connection as in production (the test 
+# client skips that); prints requests per second & connections opened
+CONNECTION_SCRIPT = """
+import io, json, sys, time
+import django
+django.setup()
+from apps.organizations.models import Organization
+from apps.questions.models import Question
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management import call_command
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+call_command("migrate", verbosity=0)
+if not Question.objects.exists():
+    organization = Organization.objects.create(name="Org")
+    Question.objects.bulk_create([
+        Question(text=f"Question {i}?", organization=organization) for i in range(20)
+    ])
+connection.close()
+
+opened = []
+connection_created.connect(lambda **kwargs: opened.append(None), weak=False)
+handler = WSGIHandler()
+
+def get(path):
+    response = handler({
+        "REQUEST_METHOD": "GET", 
+        "PATH_INFO": path, 
+        "QUERY_STRING": "", 
+        "SERVER_NAME": "localhost", 
+        "SERVER_PORT": "80", 
+        "HTTP_HOST": "localhost", 
+        "HTTP_ACCEPT": "application/json", 
+        "wsgi.input": io.BytesIO(), 
+        "wsgi.errors": sys.stderr, 
+        "wsgi.url_scheme": "http", 
+    }, lambda status, headers: None)
+    b"".join(response)
+    response.close()
+
+get("/api/question/")
+opened.clear()
+requests = int(sys.argv[1])
+start = time.perf_counter()
+for _ in range(requests):
+    get("/api/question/")
+print(json.dumps({"rps": requests / (time.perf_counter() - start), "connections": len(opened)}))
+"""
+
+
+# requests per second with a new connection per request (CONN_MAX_AGE=0, the
+# previous behaviour), persistent connections & the optional MySQL pool; 
+# against the test database, or a migrated temporary file for SQLite, 
+# whose in-memory test database can't be shared with another process
+@tag("benchmark")
+class ConnectionBenchmark(TransactionTestCase):
+    requests = 500
+    runs = 3
+
+    def test_requests_per_second(self):
+        modes = [
+            ("new connection per request (CONN_MAX_AGE=0)", {"DB_CONN_MAX_AGE": "0"}),
+            ("persistent connections (CONN_MAX_AGE=60)", {"DB_CONN_MAX_AGE": "60"}),
+        ]
+        if connection.vendor == "mysql" and importlib.util.find_spec("dj_db_conn_pool"):
+            modes.append(("pooled (DB_POOL_SIZE=10)", {"DB_POOL_SIZE": "10"}))
+        else:
+            report("pooled (DB_POOL_SIZE=10)", skipped="needs MySQL/MariaDB & django-db-connection-pool")
+
+        with tempfile.TemporaryDirectory() as directory:
+            db_name = (
+                os.path.join(directory, "benchmark.sqlite3") if connection.vendor == "sqlite" 
+                else connection.settings_dict["NAME"]
+            )
+            for label, env in modes:
+                results = [
+                    json.loads(subprocess.run(
+                        [sys.executable, "-c", CONNECTION_SCRIPT, str(self.requests)], 
+                        capture_output=True, 
+                        check=True, 
+                        text=True, 
+                        env={**os.environ, "DB_NAME": db_name, "DB_POOL_SIZE": "0", **env}
+                    ).stdout.splitlines()[-1])
+                    for _ in range(self.runs)
+                ]
+                report(
+                    f"GET /api/question/ x{self.requests}, {label}", 
+                    requests_per_s=round(statistics.median(result["rps"] for result in results)), 
+                    connections_opened=results[0]["connections"]
+                )
+
+
+# bytes on the wire & latency of a 500-row response page per negotiated coding
+@tag("benchmark")
+class CompressionBenchmark(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_responses(500)
+
+    def test_response_page_encodings(self):
+        for accept_encoding in ("identity", "gzip", "br"):
+            get = lambda: self.client.get(
+                "/api/response/?page_size=500", 
+                HTTP_ACCEPT_ENCODING=accept_encoding
+            )
+            response = get()
+            report(
+                f"response page (500 rows), Accept-Encoding: {accept_encoding}", 
+                encoding=response.get("Content-Encoding", "identity"), 
+                bytes=len(response.content), 
+                **summarize(measure(get, 50))
+            )
+
+
+# 10k Response & Question rows: serializer instances vs values() rows 
+# (BaseModelViewSet.list_rows), each rendered by JSONRenderer & FastJSONRenderer
+@tag("benchmark")
+class RenderBenchmark(APITestCase):
+    rows = 10000
+
+    @classmethod
+    def setUpTestData(cls):
+        event, question, event_attendee = seed_responses(cls.rows)
+        Question.objects.bulk_create([
+            Question(text=f"Question {i}: what did you take away?", organization_id=question.organization_id)
+            for i in range(cls.rows - 1)
+        ], batch_size=1000)
+
+    def test_render_10k_rows(self):
+        if orjson is None:
+            self.skipTest("orjson not installed")
+        serializers_dict = get_serializers()
+        for app_name, model in (("responses", Response), ("questions", Question)):
+            serializer_class = serializers_dict[(app_name, model.__name__)]
+            queryset = model.objects.order_by("-created_at", "-id")[:self.rows]
+            serialized = serializer_class(queryset, many=True).data
+            values_rows = get_values_rows(model, serializer_class, queryset)
+            self.assertEqual(JSONRenderer().render(serialized), JSONRenderer().render(values_rows))
+            self.assertEqual(JSONRenderer().render(values_rows), FastJSONRenderer().render(values_rows))
+
+            for label, fn in (
+                ("serializer + JSONRenderer", lambda: JSONRenderer().render(
+                    serializer_class(queryset, many=True).data
+                )),
+                ("values rows + JSONRenderer", lambda: JSONRenderer().render(
+                    get_values_rows(model, serializer_class, queryset)
+                )),
+                ("values rows + FastJSONRenderer", lambda: FastJSONRenderer().render(
+                    get_values_rows(model, serializer_class, queryset)
+                )),
+                ("render only, JSONRenderer", lambda: JSONRenderer().render(values_rows)),
+                ("render only, FastJSONRenderer", lambda: FastJSONRenderer().render(values_rows)),
+            ):
+                report(f"{model.__name__} x{self.rows}, {label}", **summarize(measure(fn, 5)))
+
+
+# the rows list_rows renders, for the serializer's readable fields
+def get_values_rows(model, serializer_class, queryset):
+    columns = [
+        (field_name, value_name, get_request_converter(convert)) 
+        for field_name, value_name, convert in get_fast_columns(
+            model, serializer_class, tuple(get_readable_fields(serializer_class))
+        )
+    ]
+    return [
+        {
+            field_name: (
+                row[value_name] if convert is None or row[value_name] is None 
+                else convert(row[value_name])
+            )
+            for field_name, value_name, convert in columns
+        }
+        for row in queryset.values(*[value_name for _, value_name, _ in columns])
+    ]
@@ -0,0 +1,115 @@
+from . import lookups  # noqa: F401 registers the __search lookup
+from datetime import datetime, time
+from django.db import models
+from django.utils import dateparse, timezone
+from rest_framework import filters, serializers
+
+
+### FILTERING & SEARCH for the generated viewsets ###
+# query params derived from each model's fields, all applied in SQL:
+#   <fk>=1 or <fk>=1,2,3           by related ids (event, question, event_attendee, ...)
+#   <date field>_after/_before=... date/datetime ranges, inclusive (created_at_after=2024-01-01)
+#   <choice field>=value           e.g. attendee_type=participant, attendance_status=attended
+#   is_deleted=true|false          soft deleted rows (BaseModelViewSet widens the queryset)
+# unknown params are ignored, so pagination & other params pass through
+class FieldFilterBackend(filters.BaseFilterBackend):
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        for param, (lookup, parse) in get_filter_params(queryset.model).items():
+            if params.get(param, "") == "":
+                continue
+            try:
+                value = parse(params[param])
+            except (TypeError, ValueError):
+                raise serializers.ValidationError({param: f"Invalid value: {params[param]}"})
+            queryset = queryset.filter(**{lookup: value})
+        return queryset
+
+
+def parse_ids(value):
+    ids = [int(pk) for pk in value.split(",")]
+    if not ids:
+        raise ValueError(value)
+    return ids
+
+
+def parse_date(value):
+    parsed = dateparse.parse_date(value)
+    if parsed is None:
+        raise ValueError(value)
+    return parsed
+
+
+# datetimes, or dates meaning the start (_after) or end (_before) of that day
+def parse_datetime(value, day_time=time.min):
+    parsed = dateparse.parse_datetime(value)
+    if parsed is None:
+        parsed = datetime.combine(parse_date(value), day_time)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_datetime_end(value):
+    return parse_datetime(value, time.max)
+
+
+def parse_bool(value):
+    if value.lower() in ("true", "1"):
+        return True
+    if value.lower() in ("false", "0"):
+        return False
+    raise ValueError(value)
+
+
+# param -> (lookup, parser) for a model, built once per model
+filter_params_cache = {}
+
+
+def get_filter_params(model):
+    if model in filter_params_cache:
+        return filter_params_cache[model]
+
+    params = {}
+    for field in model._meta.get_fields():
+        # only concrete fields declared on the model (no reverse relations or m2m)
+        if not getattr(field, "concrete", False) or field.many_to_many:
+            continue
+        if field.many_to_one or field.one_to_one:
+            params[field.name] = (f"{field.attname}__in", parse_ids)
+        elif isinstance(field, models.DateTimeField):
+            params[f"{field.name}_after"] = (f"{field.name}__gte", parse_datetime)
+            params[f"{field.name}_before"] = (f"{field.name}__lte", parse_datetime_end)
+        elif isinstance(field, models.DateField):
+            params[f"{field.name}_after"] = (f"{field.name}__gte", parse_date)
+            params[f"{field.name}_before"] = (f"{field.name}__lte", parse_date)
+        elif isinstance(field, models.BooleanField):
+            params[field.name] = (field.name, parse_bool)
+        elif field.choices:
+            params[field.name] = (field.name, str)
+
+    filter_params_cache[model] = params
+    return params
+
+
+# ?search=words over the model's SEARCH_FIELDS, full-text indexed on MySQL/MariaDB
+class FullTextSearchBackend(filters.BaseFilterBackend):
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, "").strip()
+        search_fields = SEARCH_FIELDS.get(queryset.model.__name__)
+        if not terms or not search_fields:
+            return queryset
+
+        condition = models.Q()
+        for field in search_fields:
+            condition |= models.Q(**{f"{field}__search": terms})
+        return queryset.filter(condition)
+
+
+# searchable text columns per model; each needs a FULLTEXT index on MySQL/MariaDB
+SEARCH_FIELDS = {
+    "Response": ["text"],
+    "Question": ["text"],
+}
@@ -0,0 +1,27 @@
+from django.db import models
+
+
+# field__search="words": full-text MATCH ... AGAINST on MySQL/MariaDB, served by 
+# a FULLTEXT index on the column (see the responses & questions migrations);
+# other backends fall back to a case-insensitive substring match
+@models.CharField.register_lookup
+@models.TextField.register_lookup
+class Search(models.Lookup):
+    lookup_name = "search"
+
+    def as_mysql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return (
+            f"MATCH ({lhs}) AGAINST ({rhs} IN NATURAL LANGUAGE MODE)", 
+            [*lhs_params, *rhs_params]
+        )
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        rhs_params = [f"%{connection.ops.prep_for_like_query(param)}%" for param in rhs_params]
+        return (
+            f"{lhs} {connection.operators['icontains'] % rhs}", 
+            [*lhs_params, *rhs_params]
+        )
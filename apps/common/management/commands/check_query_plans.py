@@ -0,0 +1,103 @@
+from apps.attendees.models import EventAttendee, Participant
+from apps.demographics.models import Demographics
+from apps.questions.models import Question
+from apps.responses.models import Response
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+import json
+
+
+# the API & report filter patterns each index in documentation/index-audit.txt serves;
+# keep in step with that audit when adding endpoints or indexes
+HOT_QUERIES = [
+    (
+        "response by attendee & question",
+        lambda: Response.objects.filter(event_attendee_id=1, question_id=1),
+    ),
+    (
+        "responses per attendee for a question",
+        lambda: Response.objects.filter(question_id=1).values(
+            "event_attendee_id"
+        ).annotate(n=Count("id")),
+    ),
+    (
+        "event roster by type & status",
+        lambda: EventAttendee.objects.filter(
+            event_id=1, 
+            attendee_type="participant", 
+            attendance_status="attended"
+        ),
+    ),
+    (
+        "participant by organization & unique_id",
+        lambda: Participant.objects.filter(organization_id=1, unique_id="x"),
+    ),
+    (
+        "demographic answer by attendee",
+        lambda: Demographics.objects.filter(event_demographic_id=1, event_attendee_id=1),
+    ),
+    (
+        "demographic numeric range",
+        lambda: Demographics.objects.filter(
+            event_demographic_id=1, 
+            value_number__gte=18, 
+            value_number__lte=25
+        ),
+    ),
+    (
+        "questions by organization",
+        lambda: Question.objects.filter(organization_id=1),
+    ),
+]
+
+
+# full table scans in a query plan, per backend; None if the backend isn't supported
+def get_full_scans(queryset):
+    if connection.vendor == "sqlite":
+        plan = queryset.explain()
+        return [
+            line.strip() for line in plan.splitlines()
+            if "SCAN " in line and "CONSTANT ROW" not in line
+        ]
+    if connection.vendor == "mysql":
+        plan = json.loads(queryset.explain(format="JSON"))
+        return [
+            table["table_name"] for table in iter_plan_tables(plan)
+            if table.get("access_type") == "ALL"
+        ]
+    return None
+
+
+def iter_plan_tables(node):
+    if isinstance(node, dict):
+        if "access_type" in node:
+            yield node
+        for value in node.values():
+            yield from iter_plan_tables(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from iter_plan_tables(value)
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the hot API & report queries & fail if any plan does a full table scan; "
+        "run against a database with realistic data, as planners scan tiny tables"
+    )
+
+    def handle(self, *args, **options):
+        failures = []
+        for label, get_queryset in HOT_QUERIES:
+            full_scans = get_full_scans(get_queryset())
+            if full_scans is None:
+                raise CommandError(f"Query plans not supported on {connection.vendor}")
+            if full_scans:
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f"{label}: full scan {full_scans}"))
+            else:
+                self.stdout.write(f"{label}: ok")
+
+        if failures:
+            raise CommandError(f"{len(failures)} quer(ies) do a full table scan")
+        self.stdout.write(self.style.SUCCESS("No full table scans"))
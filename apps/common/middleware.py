@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional (pip install brotli); gzip only without it
+    brotli = None
+
+
+# codings the client accepts, honouring q=0 (e.g. "gzip, br;q=0" accepts gzip only)
+def get_accepted_encodings(request):
+    encodings = set()
+    for item in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        if coding:
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+# negotiated response compression: brotli when installed & accepted, else gzip
+# (Django's GZipMiddleware, incl. streamed exports); responses under 
+# COMPRESSION_MIN_SIZE bytes & live event streams are sent as is
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request, response):
+        # SSE must reach the client as each event is written, not when a block fills
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        accepted_encodings = get_accepted_encodings(request)
+        if (
+            brotli is not None 
+            and not response.streaming 
+            and not response.has_header("Content-Encoding")
+            and "br" in accepted_encodings
+        ):
+            patch_vary_headers(response, ("Accept-Encoding",))
+            compressed_content = brotli.compress(
+                response.content, 
+                quality=settings.BROTLI_QUALITY
+            )
+            # only if it's actually shorter
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+            # compressed bodies get weak ETags, as GZipMiddleware does
+            etag = response.get("ETag")
+            if etag and etag.startswith('"'):
+                response.headers["ETag"] = "W/" + etag
+            response.headers["Content-Encoding"] = "br"
+            return response
+
+        # GZipMiddleware only looks for "gzip" in the header, so would ignore q=0
+        if "gzip" not in accepted_encodings:
+            patch_vary_headers(response, ("Accept-Encoding",))
+            return response
+        return super().process_response(request, response)
@@ -1,8 +1,91 @@
-from django.db import models
+from .signals import post_restore, post_soft_delete
+from .utils import (
+    NUMBER_DECIMAL_PLACES, 
+    NUMBER_MAX_DIGITS, 
+    parse_typed_value
+)
+from collections import Counter
+from django.db import models, transaction
 from django.utils import timezone
+import copy
+
+
+# rows per UPDATE when soft deleting/restoring querysets
+SOFT_DELETE_BATCH_SIZE = 1000
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    # soft delete rows & cascade through each model's soft_delete_cascade,
+    # one UPDATE per batch; returns {model label: rows updated}
+    def soft_delete(self):
+        with transaction.atomic():
+            return dict(self._set_deleted(True, timezone.now(), Counter()))
+
+    # restore rows & the related rows soft deleted in the same cascade;
+    # call on all_with_deleted() as objects excludes deleted rows
+    def restore(self):
+        with transaction.atomic():
+            return dict(self._set_deleted(False, None, Counter()))
+
+    def _set_deleted(self, is_deleted, deleted_at, counts):
+        model = self.model
+        pending = self.filter(is_deleted=not is_deleted)
+        # restore children in reverse order, mirroring the delete
+        cascade = model.soft_delete_cascade if is_deleted else model.soft_delete_cascade[::-1]
+
+        # updated rows drop out of pending, so each pass takes the next batch
+        while batch := list(pending.values_list("pk", "deleted_at")[:SOFT_DELETE_BATCH_SIZE]):
+            pks = [pk for pk, _ in batch]
+            # update() skips auto_now, so bump last_modified (ETags) explicitly
+            counts[model._meta.label] += model._base_manager.filter(pk__in=pks).update(
+                is_deleted=is_deleted, 
+                deleted_at=deleted_at,
+                last_modified=timezone.now()
+            )
+            signal = post_soft_delete if is_deleted else post_restore
+            signal.send(sender=model, pks=pks)
+
+            for relation_name in cascade:
+                relation = model._meta.get_field(relation_name)
+                related = relation.related_model.objects.all_with_deleted().filter(
+                    **{f"{relation.field.name}__in": pks}
+                )
+                # only restore children deleted along with this parent
+                if not is_deleted:
+                    related = related.filter(
+                        deleted_at__in={parent_deleted_at for _, parent_deleted_at in batch}
+                    )
+                related._set_deleted(is_deleted, deleted_at, counts)
+
+        return counts
+
+
+# default manager for BaseModel: excludes soft deleted records;
+# also used by reverse FK & m2m related managers (event.event_attendees etc.)
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    include_deleted = False
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.include_deleted:
+            return queryset
+        return queryset.filter(is_deleted=False)
+
+    # escape hatch including soft deleted records; 
+    # copy keeps related manager filters (event.event_attendees.all_with_deleted())
+    def all_with_deleted(self):
+        manager = copy.copy(self)
+        manager.include_deleted = True
+        return manager.get_queryset()
 
 
 class BaseModel(models.Model):
+    # soft deleted records excluded by default; see all_with_deleted()
+    objects = SoftDeleteManager()
+
+    # reverse relation names soft deleted/restored with this model's querysets
+    soft_delete_cascade = ()
+
     # timestamp
     created_at = models.DateTimeField(auto_now_add=True)
     last_modified = models.DateTimeField(auto_now=True)
@@ -32,11 +115,10 @@ class BaseModel(models.Model):
             "and keep the record in the database."
         )
     
-    # filter soft deleted records
-    # TODO: work out querying with relationships
+    # filter soft deleted records; kept for callers predating SoftDeleteManager
     @classmethod
     def active_records(cls):
-        return cls.objects.filter(is_deleted=False)
+        return cls.objects.all()
 
     def __str__(self):
         # return generic message as default
@@ -74,10 +156,34 @@ class AttendeeInfoModel(models.Model):
         field_name = models.CharField(max_length=100)
         field_type = models.CharField(max_length=10, choices=CUSTOM_FIELD_TYPES)
         value=models.TextField()
+        # typed copies of value per field_type, set on save for indexed range filters
+        value_number = models.DecimalField(
+            max_digits=NUMBER_MAX_DIGITS, 
+            decimal_places=NUMBER_DECIMAL_PLACES, 
+            null=True, 
+            blank=True
+        )
+        value_date = models.DateField(null=True, blank=True)
+
+        def save(self, *args, **kwargs):
+            value = parse_typed_value(self.field_type, self.value)
+            self.value_number = value if self.field_type == "number" else None
+            self.value_date = value if self.field_type == "date" else None
+            super().save(*args, **kwargs)
 
         class Meta:
             abstract = True
             unique_together = ("attendee", "field_name")
+            indexes = [
+                models.Index(
+                    fields=["field_name", "value_number"], 
+                    name="%(app_label)s_%(class)s_num_idx"
+                ),
+                models.Index(
+                    fields=["field_name", "value_date"], 
+                    name="%(app_label)s_%(class)s_date_idx"
+                ),
+            ]
 
     # allows coordinators to provide choices in custom fields
     class CustomFieldChoice(models.Model):
@@ -0,0 +1,12 @@
+from rest_framework import pagination
+
+
+# keyset (cursor) pagination, newest first: each page filters from the 
+# created_at of the last row seen, so deep pages cost the same as page one;
+# DRF keys the cursor on created_at alone: rows sharing the boundary timestamp 
+# are skipped with an offset, & id keeps their order stable from page to page
+# kept out of utils: DRF imports the default pagination class while loading generics
+class KeysetPagination(pagination.CursorPagination):
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -0,0 +1,70 @@
+from collections import defaultdict
+from django.conf import settings
+from django.utils.module_loading import import_string
+from functools import cache
+import asyncio
+import threading
+
+
+### PUB/SUB ###
+# fan-out for realtime streams; swap the backend with settings.PUBSUB_BACKEND
+# (e.g. a redis-backed class) as long as it provides publish() & subscribe()
+@cache
+def get_pubsub():
+    return import_string(settings.PUBSUB_BACKEND)()
+
+
+# single-process broker: publishers may run in any thread (sync views, signals),
+# subscribers are asyncio queues on the event loop that created them
+class InProcessPubSub:
+    # messages held per subscriber before a slow consumer starts dropping them
+    max_queue_size = 1000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = defaultdict(set)
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscriptions = list(self.subscribers.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.loop.call_soon_threadsafe(subscription.put, message)
+
+    # must be called from within a running event loop
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel)
+        with self.lock:
+            self.subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscribers.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self.subscribers[subscription.channel]
+
+
+class Subscription:
+    def __init__(self, pubsub, channel):
+        self.pubsub = pubsub
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=pubsub.max_queue_size)
+
+    def put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            pass
+
+    # next message, or None if nothing arrives within timeout seconds
+    async def get(self, timeout=None):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.pubsub.unsubscribe(self)
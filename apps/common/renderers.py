@@ -0,0 +1,43 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used without it
+    orjson = None
+
+
+# JSONRenderer output, encoded with orjson when it's installed; byte-compatible
+# for payloads without floats: datetimes & other non-native types go through 
+# DRF's encoder (default=), & U+2028/U+2029 are escaped as DRF does; indented 
+# (browsable/?indent) or ASCII-only output, & anything orjson rejects, fall back 
+# to the stdlib
+# floats differ (orjson writes 1e16 for 1e+16 & NaN as null where STRICT_JSON 
+# raises), so it's only used by viewsets of models without float or decimal
+# columns (see generate_viewsets); payloads aren't scanned, as that costs more 
+# than orjson saves
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None 
+            or data is None
+            or self.ensure_ascii 
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, 
+                default=self.encoder_class().default, 
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return ret.replace(
+            "\u2028".encode(), b"\\u2028"
+        ).replace(
+            "\u2029".encode(), b"\\u2029"
+        )
+
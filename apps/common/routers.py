@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import connections
+
+
+### READ REPLICA ROUTING ###
+# alias of the replica in settings.DATABASES; routing is a no-op without it
+REPLICA_DB = "replica"
+PRIMARY_DB = "default"
+
+# cookie set after a write so the client's next reads stay on the primary
+# until the replica has caught up (settings.REPLICA_STICKY_SECONDS)
+STICKY_PRIMARY_COOKIE = "use_primary"
+
+# whether reads in the current request/task may go to the replica;
+# off by default, so only code inside replica_reads() is ever routed there
+replica_reads_allowed = ContextVar("replica_reads_allowed", default=False)
+
+
+def has_replica():
+    return REPLICA_DB in settings.DATABASES
+
+
+# route reads inside the block to the replica, unless the request
+# recently wrote (sticky cookie); request may be None outside requests
+@contextmanager
+def replica_reads(request=None):
+    allowed = has_replica() and not (
+        request is not None and STICKY_PRIMARY_COOKIE in request.COOKIES
+    )
+    token = replica_reads_allowed.set(allowed)
+    try:
+        yield
+    finally:
+        replica_reads_allowed.reset(token)
+
+
+# stream an iterator (e.g. a StreamingHttpResponse body) with replica reads;
+# the body is consumed after the view returns, outside the view's block
+def iter_replica_reads(request, iterator):
+    with replica_reads(request):
+        yield from iterator
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        # reads inside a transaction see its uncommitted writes on the primary only
+        if replica_reads_allowed.get() and not connections[PRIMARY_DB].in_atomic_block:
+            return REPLICA_DB
+        return PRIMARY_DB
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DB
+
+    # replica holds the same data, so relations between the two are fine
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    # schema is replicated from the primary
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DB
+
+
+# after a successful write, pin the client's reads to the primary for a short window
+class StickyPrimaryMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            has_replica()
+            and request.method not in ("GET", "HEAD", "OPTIONS")
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                STICKY_PRIMARY_COOKIE, 
+                "1", 
+                max_age=settings.REPLICA_STICKY_SECONDS, 
+                httponly=True, 
+                samesite="Lax"
+            )
+        return response
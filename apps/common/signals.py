@@ -0,0 +1,43 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import Signal
+from django.utils import timezone
+
+
+# bulk queryset writes skip per-instance save signals; 
+# send these instead so listeners (e.g. reports counters) stay in sync
+# args: sender (model class), instances
+post_bulk_create = Signal()
+
+# queryset soft_delete()/restore() update in batches without calling save()
+# args: sender (model class), pks
+post_soft_delete = Signal()
+post_restore = Signal()
+
+
+# m2m changes don't save the rows serializing the field, so bump their
+# last_modified (ETags) on either side's add/remove/clear; 
+# connected for every BaseModel m2m field in BaseModelConfig.ready()
+def connect_m2m_last_modified(field):
+    model = field.model
+
+    def m2m_last_modified(sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in ("post_add", "post_remove", "pre_clear"):
+            return
+        if not reverse:
+            pks = [instance.pk]
+        elif action == "pre_clear":
+            # reverse clear (e.g. organization.events.clear()) has no pk_set
+            pks = list(model._base_manager.filter(**{field.name: instance}).values_list(
+                "pk", 
+                flat=True
+            ))
+        else:
+            pks = pk_set or []
+        model._base_manager.filter(pk__in=pks).update(last_modified=timezone.now())
+
+    m2m_changed.connect(
+        m2m_last_modified, 
+        sender=field.remote_field.through, 
+        weak=False, 
+        dispatch_uid=f"m2m_last_modified:{model._meta.label}.{field.name}"
+    )
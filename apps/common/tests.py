@@ -0,0 +1,484 @@
+from apps.attendees.models import EventAttendee, Facilitator, Participant
+from apps.common.apps import BaseModelConfig
+from apps.common.management.commands.check_query_plans import HOT_QUERIES, get_full_scans
+from apps.common.middleware import CompressionMiddleware, brotli
+from apps.common.renderers import FastJSONRenderer
+from apps.common.routers import (
+    PRIMARY_DB, 
+    REPLICA_DB, 
+    STICKY_PRIMARY_COOKIE, 
+    PrimaryReplicaRouter, 
+    has_replica, 
+    replica_reads
+)
+from apps.common.utils import get_serializers, get_viewsets
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from apps.questions.models import Question
+from apps.responses.models import Response
+from django.apps import apps
+from django.db import connection, connections, transaction
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from django.test.utils import CaptureQueriesContext
+from obwob.urls import router
+from rest_framework.test import APITestCase, APITransactionTestCase
+import datetime
+import uuid
+
+
+EVENTS = 30
+
+
+# a fixed number of related rows behind every list row, so N+1 queries show
+def seed_events():
+    organizations = [Organization.objects.create(name=f"Org {i}") for i in range(2)]
+    questions = [
+        Question.objects.create(text=f"Question {i}?", organization=organizations[0]) 
+        for i in range(2)
+    ]
+    for i in range(EVENTS):
+        event = Event.objects.create(name=f"Event {i}", date=datetime.date.today())
+        event.organizations.add(*organizations)
+        event.questions.add(*questions)
+        event_attendees = [
+            EventAttendee.objects.create(
+                event=event, 
+                participant=Participant.objects.create(
+                    organization=organizations[0], 
+                    unique_id=f"p-{i}"
+                )
+            ),
+            EventAttendee.objects.create(
+                event=event, 
+                attendee_type="facilitator", 
+                facilitator=Facilitator.objects.create(
+                    organization=organizations[1], 
+                    unique_id=f"f-{i}"
+                )
+            ),
+        ]
+        for event_attendee in event_attendees:
+            event_attendee.organizations.add(*organizations)
+            for question in questions:
+                Response.objects.create(
+                    text="Answer", 
+                    event_attendee=event_attendee, 
+                    question=question
+                )
+
+
+# generated list endpoints run a fixed number of queries whatever the page size
+# every app config & the api router share one registry, built once per process
+class RegistryTests(SimpleTestCase):
+    def test_built_once_per_process(self):
+        # by now every app is ready & the urls are loaded
+        self.assertEqual(get_serializers.cache_info().misses, 1)
+        self.assertEqual(get_viewsets.cache_info().misses, 1)
+
+        app_configs = [
+            app_config for app_config in apps.get_app_configs() 
+            if isinstance(app_config, BaseModelConfig)
+        ]
+        self.assertGreater(len(app_configs), 1)
+        for app_config in app_configs:
+            self.assertIs(app_config.serializers_dict, get_serializers())
+            self.assertIs(app_config.viewsets_dict, get_viewsets())
+        self.assertEqual(
+            {viewset for _, viewset, _ in router.registry}, 
+            set(get_viewsets().values())
+        )
+
+        # each serializer is built on first lookup, then reused
+        serializers_dict = get_serializers()
+        self.assertIs(
+            serializers_dict[("questions", "Question")], 
+            serializers_dict[("questions", "Question")]
+        )
+
+
+class ListQueryCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_events()
+
+    def assertListQueries(self, url, num, query=""):
+        for page_size in (5, 25):
+            with self.assertNumQueries(num):
+                response = self.client.get(f"{url}?page_size={page_size}{query}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()["results"]), page_size)
+
+    def test_event_attendee_list(self):
+        self.assertListQueries("/api/eventattendee/", 1)
+
+    # every field, m2m organizations included
+    def test_event_attendee_full_list(self):
+        self.assertListQueries(
+            "/api/eventattendee/", 
+            2, 
+            "&fields=event,organizations,attendee_type,participant,facilitator,custom_attendee_type"
+        )
+
+    def test_response_list(self):
+        self.assertListQueries("/api/response/", 1)
+
+    def test_event_list(self):
+        self.assertListQueries("/api/event/", 4)
+
+
+# ?<field>= filters derived from model fields, applied in SQL
+class FieldFilterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_events()
+        cls.question = Question.objects.order_by("id").first()
+
+    def get_results(self, url, **params):
+        response = self.client.get(url, {"page_size": 100, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()["results"]
+
+    def test_allowed_filters(self):
+        results = self.get_results("/api/response/", question=self.question.pk)
+        self.assertEqual(len(results), EVENTS * 2)
+        self.assertEqual({result["question"] for result in results}, {self.question.pk})
+
+        event_attendee_ids = list(EventAttendee.objects.order_by("id").values_list("id", flat=True)[:3])
+        results = self.get_results(
+            "/api/response/", 
+            event_attendee=",".join(str(pk) for pk in event_attendee_ids)
+        )
+        self.assertEqual({result["event_attendee"] for result in results}, set(event_attendee_ids))
+
+        results = self.get_results("/api/eventattendee/", attendee_type="facilitator")
+        self.assertEqual(len(results), EVENTS)
+        self.assertEqual({result["attendee_type"] for result in results}, {"facilitator"})
+
+        tomorrow = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+        self.assertEqual(self.get_results("/api/question/", created_at_after=tomorrow), [])
+        self.assertEqual(len(self.get_results("/api/question/", created_at_before=tomorrow)), 2)
+
+    def test_soft_deleted_filter(self):
+        self.question.delete_record()
+        self.assertEqual(len(self.get_results("/api/question/")), 1)
+        results = self.get_results("/api/question/", is_deleted="true")
+        self.assertEqual([result["id"] for result in results], [self.question.pk])
+
+    def test_search(self):
+        results = self.get_results("/api/question/", search="question 1")
+        self.assertEqual([result["text"] for result in results], ["Question 1?"])
+
+    # only fields with a derived filter count; others pass through untouched
+    def test_disallowed_filters_ignored(self):
+        self.assertEqual(len(self.get_results("/api/question/", text="nothing like it")), 2)
+        self.assertEqual(
+            len(self.get_results("/api/eventattendee/", organizations=0)), 
+            len(self.get_results("/api/eventattendee/"))
+        )
+
+    def test_bad_values_rejected(self):
+        for url, params in (
+            ("/api/response/", {"question": "abc"}), 
+            ("/api/response/", {"event_attendee": "1,,2"}), 
+            ("/api/question/", {"created_at_after": "yesterday"}), 
+            ("/api/question/", {"is_deleted": "maybe"}),
+        ):
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertEqual(list(response.json()), list(params))
+
+
+# ?fields= & ?omit= trim the rendered fields & the columns loaded for them
+class SparseFieldsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_events()
+
+    # rendered rows & the SQL of the list query on the model's table
+    def get_list(self, url, table, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        select, = [
+            query["sql"] for query in queries.captured_queries 
+            if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+        ]
+        return response.json()["results"], select
+
+    # serializer path: the queryset is narrowed with only()
+    def test_fields_trim_queryset(self):
+        results, select = self.get_list(
+            "/api/eventattendee/", 
+            "attendees_eventattendee", 
+            fields="attendee_type,participant"
+        )
+        self.assertEqual(set(results[0]), {"attendee_type", "participant"})
+        self.assertIn('"attendees_eventattendee"."participant_id"', select)
+        for column in ("registration_time", "attendance_status", "facilitator_id", "event_id"):
+            self.assertNotIn(f'"attendees_eventattendee"."{column}"', select)
+
+    # FAST_LIST_MODELS: values() selects only the requested columns & 
+    # renders them as the serializer would
+    def test_fields_on_values_path(self):
+        results, select = self.get_list(
+            "/api/response/", 
+            "responses_response", 
+            fields="id,text,created_at"
+        )
+        self.assertEqual(set(results[0]), {"id", "text", "created_at"})
+        for column in ("event_attendee_id", "question_id", "idempotency_key", "last_modified"):
+            self.assertNotIn(f'"responses_response"."{column}"', select)
+
+        retrieved = self.client.get(
+            f"/api/response/{results[0]['id']}/", 
+            {"fields": "id,text,created_at"}
+        ).json()
+        self.assertEqual(results[0], retrieved)
+
+    def test_omit_on_values_path(self):
+        results, select = self.get_list("/api/response/", "responses_response", omit="text")
+        self.assertEqual(set(results[0]), {"id", "event_attendee", "question", "created_at"})
+        self.assertNotIn('"responses_response"."text"', select)
+
+    def test_unknown_fields_rejected(self):
+        for params in ({"fields": "id,nope"}, {"omit": "nope"}):
+            response = self.client.get("/api/response/", params)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("fields", response.json())
+
+
+# a 304 only while nothing the representation shows has changed, m2m included
+class ConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organizations = [Organization.objects.create(name=f"Org {i}") for i in range(2)]
+        cls.question = Question.objects.create(text="Question?", organization=cls.organizations[0])
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(cls.organizations[0])
+        cls.event_attendee = EventAttendee.objects.create(
+            event=cls.event, 
+            participant=Participant.objects.create(organization=cls.organizations[0])
+        )
+        cls.event_attendee.organizations.add(cls.organizations[0])
+
+    # asserts a 304 for the current ETag, then a 200 with a new one after change()
+    def assertChangeRevalidates(self, url, change):
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        change()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve(self):
+        url = f"/api/event/{self.event.pk}/"
+        self.assertChangeRevalidates(url, lambda: Event.objects.filter(pk=self.event.pk).get().save())
+        self.assertChangeRevalidates(url, lambda: self.event.questions.add(self.question))
+        self.assertChangeRevalidates(url, lambda: self.question.events.remove(self.event))
+
+    # every serialized m2m bumps last_modified, from either side
+    def test_retrieve_after_m2m_change(self):
+        url = f"/api/eventattendee/{self.event_attendee.pk}/"
+        self.assertChangeRevalidates(
+            url, 
+            lambda: self.event_attendee.organizations.add(self.organizations[1])
+        )
+        self.assertChangeRevalidates(
+            url, 
+            lambda: self.organizations[1].event_attendees.remove(self.event_attendee)
+        )
+        self.assertChangeRevalidates(url, lambda: self.organizations[0].event_attendees.clear())
+
+    # list validators follow edits, additions & soft deletes in the list
+    def test_list(self):
+        url = "/api/question/"
+        self.assertChangeRevalidates(url, lambda: Question.objects.get().save())
+        self.assertChangeRevalidates(
+            url, 
+            lambda: Question.objects.create(text="Another?", organization=self.organizations[0])
+        )
+        self.assertChangeRevalidates(url, lambda: Question.objects.last().delete_record())
+
+    # the query string (e.g. ?fields=) is part of the representation
+    def test_query_string_in_etag(self):
+        url = f"/api/event/{self.event.pk}/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, {"fields": "name"}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+# query-plan regression over seeded data: the hot filters in check_query_plans
+# (documentation/index-audit.txt) must be served by an index, never a full scan
+# not ANALYZEd: with statistics for this few rows the planner rightly prefers 
+# scans, so plans here show which indexes exist for each filter
+class QueryPlanTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_events()
+
+    def test_hot_queries_use_indexes(self):
+        for label, get_queryset in HOT_QUERIES:
+            with self.subTest(label):
+                full_scans = get_full_scans(get_queryset())
+                if full_scans is None:
+                    self.skipTest(f"Query plans not supported on {connection.vendor}")
+                self.assertEqual(full_scans, [])
+
+
+# FastJSONRenderer renders exactly what DRF's JSONRenderer does for float-free
+# payloads, orjson or not, & is only used where no float can be rendered
+class FastJSONRendererTests(SimpleTestCase):
+    def test_same_bytes(self):
+        payloads = [
+            {"results": [{"id": 1, "text": "caf\u00e9 \u2028", "ok": True, "none": None}]},
+            {"created_at": datetime.datetime(2026, 1, 2, 3, 4, 5, 678000), "id": uuid.uuid4()},
+            {2: "int key", "nested": {"ids": [1, 2, 3]}},
+            [],
+        ]
+        for data in payloads:
+            with self.subTest(data=data):
+                self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_only_float_free_fast_list_models(self):
+        viewsets = get_viewsets()
+        for model_name in ("Response", "Question"):
+            self.assertIn(FastJSONRenderer, viewsets[model_name].renderer_classes)
+        for model_name in ("Event", "Demographics", "CustomFieldValue"):
+            if model_name in viewsets:
+                self.assertNotIn(FastJSONRenderer, viewsets[model_name].renderer_classes)
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200)
+class CompressionMiddlewareTests(SimpleTestCase):
+    body = b'{"text": "answer"}' * 50
+
+    def compress(self, accept_encoding, response=None):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        if response is None:
+            response = HttpResponse(self.body, content_type="application/json")
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_below_min_size_sent_as_is(self):
+        response = self.compress("gzip", HttpResponse(b"x" * 199))
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_gzip(self):
+        response = self.compress("gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertLess(len(response.content), len(self.body))
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_brotli_preferred(self):
+        if brotli is None:
+            self.skipTest("brotli not installed")
+        response = self.compress("gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), self.body)
+
+    def test_q_zero_refuses_coding(self):
+        self.assertFalse(self.compress("gzip;q=0, br;q=0").has_header("Content-Encoding"))
+        self.assertEqual(self.compress("br;q=0, gzip")["Content-Encoding"], "gzip")
+
+    def test_event_stream_passed_through(self):
+        stream = StreamingHttpResponse(iter([b"data: 1\n\n"]), content_type="text/event-stream")
+        response = self.compress("gzip, br", stream)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(b"".join(response.streaming_content), b"data: 1\n\n")
+
+    def test_already_encoded_left_alone(self):
+        encoded = HttpResponse(self.body, content_type="application/json")
+        encoded["Content-Encoding"] = "identity"
+        response = self.compress("gzip, br", encoded)
+        self.assertEqual(response["Content-Encoding"], "identity")
+        self.assertEqual(response.content, self.body)
+
+    # compressed bytes differ from the original, so strong validators become weak
+    def test_etag_weakened(self):
+        for accept_encoding in ("gzip", "br"):
+            if accept_encoding == "br" and brotli is None:
+                continue
+            with self.subTest(accept_encoding):
+                tagged = HttpResponse(self.body, content_type="application/json")
+                tagged["ETag"] = '"abc"'
+                response = self.compress(accept_encoding, tagged)
+                self.assertEqual(response["ETag"], 'W/"abc"')
+
+
+# run with DB_REPLICA_NAME set: the replica alias is a TEST MIRROR of the primary,
+# so both see the same test database through separate connections; 
+# transactional, as the mirror can't see rows a TestCase leaves uncommitted
+class ReplicaRoutingTests(APITransactionTestCase):
+    databases = {PRIMARY_DB, REPLICA_DB} if has_replica() else {PRIMARY_DB}
+
+    def setUp(self):
+        if not has_replica():
+            self.skipTest("no replica configured (set DB_REPLICA_NAME)")
+        self.organization = Organization.objects.create(name="Org")
+        Question.objects.create(text="Question?", organization=self.organization)
+
+    # SELECTs run on each connection while fn runs
+    def get_reads(self, fn):
+        with CaptureQueriesContext(connections[PRIMARY_DB]) as primary, \
+                CaptureQueriesContext(connections[REPLICA_DB]) as replica:
+            fn()
+        return [
+            [query for query in queries if query["sql"].startswith("SELECT")] 
+            for queries in (primary, replica)
+        ]
+
+    def test_reads_go_to_replica(self):
+        primary, replica = self.get_reads(lambda: self.assertEqual(
+            len(self.client.get("/api/question/").json()["results"]), 
+            1
+        ))
+        self.assertFalse(primary)
+        self.assertTrue(replica)
+
+    # reads inside a transaction must see its own writes
+    def test_primary_inside_atomic(self):
+        def read_in_atomic():
+            with transaction.atomic(), replica_reads():
+                Question.objects.create(text="Another?", organization=self.organization)
+                self.assertEqual(Question.objects.count(), 2)
+
+        primary, replica = self.get_reads(read_in_atomic)
+        self.assertTrue(primary)
+        self.assertFalse(replica)
+
+    # a write pins the client's following reads to the primary
+    def test_sticky_cookie_after_write(self):
+        response = self.client.post(
+            "/api/question/", 
+            {"text": "Another?", "organization": self.organization.pk}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertIn(STICKY_PRIMARY_COOKIE, response.cookies)
+
+        primary, replica = self.get_reads(lambda: self.client.get("/api/question/"))
+        self.assertTrue(primary)
+        self.assertFalse(replica)
+
+
+# without a replica alias every read stays on the primary & no cookie is set
+class ReplicaFallbackTests(APITestCase):
+    def setUp(self):
+        if has_replica():
+            self.skipTest("replica configured (unset DB_REPLICA_NAME)")
+
+    def test_reads_stay_on_primary(self):
+        with replica_reads():
+            self.assertEqual(PrimaryReplicaRouter().db_for_read(Question), PRIMARY_DB)
+
+        organization = Organization.objects.create(name="Org")
+        response = self.client.post(
+            "/api/question/", 
+            {"text": "Question?", "organization": organization.pk}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn(STICKY_PRIMARY_COOKIE, response.cookies)
+        self.assertEqual(len(self.client.get("/api/question/").json()["results"]), 1)
+
@@ -1,15 +1,62 @@
+from datetime import date
+from decimal import Decimal, InvalidOperation
 from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, DecimalField, FloatField, Max
 from django.shortcuts import render
-from rest_framework import serializers, viewsets
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from functools import cache
+from .filters import FieldFilterBackend, FullTextSearchBackend
+from .pagination import KeysetPagination
+from .renderers import FastJSONRenderer
+from .routers import replica_reads
+from rest_framework import ISO_8601, parsers, serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+import codecs
+import csv
+import hashlib
+import time
 import uuid
 
 
 ### SHARED FUNCTIONS ###
+# process-local cache of the default event id: {"id": ..., "expires": ...}
+# cleared by events.signals on Event save/soft delete; expiry covers other workers
+default_event_cache = {}
+
+
 # default event = General Feedback
+# returns the event id (FK defaults take the pk, not an instance);
+# settings.DEFAULT_EVENT_ID skips the lookup altogether
 def get_default_event():
+    if settings.DEFAULT_EVENT_ID is not None:
+        return settings.DEFAULT_EVENT_ID
+
+    cached = default_event_cache.get("id")
+    if cached is not None and time.monotonic() < default_event_cache["expires"]:
+        return cached
+
     # dynamically retrieve Event model to avoid AppRegistryNotReady error
     Event = get_model("events", "Event")
-    return Event.objects.first() if Event.objects.exists() else None
+    event_id = Event.objects.order_by("pk").values_list("pk", flat=True).first()
+
+    # don't cache a missing event so the first one created is picked up
+    if event_id is not None:
+        default_event_cache["id"] = event_id
+        default_event_cache["expires"] = (
+            time.monotonic() + settings.DEFAULT_EVENT_CACHE_TIMEOUT
+        )
+    return event_id
+
+
+def clear_default_event_cache():
+    default_event_cache.clear()
 
 
 # encapsulated views.py functionality with exception rendering custom error page
@@ -39,6 +86,60 @@ def get_object_or_error(
         })
     
 
+### TYPED VALUES ###
+# typed copies of free-text values (Demographics, CustomFieldValue), 
+# kept here so both the base models & the demographics app can use them
+# precision of the value_number columns
+NUMBER_MAX_DIGITS = 20
+NUMBER_DECIMAL_PLACES = 6
+
+
+# parse a stored string value according to its field_type;
+# returns None when the value doesn't parse (e.g. "n/a" for a number) 
+# or a number doesn't fit value_number, so the text is still stored untyped
+def parse_typed_value(field_type, value):
+    if value is None:
+        return None
+    value = str(value).strip()
+    if field_type == "number":
+        try:
+            number = Decimal(value)
+        except InvalidOperation:
+            return None
+        limit = 10 ** (NUMBER_MAX_DIGITS - NUMBER_DECIMAL_PLACES)
+        if not number.is_finite() or abs(number) >= limit:
+            return None
+        # rounded as the column stores it, so filters compare like for like;
+        # rounding can carry up to the limit (99.9999999 -> 100.000000)
+        number = number.quantize(Decimal(1).scaleb(-NUMBER_DECIMAL_PLACES))
+        return number if abs(number) < limit else None
+    if field_type == "date":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
+
+
+# parse text/csv request bodies into a list of dicts keyed by the header row;
+# rows are decoded as they're read rather than loading the whole body as a string
+class CSVParser(parsers.BaseParser):
+    media_type = "text/csv"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        try:
+            reader = csv.DictReader(codecs.iterdecode(stream, encoding))
+            # drop empty cells so optional columns fall back to defaults
+            return [
+                {key: value for key, value in row.items() if key and value}
+                for row in reader
+            ]
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise parsers.ParseError(f"CSV parse error - {e}")
+
+
 ### MODELS/CUSTOM LISTS & FUNCTIONS for API layer automation of serializers, viewsets & URL registrations
 MODELS_LIST = [
     # "app_name", model_name
@@ -49,6 +150,7 @@ MODELS_LIST = [
     # TODO insert authontication model
     ("coordinators", "Coordinator"),
     ("demographics", "DemographicCategory"),
+    ("demographics", "DemographicChoice"),
     ("demographics", "EventDemographic"),
     ("demographics", "Demographics"),
     ("organizations", "Organization"),
@@ -61,8 +163,70 @@ MODELS_LIST = [
 CUSTOM_SERIALIZER_MODELS = [
     "Event",
     "EventAttendee",
+    "Demographics",
 ]
 
+# per-model max page size (?page_size=) for list endpoints;
+# others use KeysetPagination.max_page_size
+PAGE_SIZE_LIMITS = {
+    "Response": 500,
+    "EventAttendee": 500,
+    "Demographics": 500,
+}
+
+# per-model Cache-Control for GET responses of read-mostly models, as 
+# patch_cache_control kwargs; clients revalidate with ETag/Last-Modified after max_age
+CACHE_CONTROL_POLICIES = {
+    "Event": {"private": True, "max_age": 30},
+    "Question": {"private": True, "max_age": 60},
+    "Organization": {"private": True, "max_age": 300},
+    "DemographicCategory": {"private": True, "max_age": 300},
+}
+
+# slim default fields for list responses, per model; retrieve & unlisted
+# models render every field; ?fields= & ?omit= override both
+LIST_FIELDS = {
+    "Response": ["id", "text", "event_attendee", "question", "created_at"],
+    "Question": ["id", "text", "organization"],
+    "EventAttendee": [
+        "event", 
+        "attendee_type", 
+        "participant", 
+        "facilitator", 
+        "custom_attendee_type"
+    ],
+    "Participant": ["id", "unique_id", "first_name", "last_name", "emoji", "organization"],
+    "Facilitator": ["id", "unique_id", "first_name", "last_name", "organization"],
+    "Demographics": ["id", "event_demographic", "event_attendee", "value"],
+}
+
+# hottest list endpoints, rendered from values() rows instead of serializer
+# instances (BaseModelViewSet.list_rows); output is identical to the serializer's
+FAST_LIST_MODELS = ["Response", "Question"]
+
+# serializer fields whose representation of a db value is the value itself
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+)
+
+# per-model override of the relations detected by get_queryset_relations;
+# "model_name": {"select_related": [...], "prefetch_related": [...]}
+QUERYSET_RELATIONS = {}
+
+
+# pagination class with the model's page size limit
+def get_pagination_class(model_name):
+    if model_name not in PAGE_SIZE_LIMITS:
+        return KeysetPagination
+    return type(
+        f"{model_name}Pagination", 
+        (KeysetPagination,), 
+        {"max_page_size": PAGE_SIZE_LIMITS[model_name]}
+    )
+
 
 # dynamically import models from specified app
 def get_model(app_name, model_name):
@@ -72,9 +236,411 @@ def get_model(app_name, model_name):
         raise ValueError(f"Model {model_name} in app {app_name} not found.")
 
 
+# point DRF's unique validators at all_with_deleted(): they're built from 
+# model._default_manager (SoftDeleteManager), but soft deleted rows still 
+# hold their unique slots in the db, so a clash must be a 400, not an IntegrityError
+def include_deleted_in_unique_validators(validators):
+    for validator in validators:
+        if isinstance(validator, (UniqueValidator, UniqueTogetherValidator)):
+            manager = validator.queryset.model._default_manager
+            if hasattr(manager, "all_with_deleted"):
+                validator.queryset = manager.all_with_deleted()
+    return validators
+
+
+# base of every generated & custom serializer: fields=[...] keeps only those 
+# fields (sparse fieldsets); names are validated by BaseModelViewSet
+class SparseFieldsSerializer(serializers.ModelSerializer):
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+    # field level unique=True validators
+    def build_standard_field(self, field_name, model_field):
+        field_class, field_kwargs = super().build_standard_field(field_name, model_field)
+        if "validators" in field_kwargs:
+            field_kwargs["validators"] = include_deleted_in_unique_validators(
+                list(field_kwargs["validators"])
+            )
+        return field_class, field_kwargs
+
+    # unique_together/UniqueConstraint validators
+    def get_validators(self):
+        return include_deleted_in_unique_validators(list(super().get_validators()))
+
+
+# readable field names of a serializer, in declaration order
+@cache
+def get_readable_fields(serializer_class):
+    return [
+        field_name for field_name, field in serializer_class().fields.items() 
+        if not field.write_only
+    ]
+
+
+### SHARED SERIALIZER & VIEWSET REGISTRY ###
+# built once per process & shared by common.apps BaseModelConfig, 
+# the api router in obwob.urls & EventCreateView;
+# use these rather than calling generate_serializers/generate_viewsets directly
+@cache
+def get_serializers():
+    return generate_serializers()
+
+
+@cache
+def get_viewsets():
+    return generate_viewsets(get_serializers())
+
+
+# dict of (app_name, model_name): serializer class; 
+# each model's serializer is only generated on first lookup
+class SerializerRegistry(dict):
+    def __missing__(self, key):
+        if key not in MODELS_LIST:
+            raise KeyError(key)
+        serializer_class = build_serializer(*key, self)
+        self[key] = serializer_class
+        return serializer_class
+
+    # dict.get bypasses __missing__, so route through __getitem__
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+# generated viewsets resolve their serializer from the registry on first request
+class BaseModelViewSet(viewsets.ModelViewSet):
+    # (app_name, model_name) key into serializers_dict
+    registry_key = None
+    serializers_dict = None
+
+    def get_serializer_class(self):
+        if self.serializer_class is not None:
+            return self.serializer_class
+        return self.serializers_dict[self.registry_key]
+
+    # join/prefetch the relations the serializer renders to avoid N+1 queries;
+    # ?is_deleted= widens to soft deleted rows for FieldFilterBackend to filter
+    # with sparse fields, unrendered columns & relations aren't loaded at all
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request is not None and self.request.query_params.get("is_deleted"):
+            queryset = queryset.model.objects.all_with_deleted()
+        relations = get_queryset_relations(
+            queryset.model, 
+            self.get_serializer_class()
+        )
+        select_related = relations["select_related"]
+        prefetch_related = relations["prefetch_related"]
+
+        sparse_fields = self.get_sparse_fields()
+        if sparse_fields is not None:
+            select_related = [name for name in select_related if name in sparse_fields]
+            prefetch_related = [name for name in prefetch_related if name in sparse_fields]
+            # pagination reads its ordering columns from the last row of each page
+            ordering = [
+                name.lstrip("-") for name in getattr(self.paginator, "ordering", ())
+            ]
+            queryset = queryset.only(
+                queryset.model._meta.pk.name,
+                *ordering,
+                *[
+                    field.name for field in queryset.model._meta.concrete_fields 
+                    if field.name in sparse_fields
+                ]
+            )
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    # field names to render: ?fields= (comma separated) else the model's LIST_FIELDS
+    # on list, minus ?omit=; None renders every field (writes always do)
+    def get_sparse_fields(self):
+        if hasattr(self, "sparse_fields"):
+            return self.sparse_fields
+
+        self.sparse_fields = None
+        if self.request is None or self.request.method not in ("GET", "HEAD"):
+            return None
+
+        params = self.request.query_params
+        available = get_readable_fields(self.get_serializer_class())
+        requested = [name for name in params.get("fields", "").split(",") if name]
+        omitted = [name for name in params.get("omit", "").split(",") if name]
+
+        unknown = set(requested + omitted) - set(available)
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": f"Unknown fields: {', '.join(sorted(unknown))}"}
+            )
+
+        if requested:
+            selected = set(requested)
+        elif self.action == "list" and self.registry_key[1] in LIST_FIELDS:
+            selected = set(LIST_FIELDS[self.registry_key[1]])
+        else:
+            selected = set(available)
+        selected -= set(omitted)
+
+        if selected != set(available):
+            self.sparse_fields = [name for name in available if name in selected]
+        return self.sparse_fields
+
+    def get_serializer(self, *args, **kwargs):
+        sparse_fields = self.get_sparse_fields()
+        if sparse_fields is not None:
+            kwargs.setdefault("fields", sparse_fields)
+        return super().get_serializer(*args, **kwargs)
+
+    # read-only actions read from the replica when one is configured
+    def dispatch(self, request, *args, **kwargs):
+        if self.action_map.get(request.method.lower()) in ("list", "retrieve"):
+            with replica_reads(request):
+                return super().dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    # conditional GET: validators come from last_modified alone, so a 304
+    # is answered with one small query & no object load or serialization
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        last_modified = self.filter_queryset(self.get_queryset()).filter(**{
+            self.lookup_field: kwargs[lookup_url_kwarg]
+        }).values_list("last_modified", flat=True).first()
+        if last_modified is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        # query string included: ?fields= & ?omit= change the representation
+        etag = self.get_etag(
+            kwargs[lookup_url_kwarg], 
+            last_modified, 
+            request.META.get("QUERY_STRING", "")
+        )
+        return self.conditional_response(
+            request, 
+            etag, 
+            last_modified, 
+            lambda: super(BaseModelViewSet, self).retrieve(request, *args, **kwargs)
+        )
+
+    # list validators: newest last_modified & row count (catches soft deletes)
+    # of the filtered queryset, plus the query string (cursor, page size);
+    # only for models with a CACHE_CONTROL_POLICIES entry, as the aggregate 
+    # scans the table & would cost more than it saves on high-churn lists
+    def list(self, request, *args, **kwargs):
+        if self.registry_key[1] not in CACHE_CONTROL_POLICIES:
+            return self.list_rows(request, *args, **kwargs)
+
+        state = self.filter_queryset(self.get_queryset()).order_by().aggregate(
+            last_modified=Max("last_modified"), 
+            count=Count("pk")
+        )
+        etag = self.get_etag(
+            state["count"], 
+            state["last_modified"], 
+            request.META.get("QUERY_STRING", "")
+        )
+        return self.conditional_response(
+            request, 
+            etag, 
+            state["last_modified"], 
+            lambda: self.list_rows(request, *args, **kwargs)
+        )
+
+    # FAST_LIST_MODELS rendered as JSON: plain dicts from a values() query, 
+    # converted column by column, instead of a serializer instance per row;
+    # other models & formats (e.g. the browsable API) use the serializer
+    def list_rows(self, request, *args, **kwargs):
+        columns = None
+        if (
+            self.registry_key[1] in FAST_LIST_MODELS 
+            and request.accepted_renderer.format == "json"
+        ):
+            serializer_class = self.get_serializer_class()
+            columns = get_fast_columns(
+                self.queryset.model, 
+                serializer_class, 
+                tuple(self.get_sparse_fields() or get_readable_fields(serializer_class))
+            )
+        if columns is None:
+            return super().list(request, *args, **kwargs)
+        columns = [
+            (field_name, value_name, get_request_converter(convert)) 
+            for field_name, value_name, convert in columns
+        ]
+
+        queryset = self.filter_queryset(self.get_queryset())
+        value_names = [value_name for _, value_name, _ in columns]
+        # pagination reads its ordering columns from the last row of each page
+        ordering = [
+            name.lstrip("-") for name in getattr(self.paginator, "ordering", ())
+            if name.lstrip("-") not in value_names
+        ]
+        queryset = queryset.select_related(None).prefetch_related(None).values(
+            *value_names, 
+            *ordering
+        )
+
+        page = self.paginate_queryset(queryset)
+        rows = [
+            {
+                field_name: (
+                    row[value_name] if convert is None or row[value_name] is None 
+                    else convert(row[value_name])
+                )
+                for field_name, value_name, convert in columns
+            }
+            for row in (page if page is not None else queryset)
+        ]
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
+
+    def get_etag(self, *parts):
+        key = ":".join(str(part) for part in (self.registry_key, *parts))
+        return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    # 304 if the client's validators match, else the response from get_response
+    def conditional_response(self, request, etag, last_modified, get_response):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(
+            request, 
+            etag=etag, 
+            last_modified=timestamp
+        )
+        if response is None:
+            response = get_response()
+
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        policy = CACHE_CONTROL_POLICIES.get(self.registry_key[1])
+        if policy:
+            patch_cache_control(response, **policy)
+        return response
+
+    # soft delete (with cascade) instead of ModelViewSet's hard delete
+    def perform_destroy(self, instance):
+        type(instance).objects.filter(pk=instance.pk).soft_delete()
+
+    # POST {"ids": [...]}; returns rows soft deleted per model
+    @action(detail=False, methods=["post"], url_path="bulk-delete")
+    def bulk_delete(self, request):
+        ids = serializers.ListField(child=serializers.IntegerField()).run_validation(
+            request.data.get("ids")
+        )
+        return Response(self.queryset.model.objects.filter(pk__in=ids).soft_delete())
+
+    # POST {"ids": [...]}; returns rows restored per model
+    @action(detail=False, methods=["post"], url_path="bulk-restore")
+    def bulk_restore(self, request):
+        ids = serializers.ListField(child=serializers.IntegerField()).run_validation(
+            request.data.get("ids")
+        )
+        return Response(
+            self.queryset.model.objects.all_with_deleted().filter(pk__in=ids).restore()
+        )
+
+
+# (field name, values() name, converter or None) per rendered field for 
+# BaseModelViewSet.list_rows; None if any field needs the serializer 
+# (nested or m2m relations, custom sources, method fields)
+@cache
+def get_fast_columns(model, serializer_class, field_names):
+    serializer_fields = serializer_class().fields
+    columns = []
+    for field_name in field_names:
+        field = serializer_fields[field_name]
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+
+        if model_field.is_relation:
+            if not isinstance(field, serializers.PrimaryKeyRelatedField) or field.pk_field:
+                return None
+            # related pk as stored in <field>_id
+            columns.append((field_name, model_field.attname, None))
+        elif isinstance(field, PASSTHROUGH_FIELDS):
+            columns.append((field_name, model_field.attname, None))
+        else:
+            columns.append((field_name, model_field.attname, field.to_representation))
+    return columns
+
+
+# DateTimeField.to_representation looks the current timezone up for every value,
+# most of the cost of a values() list; for the default ISO 8601 output, 
+# resolve it once per request & convert the same way
+def get_request_converter(convert):
+    field = getattr(convert, "__self__", None)
+    if not isinstance(field, serializers.DateTimeField) or hasattr(field, "timezone"):
+        return convert
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = field.default_timezone()
+    if not isinstance(output_format, str) or output_format.lower() != ISO_8601:
+        return convert
+    if field_timezone is None:
+        return convert
+
+    def convert_datetime(value):
+        value = value.astimezone(field_timezone).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    return convert_datetime
+
+
+# models whose rows can render floats (FastJSONRenderer doesn't match them)
+def has_float_fields(model):
+    return any(
+        isinstance(field, (DecimalField, FloatField)) 
+        for field in model._meta.concrete_fields
+    )
+
+
+# inspect model relations against the serializer's fields, once per serializer;
+# FKs rendered as plain pks are read from <field>_id so need no join
+@cache
+def get_queryset_relations(model, serializer_class):
+    if model.__name__ in QUERYSET_RELATIONS:
+        relations = QUERYSET_RELATIONS[model.__name__]
+        return {
+            "select_related": list(relations.get("select_related", [])),
+            "prefetch_related": list(relations.get("prefetch_related", [])),
+        }
+
+    serializer_fields = serializer_class().fields
+    select_related = []
+    prefetch_related = []
+
+    for field in model._meta.get_fields():
+        # only forward relations declared on this model
+        if not field.is_relation or field.auto_created:
+            continue
+        serializer_field = serializer_fields.get(field.name)
+        if serializer_field is None:
+            continue
+
+        if field.many_to_many:
+            prefetch_related.append(field.name)
+        elif not isinstance(serializer_field, serializers.PrimaryKeyRelatedField):
+            select_related.append(field.name)
+
+    return {
+        "select_related": select_related,
+        "prefetch_related": prefetch_related,
+    }
+
+
 ### GENERATE SERIALIZERS & VIEWSETS ###
-# generate_serializers & generate_viewsets called in 
-# common.models BaseModelConfig
+# generate_serializers & generate_viewsets called once via
+# get_serializers & get_viewsets above
 # attendee models use string import to avoid circular imports
 # keep updated whenever custom serializer or viewset function added
 def use_custom_serializer(model_name, serializers_dict):
@@ -82,103 +648,55 @@ def use_custom_serializer(model_name, serializers_dict):
         return event_create_serializer(serializers_dict) 
     elif model_name == "EventAttendee":
         return event_attendee_create_serializer()
+    elif model_name == "Demographics":
+        return demographics_serializer()
     
     
 def use_custom_viewset(model_name, serializers_dict):
     if model_name == "Event":
         return event_create_viewset(serializers_dict)
     elif model_name == "EventAttendee":
-        return event_attendee_create_viewset()
+        return event_attendee_create_viewset(serializers_dict)
+    elif model_name == "Demographics":
+        return demographics_viewset(serializers_dict)
     
 
 ### CUSTOM SERIALIZER FUNCTIONS ###
 def event_create_serializer(serializers_dict):
-    class EventSerializer(serializers.ModelSerializer):
-        # get the EventAttendee serializer for attendees 
-        event_attendee_serializer = serializers_dict.get(("attendees", "EventAttendee"))(many=True)
-        if event_attendee_serializer is None:
-            raise ValueError("EventAttendee serializer not found")
-
-        # get the Questions serializer for questions
-        questions_serializer = serializers_dict.get(("questions", "Question"))(many=True)
-        if questions_serializer is None:
-            raise ValueError("Questions serializer not found")
+    class EventSerializer(SparseFieldsSerializer):
+        # attendee payloads added in bulk on create;
+        # see apps.attendees.utils.bulk_ingest_attendees for accepted keys
+        attendees = serializers.ListField(
+            child=serializers.DictField(), 
+            write_only=True, 
+            required=False
+        )
 
         class Meta:
             model = get_model("events", "Event")
             fields = "__all__"
 
         def create(self, validated_data):
-            # extract attendees and questions data if present
+            # import here to avoid circular imports at app loading
+            from apps.attendees.utils import bulk_ingest_attendees
+
+            # extract attendees and m2m data if present
             attendees_data = validated_data.pop("attendees", []) 
-            questions_data = validated_data.pop("questions", [])
+            questions = validated_data.pop("questions", [])
+            organizations = validated_data.pop("organizations", [])
 
             # create the event object
             event = get_model("events", "Event").objects.create(**validated_data) 
 
-            # prepare lists for bulk creation
-            attendees_to_add = []
-            questions_to_add = []
-
-            # add attendees to the event
-            for attendee_data in attendees_data:
-                attendee_type = attendee_data.get("attendee_type")
-
-                # map attendees to models for condensed code
-                attendee_model_mapping = {
-                    "participant": "attendees.Participant",
-                    "facilitator": "attendees.Facilitator"
-                }
-
-                # check for attendee type from standard models
-                if attendee_type in attendee_model_mapping:    
-                    attendee_model = attendee_model_mapping[attendee_type]
-                    attendee, created = attendee_model.objects.get_or_create(id=attendee_data["id"])
-                    attendees_to_add.append("attendees.EventAttendee"(
-                        event=event,
-                        attendee_type=attendee_type,
-                        **{attendee_type: attendee} # dynamic field assignment **unpacking dict
-                    )) 
-
-                # check for custom attendee type
-                elif (custom_type_name := attendee_data.get("custom_attendee_type")):
-                    # check if custom type already exists for organization
-                    organization = event.organization
-                    custom_attendee_type, created = (
-                        "attendees.CustomAttendeeType".objects.get_or_create(
-                            organization=organization, 
-                            name=custom_type_name
-                        )
-                    )
-                    # assign custom type to attendee_type
-                    attendee_type = custom_attendee_type
-
-            # bulk add attendees to event to minimise db hits
-            if attendees_to_add:
-                "attendees.EventAttendee".objects.bulk_create(attendees_to_add)
-
-            # add questions to the event
-            for question_data in questions_data:
-                # check if the question already exists
-                question_id = question_data.get("id")
-                if question_id:
-                    question, created = get_model(
-                        "questions", "Question"
-                    ).objects.get_or_create(
-                        id=question_data["id"]
-                    ) 
-                else: 
-                    question = get_model(
-                        "questions", "Question"
-                    ).objects.create(
-                        **question_data
-                    )
-                    
-                questions_to_add.append(question) 
+            # bulk add m2m relations to event to minimise db hits
+            if organizations:
+                event.organizations.add(*organizations)
+            if questions:
+                event.questions.add(*questions)
 
-            # bulk add questions to event to minimise db hits
-            if questions_to_add:
-                event.questions.add(*questions_to_add)
+            # resolve & link attendees with set-based queries
+            if attendees_data:
+                bulk_ingest_attendees(event, attendees_data)
             
             return event
     
@@ -188,183 +706,235 @@ def event_create_serializer(serializers_dict):
 # dynamically add attendees during live event
 def event_attendee_create_serializer(): 
 
-    class EventAttendeeSerializer(serializers.ModelSerializer):
+    class EventAttendeeSerializer(SparseFieldsSerializer):
 
         class Meta:
-            model = "attendees.EventAttendee"
+            model = get_model("attendees", "EventAttendee")
             fields = [
                 "event", 
-                "organization", 
+                "organizations", 
                 "attendee_type", 
                 "participant", 
                 "facilitator", 
                 "custom_attendee_type",
+                "attendees",
             ]
                       
         # allow coordinators to specify a custom_attendee_type when creating/updating attendees.
         # if the custom_attendee_type does not exist, create it
         custom_attendee_type = serializers.CharField(required=False)
 
+        # further attendees to add to this attendee's event in bulk on update
+        attendees = serializers.ListField(
+            child=serializers.DictField(), 
+            write_only=True, 
+            required=False
+        )
+
         def create(self, validated_data):
             # validate organization exists in event
             event = validated_data["event"]
             custom_attendee_type_name = validated_data.pop("custom_attendee_type", None)
+            validated_data.pop("attendees", None)
 
             # check if custom attendee type was provided
             if custom_attendee_type_name:
                 custom_attendee_type, created = (
-                    get_model("attendees", "CustomAttendeeType").objects.get_or_create(
+                    # soft deleted types still hold their unique type_name
+                    get_model("attendees", "CustomAttendeeType").objects.all_with_deleted().get_or_create(
                         type_name=custom_attendee_type_name,
-                        # check if custom attendee type exists within event organization(s)
-                        organization=event.organization
+                        # type names are unique; new types belong to the event's first organization
+                        defaults={
+                            "organization": event.organizations.first(),
+                            "unique_id": str(uuid.uuid4()),
+                        }
                     )
                 )
                 validated_data["custom_attendee_type"] = custom_attendee_type
             
-            # call superclass create method to save EventAttendee
-            return super().create(validated_data)
+            # saved here rather than by ModelSerializer.create, 
+            # to validate against the request's organization cache
+            organizations = validated_data.pop("organizations", None)
+            instance = self.Meta.model(**validated_data)
+            instance.save(event_organizations=self.get_event_organizations())
+            if organizations is not None:
+                instance.organizations.set(organizations)
+            return instance
 
         def update(self, instance, validated_data):
-            attendees_data = validated_data.pop("attendees", [])
+            # import here to avoid circular imports at app loading
+            from apps.attendees.utils import bulk_ingest_attendees
 
-            # create lists for both existing and new attendees, 
-            # for bulk adding to minimize db hits
-            attendees_to_create = []
-            attendees_to_add = []
-
-            for attendee_data in attendees_data:
-
-                # extract attendee type model to avoid code duplication
-                attendee_type = attendee_data.get("attendee_type")
-                if attendee_type == "participant":
-                    model = get_model("attendees", "Participant")
-                elif attendee_type == "facilitator":
-                    model = get_model("attendees", "Facilitator")
-                else:
-                    custom_attendee_type, _ = (
-                       get_model("attendees", "CustomAttendeeType").objects.get_or_create(
-                            type_name=attendee_type,
-                            organization=instance.organization
-                        )
-                    )
-                    # create an EventAttendee with this custom type
-                    attendees_to_create.append(get_model("attendees", "EventAttendee")(
-                        event=instance,
-                        custom_attendee_type=custom_attendee_type,
-                        unique_id=attendee_data.get("unique_id") or str(uuid.uuid4()),
-                        first_name=attendee_data.get("first_name", ""),
-                        last_name=attendee_data.get("last_name", ""),
-                    ))
-                    # skip to next attendee data
-                    continue 
-                    
-                # for participant/facilitator, 
-                # automatically assign a unique identifier if not provided
-                unique_id = attendee_data.get("unique_id") or str(uuid.uuid4())
-                
-                # find or create the facilitator/participant
-                attendee, created = model.objects.get_or_create(
-                    unique_id=unique_id,
-                    defaults={
-                        "first_name": attendee_data.get("first_name", ""),
-                        "last_name": attendee_data.get("last_name", "")
-                    }
+            attendees_data = validated_data.pop("attendees", [])
+            validated_data.pop("custom_attendee_type", None)
+
+            # resolve & link all attendees with set-based queries
+            # instead of a get_or_create per attendee
+            if attendees_data:
+                bulk_ingest_attendees(
+                    instance.event, 
+                    attendees_data, 
+                    event_organizations=self.get_event_organizations()
                 )
-                
-                if created:
-                    attendees_to_create.append(attendee)
-                else:
-                    attendees_to_add.append(attendee)
-
-            # bulk create new attendees
-            model.objects.bulk_create(attendees_to_create)
-
-            # add new and existing attendees to the event
-            if attendees_to_create or attendees_to_add:
-                instance.attendees.add(*attendees_to_create, *attendees_to_add)
             
+            organizations = validated_data.pop("organizations", None)
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save(event_organizations=self.get_event_organizations())
+            if organizations is not None:
+                instance.organizations.set(organizations)
             return instance
+
+        # one EventOrganizationCache per request, shared through the serializer 
+        # context (a list serializer's children share it too), so each event's 
+        # organizations are read once however many attendees are validated
+        def get_event_organizations(self):
+            # import here to avoid circular imports at app loading
+            from apps.attendees.models import EventOrganizationCache
+
+            if "event_organizations" not in self.context:
+                self.context["event_organizations"] = EventOrganizationCache()
+            return self.context["event_organizations"]
         
     return EventAttendeeSerializer
 
 
+# typed value columns are derived from value on save, so read only
+def demographics_serializer():
+
+    class DemographicsSerializer(SparseFieldsSerializer):
+
+        class Meta:
+            model = get_model("demographics", "Demographics")
+            fields = "__all__"
+            read_only_fields = ["value_number", "value_date", "value_choice"]
+
+    return DemographicsSerializer
+
+
 ### CUSTOM VIEWSET FUNCTIONS ###
+# serializers looked up in the shared registry instead of rebuilt per viewset
 def event_create_viewset(serializers_dict):
-    class EventViewSet(viewsets.ModelViewSet):
+    class EventViewSet(BaseModelViewSet):
         queryset = get_model("events", "Event").objects.all()
-        serializer_class = event_create_serializer(serializers_dict)
+        registry_key = ("events", "Event")
 
+    EventViewSet.serializers_dict = serializers_dict
     return EventViewSet
 
 
-def event_attendee_create_viewset():
-    class EventAttendeeViewSet(viewsets.ModelViewSet):
-        queryset = get_model("events", "Event").objects.all()
-        serializer_class = event_attendee_create_serializer()
+def event_attendee_create_viewset(serializers_dict):
+    class EventAttendeeViewSet(BaseModelViewSet):
+        queryset = get_model("attendees", "EventAttendee").objects.all()
+        registry_key = ("attendees", "EventAttendee")
 
+    EventAttendeeViewSet.serializers_dict = serializers_dict
     return EventAttendeeViewSet
 
 
-### DYNAMICALLY GENERATE SERIALIZERS ###
-def generate_serializers():
-    serializers_dict = {}
+# query params mapped to typed value lookups: (lookup, field_type to parse as)
+DEMOGRAPHIC_VALUE_FILTERS = {
+    "value_min": ("value_number__gte", "number"),
+    "value_max": ("value_number__lte", "number"),
+    "date_from": ("value_date__gte", "date"),
+    "date_to": ("value_date__lte", "date"),
+    "choice": ("value_choice__choice_text", "choice"),
+}
+
+
+# typed value ranges on top of FieldFilterBackend's id filters, 
+# e.g. ?event_demographic=3&value_min=18&value_max=25, 
+# run against the (event_demographic, typed value) indexes
+def demographics_viewset(serializers_dict):
+
+    class DemographicsViewSet(BaseModelViewSet):
+        queryset = get_model("demographics", "Demographics").objects.all()
+        registry_key = ("demographics", "Demographics")
+
+        def get_queryset(self):
+            queryset = super().get_queryset()
+            params = self.request.query_params
+            for param, (lookup, field_type) in DEMOGRAPHIC_VALUE_FILTERS.items():
+                if param not in params:
+                    continue
+                value = parse_typed_value(field_type, params[param])
+                if value is None:
+                    raise serializers.ValidationError(
+                        {param: f"Invalid {field_type} value: {params[param]}"}
+                    )
+                queryset = queryset.filter(**{lookup: value})
 
-    for app_name, model_name in MODELS_LIST:
-        model = get_model(app_name, model_name)
-        
-        # check for custom serializer
-        if model_name in CUSTOM_SERIALIZER_MODELS:
-            serializers_dict[
-                (app_name, model_name)
-            ] = use_custom_serializer(model_name, serializers_dict)
-            continue
+            return queryset
 
-        # create Meta class dynamically
-        meta_class = type(
-            # model name
-            "Meta",
-            # tuple containing base class (comma ensures treated as a tuple)
-            (object,),
-            # dictionary defining class attributes
-            {
-                "model": model,
-                "fields": "__all__"
-            }
-        )
+    DemographicsViewSet.serializers_dict = serializers_dict
+    return DemographicsViewSet
 
-        # create serializer class dynamically
-        serializer_class = type(
-            f"{model_name}Serializer", 
-            (serializers.ModelSerializer,), 
-            {
-                "Meta": meta_class
-            }
-            )
-        serializers_dict[(app_name, model_name)] = serializer_class
-    
-    return serializers_dict
+
+### DYNAMICALLY GENERATE SERIALIZERS ###
+# returns a lazy registry; nothing is built until a serializer is looked up
+def generate_serializers():
+    return SerializerRegistry()
+
+
+def build_serializer(app_name, model_name, serializers_dict):
+    model = get_model(app_name, model_name)
+
+    # check for custom serializer
+    if model_name in CUSTOM_SERIALIZER_MODELS:
+        return use_custom_serializer(model_name, serializers_dict)
+
+    # create Meta class dynamically
+    meta_class = type(
+        # model name
+        "Meta",
+        # tuple containing base class (comma ensures treated as a tuple)
+        (object,),
+        # dictionary defining class attributes
+        {
+            "model": model,
+            "fields": "__all__"
+        }
+    )
+
+    # create serializer class dynamically
+    return type(
+        f"{model_name}Serializer", 
+        (SparseFieldsSerializer,), 
+        {
+            "Meta": meta_class
+        }
+        )
 
 
 ### DYNAMICALLY GENERATE VIEWSETS ###
+# viewsets only hold a registry key, so serializers stay unbuilt until requested
 def generate_viewsets(serializers_dict):
     viewsets_dict = {}
 
-    for (app_name, model_name), serializer_class in serializers_dict.items():
+    for app_name, model_name in MODELS_LIST:
         model = get_model(app_name, model_name)
 
-        # check for custom serializer:
+        # check for custom viewset:
         if model_name in CUSTOM_SERIALIZER_MODELS:
             viewset_class = use_custom_viewset(model_name, serializers_dict)
         else:
             viewset_class = type(
                 f"{model_name}ViewSet", 
-                (viewsets.ModelViewSet,), 
+                (BaseModelViewSet,), 
                 {
                     "queryset": model.objects.all(),
-                    "serializer_class": serializer_class
+                    "registry_key": (app_name, model_name),
+                    "serializers_dict": serializers_dict,
                 })
 
+        viewset_class.pagination_class = get_pagination_class(model_name)
+        viewset_class.filter_backends = [FieldFilterBackend, FullTextSearchBackend]
+        # orjson only where no float can reach the payload (see FastJSONRenderer)
+        if model_name in FAST_LIST_MODELS and not has_float_fields(model):
+            viewset_class.renderer_classes = [
+                FastJSONRenderer if renderer is JSONRenderer else renderer 
+                for renderer in viewset_class.renderer_classes
+            ]
         viewsets_dict[model_name] = viewset_class
 
     return viewsets_dict
-        
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:48
+
+import django.db.models.deletion
+from apps.common.utils import parse_typed_value
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+# fill the typed columns of existing rows (historical models skip Demographics.save);
+# parse_typed_value leaves numbers outside the column's precision untyped
+def backfill_typed_values(apps, schema_editor):
+    Demographics = apps.get_model("demographics", "Demographics")
+    rows = Demographics.objects.select_related("event_demographic__category").order_by("id")
+
+    last_id = 0
+    while batch := list(rows.filter(id__gt=last_id)[:BATCH_SIZE]):
+        last_id = batch[-1].id
+        for demographic in batch:
+            field_type = demographic.event_demographic.category.field_type
+            value = parse_typed_value(field_type, demographic.value)
+            demographic.value_number = value if field_type == "number" else None
+            demographic.value_date = value if field_type == "date" else None
+        Demographics.objects.bulk_update(batch, ["value_number", "value_date"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0002_eventattendee_attendee_deleted_created_idx'),
+        ('demographics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='demographics',
+            name='value_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='demographics',
+            name='value_number',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=20, null=True),
+        ),
+        migrations.CreateModel(
+            name='DemographicChoice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_modified', models.DateTimeField(auto_now=True)),
+                ('is_deleted', models.BooleanField(default=False)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('choice_text', models.CharField(max_length=100)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='choices', to='demographics.demographiccategory')),
+            ],
+            options={
+                'verbose_name': 'Demographic Choice',
+                'verbose_name_plural': 'Demographic Choices',
+            },
+        ),
+        migrations.AddField(
+            model_name='demographics',
+            name='value_choice',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='demographics', to='demographics.demographicchoice'),
+        ),
+        migrations.AddIndex(
+            model_name='demographics',
+            index=models.Index(fields=['event_demographic', 'value_number'], name='demographic_number_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='demographics',
+            index=models.Index(fields=['event_demographic', 'value_date'], name='demographic_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='demographics',
+            index=models.Index(fields=['event_demographic', 'value_choice'], name='demographic_choice_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='demographicchoice',
+            unique_together={('category', 'choice_text')},
+        ),
+        migrations.RunPython(backfill_typed_values, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0003_hot_lookup_indexes'),
+        ('demographics', '0002_typed_values'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='demographics',
+            index=models.Index(fields=['event_demographic', 'event_attendee'], name='demographic_attendee_idx'),
+        ),
+    ]
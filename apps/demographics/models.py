@@ -1,5 +1,6 @@
 from apps.attendees.models import EventAttendee
 from apps.common.models import BaseModel
+from apps.common.utils import NUMBER_DECIMAL_PLACES, NUMBER_MAX_DIGITS, parse_typed_value
 from apps.events.models import Event
 from apps.organizations.models import Organization
 from django.db import models
@@ -30,6 +31,25 @@ class DemographicCategory(BaseModel):
         verbose_name_plural = "Demographic Categories"
 
 
+# allowed options for choice-type demographic categories
+class DemographicChoice(BaseModel):
+    category = models.ForeignKey(
+        DemographicCategory, 
+        on_delete=models.CASCADE, 
+        related_name="choices"
+    )
+    choice_text = models.CharField(max_length=100)
+
+    def __str__(self):
+        return self.choice_text
+    
+    class Meta:
+        verbose_name = "Demographic Choice"
+        verbose_name_plural = "Demographic Choices"
+        # ensure choices unique within each category
+        unique_together = ("category", "choice_text")
+
+
 # link demographic categories with events
 class EventDemographic(BaseModel):
     event = models.ForeignKey(
@@ -42,6 +62,8 @@ class EventDemographic(BaseModel):
         on_delete=models.CASCADE, 
         related_name="event_demographics"
     )
+
+    soft_delete_cascade = ("demographics",)
     
     def __str__(self):
         return f"{self.category} for {self.event}"
@@ -66,6 +88,22 @@ class Demographics(BaseModel):
         related_name="demographics"
     )
     value = models.CharField(max_length=255)
+    # typed copies of value per the category's field_type, set on save;
+    # indexed with event_demographic so range filters run in SQL
+    value_number = models.DecimalField(
+        max_digits=NUMBER_MAX_DIGITS, 
+        decimal_places=NUMBER_DECIMAL_PLACES, 
+        null=True, 
+        blank=True
+    )
+    value_date = models.DateField(null=True, blank=True)
+    value_choice = models.ForeignKey(
+        DemographicChoice,
+        null=True, 
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="demographics"
+    )
 
     def __str__(self):
         return (
@@ -73,6 +111,45 @@ class Demographics(BaseModel):
             "by {self.event_attendee}"
         )
     
+    # fill the typed columns from value; field_type can be passed 
+    # by callers that already know it, to skip the category lookup
+    def set_typed_value(self, field_type=None):
+        if field_type is None:
+            field_type = self.event_demographic.category.field_type
+        value = parse_typed_value(field_type, self.value)
+
+        self.value_number = value if field_type == "number" else None
+        self.value_date = value if field_type == "date" else None
+        self.value_choice = None
+        if field_type == "choice" and value:
+            self.value_choice = DemographicChoice.objects.filter(
+                category_id=self.event_demographic.category_id,
+                choice_text=value
+            ).first()
+
+    def save(self, *args, field_type=None, **kwargs):
+        self.set_typed_value(field_type)
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = "Demographic"
         verbose_name_plural = "Demographics"
+        indexes = [
+            # an attendee's answer to one event demographic (profiles, exports)
+            models.Index(
+                fields=["event_demographic", "event_attendee"], 
+                name="demographic_attendee_idx"
+            ),
+            models.Index(
+                fields=["event_demographic", "value_number"], 
+                name="demographic_number_idx"
+            ),
+            models.Index(
+                fields=["event_demographic", "value_date"], 
+                name="demographic_date_idx"
+            ),
+            models.Index(
+                fields=["event_demographic", "value_choice"], 
+                name="demographic_choice_idx"
+            ),
+        ]
@@ -1,3 +1,51 @@
-from django.test import TestCase
+from apps.attendees.models import EventAttendee, Participant
+from apps.demographics.models import DemographicCategory, Demographics, EventDemographic
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from decimal import Decimal
+from rest_framework.test import APITestCase
+import datetime
 
-# Create your tests here.
+
+# numbers outside value_number's precision are kept as untyped text
+class TypedValueTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(name="Org")
+        event = Event.objects.create(name="Event", date=datetime.date.today())
+        event.organizations.add(organization)
+        cls.event_demographic = EventDemographic.objects.create(
+            event=event, 
+            category=DemographicCategory.objects.create(
+                organization=organization, 
+                name="Age", 
+                field_type="number"
+            )
+        )
+        cls.event_attendee = EventAttendee.objects.create(
+            event=event, 
+            participant=Participant.objects.create(organization=organization)
+        )
+
+    def post_value(self, value):
+        return self.client.post(
+            "/api/demographics/", 
+            {
+                "event_demographic": self.event_demographic.pk, 
+                "event_attendee": self.event_attendee.pk, 
+                "value": value,
+            }, 
+            format="json"
+        )
+
+    def test_number_out_of_range_stored_untyped(self):
+        response = self.post_value("123456789012345678")
+        self.assertEqual(response.status_code, 201)
+        demographic = Demographics.objects.get()
+        self.assertEqual(demographic.value, "123456789012345678")
+        self.assertIsNone(demographic.value_number)
+
+    def test_number_in_range_typed(self):
+        response = self.post_value("42.1234567")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Demographics.objects.get().value_number, Decimal("42.123457"))
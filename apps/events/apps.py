@@ -5,3 +5,8 @@ class EventsConfig(BaseModelConfig):
     name = "apps.events"
     verbose_name = "Events"
 
+    def ready(self):
+        super().ready()
+        # connect signal handlers
+        from . import signals
+
@@ -19,6 +19,9 @@ class Event(BaseModel):
         blank=True,
         related_name="events" 
     )
+
+    # archiving an event archives its attendees (& their responses) and demographics
+    soft_delete_cascade = ("event_attendees", "event_demographics")
     
     def __str__(self):
         return f"{self.name}, {self.date}" 
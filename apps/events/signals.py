@@ -0,0 +1,76 @@
+from .models import Event
+from .utils import invalidate_event_bootstrap
+from apps.common.signals import post_restore, post_soft_delete
+from apps.common.utils import clear_default_event_cache
+from apps.demographics.models import DemographicCategory, DemographicChoice, EventDemographic
+from apps.questions.models import Question
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+
+# saved instance or bulk soft deleted/restored pks, as a list of pks
+def get_changed_pks(instance=None, pks=None):
+    return [instance.pk] if instance is not None else pks
+
+
+# default event may change whenever events are created, deleted or restored
+@receiver(post_save, sender=Event)
+@receiver(post_soft_delete, sender=Event)
+@receiver(post_restore, sender=Event)
+def event_changed(sender, instance=None, pks=None, **kwargs):
+    clear_default_event_cache()
+    invalidate_event_bootstrap(get_changed_pks(instance, pks))
+
+
+# m2m changes don't save the event, so drop its cached bootstrap payload
+# (last_modified is bumped for every m2m, see apps.common.signals)
+@receiver(m2m_changed, sender=Event.questions.through)
+@receiver(m2m_changed, sender=Event.organizations.through)
+def event_relations_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        event_ids = [instance.pk]
+    elif action == "pre_clear":
+        # reverse clear (e.g. question.events.clear()) has no pk_set
+        event_ids = list(instance.events.values_list("pk", flat=True))
+    else:
+        event_ids = pk_set or []
+    invalidate_event_bootstrap(event_ids)
+
+
+### BOOTSTRAP PAYLOAD INVALIDATION ###
+@receiver(post_save, sender=Question)
+@receiver(post_soft_delete, sender=Question)
+@receiver(post_restore, sender=Question)
+def question_changed(sender, instance=None, pks=None, **kwargs):
+    invalidate_event_bootstrap(Event.questions.through.objects.filter(
+        question_id__in=get_changed_pks(instance, pks)
+    ).values_list("event_id", flat=True))
+
+
+@receiver(post_save, sender=EventDemographic)
+@receiver(post_soft_delete, sender=EventDemographic)
+@receiver(post_restore, sender=EventDemographic)
+def event_demographic_changed(sender, instance=None, pks=None, **kwargs):
+    invalidate_event_bootstrap(EventDemographic.objects.all_with_deleted().filter(
+        pk__in=get_changed_pks(instance, pks)
+    ).values_list("event_id", flat=True))
+
+
+@receiver(post_save, sender=DemographicCategory)
+@receiver(post_soft_delete, sender=DemographicCategory)
+@receiver(post_restore, sender=DemographicCategory)
+def demographic_category_changed(sender, instance=None, pks=None, **kwargs):
+    invalidate_event_bootstrap(EventDemographic.objects.all_with_deleted().filter(
+        category_id__in=get_changed_pks(instance, pks)
+    ).values_list("event_id", flat=True))
+
+
+@receiver(post_save, sender=DemographicChoice)
+@receiver(post_soft_delete, sender=DemographicChoice)
+@receiver(post_restore, sender=DemographicChoice)
+def demographic_choice_changed(sender, instance=None, pks=None, **kwargs):
+    invalidate_event_bootstrap(EventDemographic.objects.all_with_deleted().filter(
+        category__choices__in=get_changed_pks(instance, pks)
+    ).values_list("event_id", flat=True))
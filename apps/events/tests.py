@@ -1,3 +1,80 @@
-from django.test import TestCase
+from apps.demographics.models import DemographicCategory, DemographicChoice, EventDemographic
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from apps.questions.models import Question
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+import datetime
 
-# Create your tests here.
+
+# the cached bootstrap payload is dropped whenever anything it shows changes
+class EventBootstrapCacheTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(cls.organization)
+        cls.question = Question.objects.create(text="Question?", organization=cls.organization)
+        cls.event.questions.add(cls.question)
+        cls.category = DemographicCategory.objects.create(
+            organization=cls.organization, 
+            name="Role", 
+            field_type="choice"
+        )
+
+    def setUp(self):
+        # locmem cache outlives each test's transaction
+        cache.clear()
+
+    def get_bootstrap(self):
+        response = self.client.get(f"/apps/events/{self.event.pk}/bootstrap/")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_served_from_cache(self):
+        payload = self.get_bootstrap()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_bootstrap(), payload)
+
+        metrics = self.client.get("/apps/events/bootstrap/metrics/").json()
+        self.assertEqual((metrics["hits"], metrics["misses"]), (1, 1))
+
+    def test_event_change_invalidates(self):
+        self.get_bootstrap()
+        self.event.name = "Renamed"
+        self.event.save()
+        self.assertEqual(self.get_bootstrap()["event"]["name"], "Renamed")
+
+    def test_question_change_invalidates(self):
+        self.get_bootstrap()
+        self.question.text = "Reworded?"
+        self.question.save()
+        self.assertEqual(
+            [question["text"] for question in self.get_bootstrap()["questions"]], 
+            ["Reworded?"]
+        )
+
+        other = Question.objects.create(text="Another?", organization=self.organization)
+        self.event.questions.add(other)
+        self.assertEqual(len(self.get_bootstrap()["questions"]), 2)
+
+        other.delete_record()
+        self.assertEqual(len(self.get_bootstrap()["questions"]), 1)
+
+    def test_demographic_change_invalidates(self):
+        self.assertEqual(self.get_bootstrap()["demographics"], [])
+        event_demographic = EventDemographic.objects.create(event=self.event, category=self.category)
+        self.assertEqual(len(self.get_bootstrap()["demographics"]), 1)
+
+        self.category.name = "Position"
+        self.category.save()
+        self.assertEqual(self.get_bootstrap()["demographics"][0]["category"]["name"], "Position")
+
+        DemographicChoice.objects.create(category=self.category, choice_text="Student")
+        self.assertEqual(
+            self.get_bootstrap()["demographics"][0]["category"]["choices"][0]["choice_text"], 
+            "Student"
+        )
+
+        event_demographic.delete_record()
+        self.assertEqual(self.get_bootstrap()["demographics"], [])
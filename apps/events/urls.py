@@ -1,10 +1,12 @@
 from django.urls import path
-from .views import EventCreateView
+from .views import EventCreateView, event_bootstrap, event_bootstrap_metrics
 
 app_name = 'events'
 
 urlpatterns = [
     path('create/', EventCreateView.as_view(), name='event-create'),
+    path('<int:event_id>/bootstrap/', event_bootstrap, name='event-bootstrap'),
+    path('bootstrap/metrics/', event_bootstrap_metrics, name='event-bootstrap-metrics'),
 ]
 
 
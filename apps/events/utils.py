@@ -0,0 +1,107 @@
+from .models import Event
+from apps.common.utils import get_queryset_relations, get_serializers
+from apps.demographics.models import EventDemographic
+from apps.questions.models import Question
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+
+### EVENT BOOTSTRAP PAYLOAD ###
+# what the PWA loads on joining an event: the event, its questions & its 
+# demographic categories with choices; serialized once & kept in the cache 
+# until events.signals invalidates it
+BOOTSTRAP_METRICS = ("hits", "misses", "invalidations")
+
+
+def get_event_bootstrap_cache_key(event_id):
+    return f"events:bootstrap:{event_id}"
+
+
+def get_bootstrap_metric_key(metric):
+    return f"events:bootstrap:metrics:{metric}"
+
+
+# count in the cache so metrics are shared by workers on a shared backend
+def increment_bootstrap_metric(metric, delta=1):
+    key = get_bootstrap_metric_key(metric)
+    if not cache.add(key, delta, timeout=None):
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            # evicted between add & incr
+            cache.set(key, delta, timeout=None)
+
+
+def get_bootstrap_metrics():
+    counts = cache.get_many([get_bootstrap_metric_key(metric) for metric in BOOTSTRAP_METRICS])
+    metrics = {
+        metric: counts.get(get_bootstrap_metric_key(metric), 0) 
+        for metric in BOOTSTRAP_METRICS
+    }
+    lookups = metrics["hits"] + metrics["misses"]
+    metrics["hit_rate"] = round(metrics["hits"] / lookups, 4) if lookups else None
+    return metrics
+
+
+# cached payload for an event; None if the event doesn't exist
+def get_event_bootstrap(event_id):
+    key = get_event_bootstrap_cache_key(event_id)
+    payload = cache.get(key)
+    if payload is not None:
+        increment_bootstrap_metric("hits")
+        return payload
+
+    increment_bootstrap_metric("misses")
+    payload = build_event_bootstrap(event_id)
+    if payload is not None:
+        cache.set(key, payload, settings.EVENT_BOOTSTRAP_CACHE_TIMEOUT)
+    return payload
+
+
+def build_event_bootstrap(event_id):
+    event = Event.objects.prefetch_related("organizations", "questions").filter(
+        pk=event_id
+    ).first()
+    if event is None:
+        return None
+
+    serializers_dict = get_serializers()
+    question_serializer = serializers_dict[("questions", "Question")]
+    relations = get_queryset_relations(Question, question_serializer)
+    questions = event.questions.select_related(
+        *relations["select_related"]
+    ).prefetch_related(*relations["prefetch_related"]).order_by("id")
+
+    event_demographics = EventDemographic.objects.filter(
+        event_id=event_id
+    ).select_related("category").prefetch_related(
+        Prefetch("category__choices", to_attr="active_choices")
+    ).order_by("id")
+
+    return {
+        "event": serializers_dict[("events", "Event")](event).data,
+        "questions": question_serializer(questions, many=True).data,
+        "demographics": [
+            {
+                "id": event_demographic.id,
+                "category": {
+                    "id": event_demographic.category.id,
+                    "name": event_demographic.category.name,
+                    "field_type": event_demographic.category.field_type,
+                    "choices": [
+                        {"id": choice.id, "choice_text": choice.choice_text}
+                        for choice in event_demographic.category.active_choices
+                    ],
+                },
+            }
+            for event_demographic in event_demographics
+        ],
+    }
+
+
+def invalidate_event_bootstrap(event_ids):
+    event_ids = set(event_ids)
+    if event_ids:
+        cache.delete_many([get_event_bootstrap_cache_key(event_id) for event_id in event_ids])
+        increment_bootstrap_metric("invalidations", len(event_ids))
@@ -1,23 +1,37 @@
 from .models import Event
+from .utils import get_bootstrap_metrics, get_event_bootstrap
 from apps.questions.models import Question
 from apps.responses.models import Response
 from django.http import Http404, HttpResponse
 from django.shortcuts import render
 from rest_framework import generics, viewsets
-from apps.common.utils import generate_serializers, get_object_or_error
-
-
-# get serializers_dict
-serializers_dict = generate_serializers()
-print("Serializers Dictionary:", serializers_dict)
+from rest_framework.decorators import api_view
+from rest_framework.response import Response as APIResponse
+from apps.common.utils import get_object_or_error, get_serializers
 
 
 class EventCreateView(generics.CreateAPIView):
     # fetch all Event objects
     queryset = Event.objects.all()
 
-    # points to custom Event Serializer in utils.py
-    serializer_class = serializers_dict.get('Event')
+    # points to custom Event Serializer in utils.py, via the shared registry
+    def get_serializer_class(self):
+        return get_serializers()[("events", "Event")]
+
+
+# everything the PWA needs on joining an event, served from the cache
+@api_view(["GET"])
+def event_bootstrap(request, event_id):
+    payload = get_event_bootstrap(event_id)
+    if payload is None:
+        raise Http404("Event not found")
+    return APIResponse(payload)
+
+
+# bootstrap cache hits, misses & invalidations
+@api_view(["GET"])
+def event_bootstrap_metrics(request):
+    return APIResponse(get_bootstrap_metrics())
 
 
 ### orig setup below (pre-SPA setup) ###
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+# FULLTEXT index for the __search lookup (apps.common.lookups); MySQL/MariaDB only,
+# other backends search with a substring match & need no index
+def create_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "mysql":
+        schema_editor.execute("CREATE FULLTEXT INDEX question_text_fulltext ON questions_question (text)")
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "mysql":
+        schema_editor.execute("DROP INDEX question_text_fulltext ON questions_question")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -4,3 +4,8 @@ from apps.common.apps import BaseModelConfig
 class ReportsConfig(BaseModelConfig):
     name = "apps.reports"
     verbose_name = "Reports"
+
+    def ready(self):
+        super().ready()
+        # connect signal handlers
+        from . import signals
@@ -0,0 +1,35 @@
+from apps.common.routers import iter_replica_reads
+from apps.events.models import Event
+from apps.reports.utils import EXPORT_FORMATS, stream_event_responses
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Stream an event's responses with attendee type & demographics as CSV or NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("event", type=int, help="Event id")
+        parser.add_argument(
+            "--format", 
+            choices=list(EXPORT_FORMATS), 
+            default="csv"
+        )
+        parser.add_argument(
+            "--output", 
+            help="File to write to; defaults to stdout"
+        )
+
+    def handle(self, *args, **options):
+        if not Event.objects.filter(pk=options["event"]).exists():
+            raise CommandError(f"Event {options['event']} does not exist")
+
+        lines = iter_replica_reads(
+            None, 
+            stream_event_responses(options["event"], options["format"])
+        )
+        if options["output"]:
+            with open(options["output"], "w", newline="") as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
@@ -0,0 +1,17 @@
+from apps.reports.utils import rebuild_demographic_profiles
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute the pivoted demographic profiles from Demographics rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event", 
+            type=int, 
+            help="Only rebuild profiles for this event id"
+        )
+
+    def handle(self, *args, **options):
+        rebuild_demographic_profiles(options["event"])
+        self.stdout.write(self.style.SUCCESS("Demographic profiles rebuilt"))
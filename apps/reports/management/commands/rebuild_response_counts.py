@@ -0,0 +1,17 @@
+from apps.reports.utils import rebuild_response_counts
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute the materialized response counters from Response rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event", 
+            type=int, 
+            help="Only rebuild counters for this event id"
+        )
+
+    def handle(self, *args, **options):
+        rebuild_response_counts(options["event"])
+        self.stdout.write(self.style.SUCCESS("Response counters rebuilt"))
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('demographics', '0001_initial'),
+        ('events', '0001_initial'),
+        ('questions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DemographicResponseCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attendee_type', models.CharField(max_length=20)),
+                ('value', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='demographic_response_counts', to='events.event')),
+                ('event_demographic', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='response_counts', to='demographics.eventdemographic')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='demographic_response_counts', to='questions.question')),
+            ],
+            options={
+                'verbose_name': 'Demographic Response Count',
+                'verbose_name_plural': 'Demographic Response Counts',
+                'constraints': [models.UniqueConstraint(fields=('event', 'question', 'event_demographic', 'value', 'attendee_type'), name='unique_demographic_response_count')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResponseCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attendee_type', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='response_counts', to='events.event')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='response_counts', to='questions.question')),
+            ],
+            options={
+                'verbose_name': 'Response Count',
+                'verbose_name_plural': 'Response Counts',
+                'constraints': [models.UniqueConstraint(fields=('event', 'question', 'attendee_type'), name='unique_response_count')],
+            },
+        ),
+    ]
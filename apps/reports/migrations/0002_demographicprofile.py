@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0002_eventattendee_attendee_deleted_created_idx'),
+        ('events', '0001_initial'),
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DemographicProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attendee_type', models.CharField(max_length=20)),
+                ('values', models.JSONField(default=dict)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='demographic_profiles', to='events.event')),
+                ('event_attendee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='demographic_profile', to='attendees.eventattendee')),
+            ],
+            options={
+                'verbose_name': 'Demographic Profile',
+                'verbose_name_plural': 'Demographic Profiles',
+            },
+        ),
+    ]
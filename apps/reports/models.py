@@ -1,3 +1,103 @@
+from apps.attendees.models import EventAttendee
+from apps.events.models import Event
+from apps.demographics.models import EventDemographic
+from apps.questions.models import Question
 from django.db import models
 
-# Create your models here.
+
+### MATERIALIZED RESPONSE COUNTERS ###
+# maintained incrementally by reports.signals; rebuild with 
+# `python manage.py rebuild_response_counts`
+# not BaseModel subclasses: derived data, never soft deleted
+
+# live responses per question per event, split by attendee type
+class ResponseCount(models.Model):
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="response_counts"
+    )
+    question = models.ForeignKey(
+        Question,
+        on_delete=models.CASCADE,
+        related_name="response_counts"
+    )
+    attendee_type = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.count} {self.attendee_type} responses to {self.question_id}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "question", "attendee_type"],
+                name="unique_response_count",
+            ),
+        ]
+        verbose_name = "Response Count"
+        verbose_name_plural = "Response Counts"
+
+
+# live responses per question per event, split by attendee type & demographic value
+class DemographicResponseCount(models.Model):
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="demographic_response_counts"
+    )
+    question = models.ForeignKey(
+        Question,
+        on_delete=models.CASCADE,
+        related_name="demographic_response_counts"
+    )
+    attendee_type = models.CharField(max_length=20)
+    event_demographic = models.ForeignKey(
+        EventDemographic,
+        on_delete=models.CASCADE,
+        related_name="response_counts"
+    )
+    value = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return (
+            f"{self.count} {self.attendee_type} responses to {self.question_id} "
+            f"with {self.event_demographic_id}={self.value}"
+        )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "question", "event_demographic", "value", "attendee_type"],
+                name="unique_demographic_response_count",
+            ),
+        ]
+        verbose_name = "Demographic Response Count"
+        verbose_name_plural = "Demographic Response Counts"
+
+
+### PIVOTED DEMOGRAPHICS ###
+# one row per event attendee with all their demographic answers as typed values,
+# keyed "ed_<event_demographic_id>"; maintained by reports.signals,
+# rebuild with `python manage.py rebuild_demographic_profiles`
+class DemographicProfile(models.Model):
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="demographic_profiles"
+    )
+    event_attendee = models.OneToOneField(
+        EventAttendee,
+        on_delete=models.CASCADE,
+        related_name="demographic_profile"
+    )
+    attendee_type = models.CharField(max_length=20)
+    values = models.JSONField(default=dict)
+
+    def __str__(self):
+        return f"Demographic profile of {self.event_attendee_id}"
+
+    class Meta:
+        verbose_name = "Demographic Profile"
+        verbose_name_plural = "Demographic Profiles"
@@ -0,0 +1,100 @@
+from .utils import (
+    apply_demographic_counts, 
+    apply_response_counts, 
+    create_missing_demographic_profiles, 
+    refresh_demographic_profiles
+)
+from apps.attendees.models import EventAttendee
+from apps.common.signals import post_bulk_create, post_restore, post_soft_delete
+from apps.demographics.models import Demographics
+from apps.responses.models import Response
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+
+# remember whether the loaded row was live, to spot soft delete/restore on save;
+# None when is_deleted was deferred (only()), as reading it would cost a query per row
+@receiver(post_init, sender=Demographics)
+@receiver(post_init, sender=Response)
+def instance_loaded(sender, instance, **kwargs):
+    if "is_deleted" not in instance.__dict__:
+        instance._counted_as_live = None
+        return
+    instance._counted_as_live = instance.pk is not None and not instance.is_deleted
+
+
+@receiver(post_save, sender=Response)
+def response_saved(sender, instance, created, **kwargs):
+    is_live = not instance.is_deleted
+    was_live = False if created else instance._counted_as_live
+    # loaded without is_deleted: assume unchanged
+    if was_live is None:
+        was_live = is_live
+
+    if is_live != was_live:
+        apply_response_counts([instance], 1 if is_live else -1)
+    instance._counted_as_live = is_live
+
+
+@receiver(post_bulk_create, sender=Response)
+def responses_bulk_created(sender, instances, **kwargs):
+    apply_response_counts(
+        [response for response in instances if not response.is_deleted], 
+        1
+    )
+
+
+# demographic answers split the counts of responses already given
+# changed values are not re-split; use rebuild_response_counts for that
+@receiver(post_save, sender=Demographics)
+def demographic_saved(sender, instance, created, **kwargs):
+    is_live = not instance.is_deleted
+    was_live = False if created else instance._counted_as_live
+    # loaded without is_deleted: assume unchanged
+    if was_live is None:
+        was_live = is_live
+
+    if is_live != was_live:
+        apply_demographic_counts([instance], 1 if is_live else -1)
+    instance._counted_as_live = is_live
+
+    if instance.event_attendee_id is not None:
+        refresh_demographic_profiles([instance.event_attendee_id])
+
+
+# queryset soft_delete()/restore() batches
+@receiver(post_soft_delete, sender=Response)
+@receiver(post_restore, sender=Response)
+def responses_bulk_soft_deleted(sender, pks, signal, **kwargs):
+    responses = Response.objects.all_with_deleted().filter(
+        pk__in=pks
+    ).only("event_attendee", "question")
+    apply_response_counts(responses, -1 if signal is post_soft_delete else 1)
+
+
+@receiver(post_soft_delete, sender=Demographics)
+@receiver(post_restore, sender=Demographics)
+def demographics_bulk_soft_deleted(sender, pks, signal, **kwargs):
+    demographics = list(Demographics.objects.all_with_deleted().filter(
+        pk__in=pks
+    ).only("event_attendee", "event_demographic", "value"))
+    apply_demographic_counts(demographics, -1 if signal is post_soft_delete else 1)
+    refresh_demographic_profiles(
+        demographic.event_attendee_id 
+        for demographic in demographics 
+        if demographic.event_attendee_id is not None
+    )
+
+
+# every attendee has a profile (as after rebuild_demographic_profiles),
+# kept in step with the attendee's event & attendee_type
+@receiver(post_save, sender=EventAttendee)
+def event_attendee_saved(sender, instance, **kwargs):
+    refresh_demographic_profiles([instance.pk])
+
+
+@receiver(post_bulk_create, sender=EventAttendee)
+def event_attendees_bulk_created(sender, instances, **kwargs):
+    create_missing_demographic_profiles(
+        event_attendee.event_id for event_attendee in instances
+    )
@@ -1,3 +1,289 @@
-from django.test import TestCase
+from apps.attendees.models import EventAttendee, Participant
+from apps.demographics.models import DemographicCategory, Demographics, EventDemographic
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from apps.reports.models import DemographicProfile, DemographicResponseCount, ResponseCount
+from apps.reports.utils import rebuild_demographic_profiles
+from apps.questions.models import Question
+from apps.responses.models import Response
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+import csv
+import datetime
+import io
 
-# Create your tests here.
+
+# incremental profile maintenance matches a full rebuild
+class DemographicProfileTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(cls.organization)
+        cls.event_demographic = EventDemographic.objects.create(
+            event=cls.event, 
+            category=DemographicCategory.objects.create(
+                organization=cls.organization, 
+                name="Age", 
+                field_type="number"
+            )
+        )
+
+    def get_crosstab(self, query=""):
+        return self.client.get(
+            f"/apps/reports/events/{self.event.pk}/demographics/crosstab/"
+            f"?rows=attendee_type&columns=ed_{self.event_demographic.pk}{query}"
+        )
+
+    def get_profiles(self):
+        return sorted(DemographicProfile.objects.values_list(
+            "event_attendee_id", "attendee_type", "values"
+        ))
+
+    def test_profiles_match_rebuild(self):
+        # with & without demographics, saved one by one & bulk ingested
+        answered, unanswered = [
+            EventAttendee.objects.create(
+                event=self.event, 
+                participant=Participant.objects.create(organization=self.organization)
+            )
+            for _ in range(2)
+        ]
+        Demographics.objects.create(
+            event_demographic=self.event_demographic, 
+            event_attendee=answered, 
+            value="30"
+        )
+        response = self.client.post(
+            f"/apps/attendees/events/{self.event.pk}/bulk/", 
+            [{"first_name": "Ada"}, {"first_name": "Grace"}], 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+
+        # attendee type changed after the profile was created
+        unanswered.attendee_type = "other"
+        unanswered.save()
+
+        profiles = self.get_profiles()
+        crosstab = self.get_crosstab().json()
+        self.assertEqual(len(profiles), 4)
+        self.assertEqual(crosstab["attendees"], 4)
+
+        rebuild_demographic_profiles(self.event.pk)
+        self.assertEqual(self.get_profiles(), profiles)
+        self.assertEqual(self.get_crosstab().json(), crosstab)
+
+    def test_invalid_question_rejected(self):
+        response = self.get_crosstab("&responses=1&question=abc")
+        self.assertEqual(response.status_code, 400)
+
+
+# counters maintained on create, soft delete & restore match a full rebuild
+class ResponseCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(organization)
+        cls.questions = [
+            Question.objects.create(text=f"Question {i}?", organization=organization) 
+            for i in range(2)
+        ]
+        cls.event.questions.add(*cls.questions)
+        cls.event_demographic = EventDemographic.objects.create(
+            event=cls.event, 
+            category=DemographicCategory.objects.create(organization=organization, name="Age")
+        )
+        cls.event_attendees = [
+            EventAttendee.objects.create(
+                event=cls.event, 
+                participant=Participant.objects.create(organization=organization)
+            ),
+            EventAttendee.objects.create(
+                event=cls.event, 
+                attendee_type="other"
+            ),
+        ]
+
+    # live counters only; rebuilt counters have no zero rows
+    def get_counts(self):
+        return (
+            sorted(ResponseCount.objects.exclude(count=0).values_list(
+                "event_id", "question_id", "attendee_type", "count"
+            )),
+            sorted(DemographicResponseCount.objects.exclude(count=0).values_list(
+                "event_id", "question_id", "attendee_type", "event_demographic_id", "value", "count"
+            )),
+        )
+
+    def assertCountsMatchRebuild(self):
+        counts = self.get_counts()
+        call_command("rebuild_response_counts", event=self.event.pk, stdout=io.StringIO())
+        self.assertEqual(self.get_counts(), counts)
+
+    def test_counts_match_rebuild(self):
+        responses = [
+            Response.objects.create(text="Answer", event_attendee=event_attendee, question=question)
+            for event_attendee in self.event_attendees 
+            for question in self.questions
+        ]
+        # recorded after responding: splits the responses already counted
+        Demographics.objects.create(
+            event_demographic=self.event_demographic, 
+            event_attendee=self.event_attendees[0], 
+            value="30"
+        )
+        self.assertCountsMatchRebuild()
+        self.assertEqual(sum(count for *_, count in self.get_counts()[0]), 4)
+        self.assertEqual(sum(count for *_, count in self.get_counts()[1]), 2)
+
+        responses[0].delete_record()
+        self.assertCountsMatchRebuild()
+        Response.objects.filter(question=self.questions[1]).soft_delete()
+        self.assertCountsMatchRebuild()
+        self.assertEqual(sum(count for *_, count in self.get_counts()[0]), 1)
+
+        responses[0].restore()
+        self.assertCountsMatchRebuild()
+        Response.objects.all_with_deleted().filter(question=self.questions[1]).restore()
+        self.assertCountsMatchRebuild()
+        self.assertEqual(sum(count for *_, count in self.get_counts()[0]), 4)
+
+    # the bulk-delete/bulk-restore API cascades through the soft_delete_cascade 
+    # relations & restores only the children deleted along with the parent
+    def test_soft_delete_cascade_api(self):
+        responses = [
+            Response.objects.create(text="Answer", event_attendee=self.event_attendees[0], question=question)
+            for question in self.questions
+        ]
+        demographic = Demographics.objects.create(
+            event_demographic=self.event_demographic, 
+            event_attendee=self.event_attendees[0], 
+            value="30"
+        )
+        # deleted before the cascade, so stays deleted on restore
+        responses[1].delete_record()
+
+        deleted = self.client.post(
+            "/api/eventattendee/bulk-delete/", 
+            {"ids": [self.event_attendees[0].pk]}, 
+            format="json"
+        )
+        self.assertEqual(deleted.status_code, 200)
+        self.assertEqual(deleted.json(), {
+            "attendees.EventAttendee": 1, 
+            "responses.Response": 1, 
+            "demographics.Demographics": 1,
+        })
+        self.assertFalse(Response.objects.exists())
+        self.assertFalse(Demographics.objects.exists())
+        self.assertEqual(self.get_counts(), ([], []))
+        self.assertCountsMatchRebuild()
+
+        restored = self.client.post(
+            "/api/eventattendee/bulk-restore/", 
+            {"ids": [self.event_attendees[0].pk]}, 
+            format="json"
+        )
+        self.assertEqual(restored.json(), deleted.json())
+        self.assertEqual(list(Response.objects.all()), [responses[0]])
+        self.assertEqual(list(Demographics.objects.all()), [demographic])
+        self.assertCountsMatchRebuild()
+        self.assertEqual(len(self.get_counts()[1]), 1)
+
+    # a demographic's answers are counted in one UPDATE per counter & 
+    # profiles refreshed in bulk, whatever the number of attendees answering
+    def test_demographic_cascade_grouped(self):
+        query_counts = []
+        for attendees in (2, 6):
+            event_demographic = EventDemographic.objects.create(
+                event=self.event, 
+                category=self.event_demographic.category
+            )
+            for _ in range(attendees):
+                event_attendee = EventAttendee.objects.create(
+                    event=self.event, 
+                    participant=Participant.objects.create(organization=self.event.organizations.get())
+                )
+                Response.objects.create(text="Answer", event_attendee=event_attendee, question=self.questions[0])
+                Demographics.objects.create(
+                    event_demographic=event_demographic, 
+                    event_attendee=event_attendee, 
+                    value="30"
+                )
+
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.delete(f"/api/eventdemographic/{event_demographic.pk}/")
+            self.assertEqual(response.status_code, 204)
+            query_counts.append(len(queries))
+            self.assertCountsMatchRebuild()
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_counts_endpoint(self):
+        Demographics.objects.create(
+            event_demographic=self.event_demographic, 
+            event_attendee=self.event_attendees[0], 
+            value="30"
+        )
+        Response.objects.create(
+            text="Answer", 
+            event_attendee=self.event_attendees[0], 
+            question=self.questions[0]
+        )
+        url = f"/apps/reports/events/{self.event.pk}/response-counts/"
+
+        self.assertEqual(
+            self.client.get(url).json(), 
+            {str(self.questions[0].pk): {"participant": 1}}
+        )
+        self.assertEqual(
+            self.client.get(url, {"event_demographic": self.event_demographic.pk}).json(), 
+            {str(self.questions[0].pk): {"30": {"participant": 1}}}
+        )
+        self.assertEqual(self.client.get(url, {"event_demographic": "abc"}).status_code, 400)
+
+
+class ResponseExportTests(APITestCase):
+    # categories named like response columns get columns of their own
+    def test_demographic_columns_distinct_from_response_columns(self):
+        organization = Organization.objects.create(name="Org")
+        event = Event.objects.create(name="Event", date=datetime.date.today())
+        event.organizations.add(organization)
+        question = Question.objects.create(text="Question?", organization=organization)
+        event.questions.add(question)
+        event_attendee = EventAttendee.objects.create(
+            event=event, 
+            participant=Participant.objects.create(organization=organization)
+        )
+        Response.objects.create(text="Answer", event_attendee=event_attendee, question=question)
+        event_demographics = []
+        for name in ("text", "attendee_type", "text"):
+            event_demographics.append(EventDemographic.objects.create(
+                event=event, 
+                category=DemographicCategory.objects.create(
+                    organization=organization, 
+                    name=name, 
+                    field_type="text"
+                )
+            ))
+            Demographics.objects.create(
+                event_demographic=event_demographics[-1], 
+                event_attendee=event_attendee, 
+                value=f"demographic {name}"
+            )
+
+        response = self.client.get(f"/apps/reports/events/{event.pk}/responses/export/")
+        header, row = csv.reader(io.StringIO(b"".join(response.streaming_content).decode()))
+        # 7 response columns & 3 demographic ones
+        self.assertEqual(len(set(header)), 10)
+        record = dict(zip(header, row))
+        self.assertEqual(record["text"], "Answer")
+        self.assertEqual(record["attendee_type"], "participant")
+        self.assertEqual(
+            record[f"text ({event_demographics[0].pk})"], 
+            "demographic text"
+        )
@@ -0,0 +1,26 @@
+from django.urls import path
+from .views import (
+    event_demographic_crosstab, 
+    event_response_counts, 
+    export_event_responses
+)
+
+app_name = 'reports'
+
+urlpatterns = [
+    path(
+        'events/<int:event_id>/response-counts/', 
+        event_response_counts, 
+        name='event-response-counts'
+    ),
+    path(
+        'events/<int:event_id>/responses/export/', 
+        export_event_responses, 
+        name='event-responses-export'
+    ),
+    path(
+        'events/<int:event_id>/demographics/crosstab/', 
+        event_demographic_crosstab, 
+        name='event-demographic-crosstab'
+    ),
+]
@@ -0,0 +1,471 @@
+from .models import DemographicProfile, DemographicResponseCount, ResponseCount
+from apps.attendees.models import EventAttendee
+from apps.demographics.models import Demographics, EventDemographic
+from apps.common.utils import parse_typed_value
+from apps.responses.models import Response
+from collections import Counter, defaultdict
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+import csv
+import json
+
+
+### RESPONSE COUNTERS ###
+# add delta (+1/-1) per response to the counters; 
+# responses only need event_attendee_id & question_id set
+def apply_response_counts(responses, delta):
+    responses = list(responses)
+    if not responses:
+        return
+
+    attendee_ids = {response.event_attendee_id for response in responses}
+
+    # (event_id, attendee_type) per attendee in one query
+    attendees = {
+        pk: (event_id, attendee_type)
+        for pk, event_id, attendee_type in EventAttendee.objects.all_with_deleted().filter(
+            pk__in=attendee_ids
+        ).values_list("id", "event_id", "attendee_type")
+    }
+
+    # demographic answers per attendee in one query
+    demographics = defaultdict(list)
+    for event_attendee_id, event_demographic_id, value in Demographics.objects.filter(
+        event_attendee_id__in=attendee_ids
+    ).values_list("event_attendee_id", "event_demographic_id", "value"):
+        demographics[event_attendee_id].append((event_demographic_id, value))
+
+    counts = Counter()
+    demographic_counts = Counter()
+    for response in responses:
+        event_id, attendee_type = attendees[response.event_attendee_id]
+        key = (event_id, response.question_id, attendee_type)
+        counts[key] += delta
+        for event_demographic_id, value in demographics[response.event_attendee_id]:
+            demographic_counts[key + (event_demographic_id, value)] += delta
+
+    with transaction.atomic():
+        for (event_id, question_id, attendee_type), n in counts.items():
+            increment(ResponseCount, n, {
+                "event_id": event_id,
+                "question_id": question_id,
+                "attendee_type": attendee_type,
+            })
+        for (
+            event_id, question_id, attendee_type, event_demographic_id, value
+        ), n in demographic_counts.items():
+            increment(DemographicResponseCount, n, {
+                "event_id": event_id,
+                "question_id": question_id,
+                "attendee_type": attendee_type,
+                "event_demographic_id": event_demographic_id,
+                "value": value,
+            })
+
+
+# add delta per live response of each answer's attendee when demographic 
+# answers are recorded (+1) or removed (-1) after the attendee has responded;
+# deltas are summed per counter first, so a batch is one UPDATE per counter
+def apply_demographic_counts(demographics, delta):
+    demographics = [
+        demographic for demographic in demographics 
+        if demographic.event_attendee_id is not None
+    ]
+    if not demographics:
+        return
+
+    attendee_ids = {demographic.event_attendee_id for demographic in demographics}
+
+    # (event_id, attendee_type) per attendee in one query
+    attendees = {
+        pk: (event_id, attendee_type)
+        for pk, event_id, attendee_type in EventAttendee.objects.all_with_deleted().filter(
+            pk__in=attendee_ids
+        ).values_list("id", "event_id", "attendee_type")
+    }
+
+    # live responses per attendee & question in one query
+    responses = defaultdict(list)
+    for event_attendee_id, question_id, n in Response.objects.filter(
+        event_attendee_id__in=attendee_ids
+    ).values("event_attendee_id", "question_id").annotate(n=Count("id")).values_list(
+        "event_attendee_id", "question_id", "n"
+    ):
+        responses[event_attendee_id].append((question_id, n))
+
+    demographic_counts = Counter()
+    for demographic in demographics:
+        event_id, attendee_type = attendees[demographic.event_attendee_id]
+        for question_id, n in responses[demographic.event_attendee_id]:
+            demographic_counts[(
+                event_id, 
+                question_id, 
+                attendee_type, 
+                demographic.event_demographic_id, 
+                demographic.value
+            )] += n * delta
+
+    with transaction.atomic():
+        for (
+            event_id, question_id, attendee_type, event_demographic_id, value
+        ), n in demographic_counts.items():
+            increment(DemographicResponseCount, n, {
+                "event_id": event_id,
+                "question_id": question_id,
+                "attendee_type": attendee_type,
+                "event_demographic_id": event_demographic_id,
+                "value": value,
+            })
+
+
+# atomic upsert: UPDATE count = count + n, INSERT if the row doesn't exist yet
+def increment(model, n, key):
+    if n == 0:
+        return
+    if model.objects.filter(**key).update(count=F("count") + n):
+        return
+    try:
+        # savepoint so a concurrent insert doesn't break the outer transaction
+        with transaction.atomic():
+            model.objects.create(count=n, **key)
+    except IntegrityError:
+        model.objects.filter(**key).update(count=F("count") + n)
+
+
+# recompute counters from Response, for all events or just one
+def rebuild_response_counts(event_id=None):
+    responses = Response.objects.all()
+    if event_id is not None:
+        responses = responses.filter(event_attendee__event_id=event_id)
+
+    counts = responses.values(
+        "question_id",
+        event=F("event_attendee__event_id"),
+        attendee_type=F("event_attendee__attendee_type"),
+    ).annotate(n=Count("id"))
+
+    demographic_counts = responses.filter(
+        event_attendee__demographics__is_deleted=False
+    ).values(
+        "question_id",
+        event=F("event_attendee__event_id"),
+        attendee_type=F("event_attendee__attendee_type"),
+        event_demographic_id=F("event_attendee__demographics__event_demographic_id"),
+        value=F("event_attendee__demographics__value"),
+    ).annotate(n=Count("id"))
+
+    with transaction.atomic():
+        for model in (ResponseCount, DemographicResponseCount):
+            stale = model.objects.all()
+            if event_id is not None:
+                stale = stale.filter(event_id=event_id)
+            stale.delete()
+
+        ResponseCount.objects.bulk_create([
+            ResponseCount(
+                event_id=row["event"],
+                question_id=row["question_id"],
+                attendee_type=row["attendee_type"],
+                count=row["n"],
+            )
+            for row in counts.iterator()
+        ], batch_size=1000)
+        DemographicResponseCount.objects.bulk_create([
+            DemographicResponseCount(
+                event_id=row["event"],
+                question_id=row["question_id"],
+                attendee_type=row["attendee_type"],
+                event_demographic_id=row["event_demographic_id"],
+                value=row["value"],
+                count=row["n"],
+            )
+            for row in demographic_counts.iterator()
+        ], batch_size=1000)
+
+
+# {question_id: {attendee_type: count}} for an event, read from the counters
+def get_response_counts(event_id):
+    counts = defaultdict(dict)
+    for question_id, attendee_type, count in ResponseCount.objects.filter(
+        event_id=event_id
+    ).values_list("question_id", "attendee_type", "count"):
+        counts[question_id][attendee_type] = count
+    return counts
+
+
+# {question_id: {value: {attendee_type: count}}} for one demographic of an event
+def get_demographic_response_counts(event_id, event_demographic_id):
+    counts = defaultdict(lambda: defaultdict(dict))
+    for question_id, value, attendee_type, count in DemographicResponseCount.objects.filter(
+        event_id=event_id,
+        event_demographic_id=event_demographic_id
+    ).values_list("question_id", "value", "attendee_type", "count"):
+        counts[question_id][value][attendee_type] = count
+    return counts
+
+
+### RESPONSE EXPORTS ###
+# rows fetched per query; memory stays bounded by this, not by the event's size
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+RESPONSE_EXPORT_FIELDS = [
+    "response_id",
+    "created_at",
+    "question_id",
+    "question",
+    "text",
+    "event_attendee_id",
+    "attendee_type",
+]
+
+
+# export column per event demographic, named after its category
+def get_demographic_columns(event_id):
+    columns = {}
+    taken = set(RESPONSE_EXPORT_FIELDS)
+    for event_demographic_id, name in EventDemographic.objects.filter(
+        event_id=event_id
+    ).order_by("id").values_list("id", "category__name"):
+        # keep columns distinct if two categories share a name, or a category 
+        # is named like a response column (e.g. "text"), which it would overwrite
+        while name in taken:
+            name = f"{name} ({event_demographic_id})"
+        taken.add(name)
+        columns[event_demographic_id] = name
+    return columns
+
+
+# an event's live responses joined with attendee type & demographic answers;
+# keyset batches on id rather than one open cursor, as mysql drivers 
+# buffer the whole result client side & a cursor blocks the demographics queries
+def iter_event_responses(event_id, demographic_columns):
+    responses = Response.objects.filter(
+        event_attendee__event_id=event_id
+    ).order_by("id").values_list(
+        "id",
+        "created_at",
+        "question_id",
+        "question__text",
+        "text",
+        "event_attendee_id",
+        "event_attendee__attendee_type",
+    )
+    last_id = 0
+
+    while chunk := list(responses.filter(id__gt=last_id)[:EXPORT_CHUNK_SIZE]):
+        last_id = chunk[-1][0]
+
+        # demographic answers for just this chunk's attendees
+        demographics = defaultdict(dict)
+        for event_attendee_id, event_demographic_id, value in Demographics.objects.filter(
+            event_attendee_id__in={row[5] for row in chunk},
+            event_demographic_id__in=demographic_columns
+        ).values_list("event_attendee_id", "event_demographic_id", "value"):
+            demographics[event_attendee_id][demographic_columns[event_demographic_id]] = value
+
+        for row in chunk:
+            record = dict(zip(RESPONSE_EXPORT_FIELDS, row))
+            record["created_at"] = record["created_at"].isoformat()
+            record.update(demographics[record["event_attendee_id"]])
+            yield record
+
+
+# file-like object returning what's written, so csv.writer output can be streamed
+class Echo:
+    def write(self, value):
+        return value
+
+
+# encoded lines of an event's response export, in "csv" or "ndjson" format
+def stream_event_responses(event_id, export_format="csv"):
+    demographic_columns = get_demographic_columns(event_id)
+    records = iter_event_responses(event_id, demographic_columns)
+
+    if export_format == "ndjson":
+        for record in records:
+            yield json.dumps(record) + "\n"
+        return
+
+    fieldnames = RESPONSE_EXPORT_FIELDS + list(demographic_columns.values())
+    writer = csv.DictWriter(Echo(), fieldnames=fieldnames)
+    yield writer.writeheader()
+    for record in records:
+        yield writer.writerow(record)
+
+
+### PIVOTED DEMOGRAPHICS ###
+# lookups allowed when filtering profiles on a demographic value
+PROFILE_FILTER_LOOKUPS = ["exact", "gt", "gte", "lt", "lte"]
+
+
+# profile key for an event demographic; prefixed as bare 
+# numeric keys are read as array indexes in JSON paths
+def get_profile_key(event_demographic_id):
+    return f"ed_{event_demographic_id}"
+
+
+# typed value as stored in the JSON profile: numbers as numbers, dates as ISO strings
+def to_profile_value(field_type, value):
+    value = parse_typed_value(field_type, value)
+    if field_type == "number" and value is not None:
+        return int(value) if value == value.to_integral_value() else float(value)
+    if field_type == "date" and value is not None:
+        return value.isoformat()
+    return value
+
+
+# build profiles (unsaved) for the given attendees from their live demographics
+def build_demographic_profiles(event_attendees):
+    profiles = {
+        pk: DemographicProfile(
+            event_id=event_id, 
+            event_attendee_id=pk, 
+            attendee_type=attendee_type
+        )
+        for pk, event_id, attendee_type in event_attendees
+    }
+    for event_attendee_id, event_demographic_id, field_type, value in Demographics.objects.filter(
+        event_attendee_id__in=profiles
+    ).values_list(
+        "event_attendee_id", 
+        "event_demographic_id", 
+        "event_demographic__category__field_type", 
+        "value"
+    ):
+        profiles[event_attendee_id].values[get_profile_key(event_demographic_id)] = (
+            to_profile_value(field_type, value)
+        )
+    return list(profiles.values())
+
+
+# recompute the profiles of attendees whose demographic answers changed;
+# existing profiles rewritten with bulk_update, so a batch of answers 
+# (e.g. a soft delete cascade) isn't an upsert per attendee
+def refresh_demographic_profiles(event_attendee_ids):
+    event_attendees = EventAttendee.objects.all_with_deleted().filter(
+        pk__in=set(event_attendee_ids)
+    ).values_list("id", "event_id", "attendee_type")
+    profiles = build_demographic_profiles(event_attendees)
+    if not profiles:
+        return
+
+    with transaction.atomic():
+        profile_ids = dict(DemographicProfile.objects.filter(
+            event_attendee_id__in=[profile.event_attendee_id for profile in profiles]
+        ).values_list("event_attendee_id", "id"))
+        for profile in profiles:
+            profile.pk = profile_ids.get(profile.event_attendee_id)
+
+        DemographicProfile.objects.bulk_update(
+            [profile for profile in profiles if profile.pk is not None], 
+            ["event_id", "attendee_type", "values"], 
+            batch_size=1000
+        )
+        DemographicProfile.objects.bulk_create(
+            [profile for profile in profiles if profile.pk is None], 
+            ignore_conflicts=True
+        )
+
+
+# empty profiles for the events' attendees that have none yet, e.g. after 
+# bulk_create (no pks returned on mysql), so every attendee has a profile 
+# just as after rebuild_demographic_profiles
+def create_missing_demographic_profiles(event_ids):
+    event_attendees = EventAttendee.objects.all_with_deleted().filter(
+        event_id__in=set(event_ids), 
+        demographic_profile__isnull=True
+    ).values_list("id", "event_id", "attendee_type")
+    DemographicProfile.objects.bulk_create(
+        build_demographic_profiles(event_attendees), 
+        ignore_conflicts=True
+    )
+
+
+# recompute all profiles, for all events or just one, in batches
+def rebuild_demographic_profiles(event_id=None, batch_size=1000):
+    event_attendees = EventAttendee.objects.all_with_deleted().order_by("id")
+    if event_id is not None:
+        event_attendees = event_attendees.filter(event_id=event_id)
+    event_attendees = event_attendees.values_list("id", "event_id", "attendee_type")
+
+    with transaction.atomic():
+        stale = DemographicProfile.objects.all()
+        if event_id is not None:
+            stale = stale.filter(event_id=event_id)
+        stale.delete()
+
+        last_id = 0
+        while batch := list(event_attendees.filter(id__gt=last_id)[:batch_size]):
+            last_id = batch[-1][0]
+            DemographicProfile.objects.bulk_create(build_demographic_profiles(batch))
+
+
+# columnar view of an event's demographic profiles: one list per demographic 
+# (plus attendee_type), position-aligned with attendee_ids, so cross-tabs 
+# are single passes over zipped columns instead of self-joins on Demographics
+# filters narrow the rows in SQL, e.g. {"ed_3__gte": 18, "ed_3__lte": 25}
+class DemographicPivot:
+    def __init__(self, event_id, filters=None):
+        self.event_id = event_id
+        self.categories = {
+            get_profile_key(event_demographic_id): (name, field_type)
+            for event_demographic_id, name, field_type in EventDemographic.objects.filter(
+                event_id=event_id
+            ).values_list("id", "category__name", "category__field_type")
+        }
+
+        profiles = DemographicProfile.objects.filter(
+            event_id=event_id, 
+            event_attendee__is_deleted=False
+        )
+        for key, value in (filters or {}).items():
+            profiles = profiles.filter(**{f"values__{key}": value})
+
+        rows = list(profiles.values_list("event_attendee_id", "attendee_type", "values"))
+        self.attendee_ids = [row[0] for row in rows]
+        self.columns = {"attendee_type": [row[1] for row in rows]}
+        for key in self.categories:
+            self.columns[key] = [row[2].get(key) for row in rows]
+
+    def __len__(self):
+        return len(self.attendee_ids)
+
+    # live responses per attendee, optionally to one question, aligned with attendee_ids
+    def get_response_weights(self, question_id=None):
+        responses = Response.objects.filter(event_attendee__event_id=self.event_id)
+        if question_id is not None:
+            responses = responses.filter(question_id=question_id)
+        counts = dict(responses.values("event_attendee_id").annotate(
+            n=Count("id")
+        ).values_list("event_attendee_id", "n"))
+        return [counts.get(pk, 0) for pk in self.attendee_ids]
+
+    # {row value: {column value: count}} of attendees, or of their responses
+    # when weighted by responses (to question_id if given)
+    def crosstab(self, row_key, column_key, responses=False, question_id=None):
+        for key in (row_key, column_key):
+            if key not in self.columns:
+                raise KeyError(f"Unknown demographic column: {key}")
+
+        pairs = zip(self.columns[row_key], self.columns[column_key])
+        if responses:
+            counts = Counter()
+            for pair, weight in zip(pairs, self.get_response_weights(question_id)):
+                if weight:
+                    counts[pair] += weight
+        else:
+            counts = Counter(pairs)
+
+        table = defaultdict(dict)
+        for (row_value, column_value), count in counts.items():
+            table[row_value][column_value] = count
+        return dict(table)
+
+    # {value: count} of attendees for one column
+    def value_counts(self, key):
+        return Counter(self.columns[key])
@@ -1,3 +1,96 @@
-from django.shortcuts import render
+from .utils import (
+    EXPORT_FORMATS,
+    PROFILE_FILTER_LOOKUPS, 
+    DemographicPivot, 
+    get_demographic_response_counts, 
+    get_response_counts, 
+    stream_event_responses
+)
+from apps.common.routers import iter_replica_reads, replica_reads
+from apps.events.models import Event
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
 
-# Create your views here.
+
+# responses per question for an event, split by attendee type;
+# ?event_demographic=<id> further splits by that demographic's values
+@api_view(["GET"])
+def event_response_counts(request, event_id):
+    event_demographic_id = request.query_params.get("event_demographic")
+    if event_demographic_id and not event_demographic_id.isdigit():
+        return Response(
+            {"error": "event_demographic must be an event demographic id"}, 
+            status=400
+        )
+
+    with replica_reads(request):
+        if event_demographic_id:
+            return Response(get_demographic_response_counts(event_id, event_demographic_id))
+        return Response(get_response_counts(event_id))
+
+
+# stream an event's responses with attendee type & demographics;
+# ?format=csv (default) or ?format=ndjson
+def export_event_responses(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    export_format = request.GET.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(
+            f"Unsupported format; choose from {', '.join(EXPORT_FORMATS)}"
+        )
+
+    # rows are read as the body streams, after this view returns
+    response = StreamingHttpResponse(
+        iter_replica_reads(request, stream_event_responses(event.pk, export_format)),
+        content_type=EXPORT_FORMATS[export_format]
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="event_{event.pk}_responses.{export_format}"'
+    )
+    return response
+
+
+# cross-tab of two demographic columns (ed_<event_demographic_id> or attendee_type)
+# for an event: ?rows=ed_1&columns=ed_2; &responses=1 counts responses instead 
+# of attendees (&question=<id> for one question); filter attendees on values 
+# with e.g. ?ed_3__gte=18&ed_3__lte=25
+@api_view(["GET"])
+def event_demographic_crosstab(request, event_id):
+    event = get_object_or_404(Event, pk=event_id)
+    params = request.query_params
+
+    filters = {}
+    for key, value in params.items():
+        column, _, lookup = key.partition("__")
+        if column.startswith("ed_") and lookup in PROFILE_FILTER_LOOKUPS:
+            try:
+                value = float(value)
+            except ValueError:
+                pass
+            filters[key] = value
+
+    question_id = params.get("question")
+    if question_id is not None and not question_id.isdigit():
+        return Response({"error": "question must be a question id"}, status=400)
+
+    with replica_reads(request):
+        pivot = DemographicPivot(event.pk, filters)
+        try:
+            table = pivot.crosstab(
+                params.get("rows", "attendee_type"),
+                params.get("columns", "attendee_type"),
+                responses=params.get("responses") in ("1", "true"),
+                question_id=question_id
+            )
+        except KeyError as e:
+            return Response({"error": e.args[0]}, status=400)
+
+    return Response({
+        "attendees": len(pivot),
+        "categories": {
+            key: name for key, (name, _) in pivot.categories.items()
+        },
+        "table": table,
+    })
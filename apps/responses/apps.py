@@ -4,3 +4,8 @@ from apps.common.apps import BaseModelConfig
 class ResponsesConfig(BaseModelConfig):   
     name = "apps.responses"
     verbose_name = "Responses"
+
+    def ready(self):
+        super().ready()
+        # connect signal handlers
+        from . import signals
@@ -0,0 +1,99 @@
+from apps.attendees.models import EventAttendee, Participant
+from apps.common.benchmarks import measure, report, summarize
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from apps.questions.models import Question
+from apps.responses import views
+from apps.responses.models import Response
+from apps.responses.utils import ResponseBuffer
+from django.db import connection
+from django.test import tag
+from rest_framework.test import APITestCase
+import datetime
+import time
+
+
+# 2,000 participants answering one question: one submission each, back to back
+# (1 vCPU & SQLite serialize concurrent writes anyway, so arrivals are modelled
+# sequentially); per-response POSTs to the generic endpoint vs the batch endpoint, 
+# written directly & through the server-side ResponseBuffer
+@tag("benchmark")
+class ResponseLoadBenchmark(APITestCase):
+    participants = 2000
+    buffer_size = 200
+
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(organization)
+        cls.question = Question.objects.create(text="How was today's session?", organization=organization)
+        cls.event.questions.add(cls.question)
+        Participant.objects.bulk_create([
+            Participant(organization=organization, unique_id=f"p-{i}")
+            for i in range(cls.participants)
+        ])
+        EventAttendee.objects.bulk_create([
+            EventAttendee(event=cls.event, participant=participant)
+            for participant in Participant.objects.all()
+        ])
+        cls.event_attendee_ids = list(cls.event.event_attendees.values_list("id", flat=True))
+
+    # time each participant's submission; the last flush counts towards the total
+    def run_load(self, label, submit, flush=None):
+        Response.objects.all().delete()
+        pending = iter(self.event_attendee_ids)
+        # counted, not captured: query logging keeps the last 9000 only
+        queries = []
+
+        def count_query(execute, sql, params, many, context):
+            queries.append(None)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            start = time.perf_counter()
+            durations = measure(lambda: submit(next(pending)), self.participants)
+            if flush is not None:
+                flush()
+            total = time.perf_counter() - start
+
+        self.assertEqual(Response.objects.count(), self.participants)
+        report(
+            f"{self.participants} participants, {label}", 
+            total_s=round(total, 2), 
+            responses_per_s=round(self.participants / total), 
+            queries_per_response=round(len(queries) / self.participants, 2), 
+            **summarize(durations)
+        )
+
+    def post_response(self, event_attendee_id):
+        response = self.client.post(
+            "/api/response/", 
+            {"text": "Useful", "event_attendee": event_attendee_id, "question": self.question.pk}, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+
+    def post_batch(self, event_attendee_id):
+        response = self.client.post(
+            f"/apps/responses/events/{self.event.pk}/batch/", 
+            [{"text": "Useful", "event_attendee": event_attendee_id, "question": self.question.pk}], 
+            format="json"
+        )
+        self.assertIn(response.status_code, (201, 202))
+
+    def test_one_question_load(self):
+        self.run_load("POST /api/response/ each", self.post_response)
+        self.run_load("batch endpoint, written per request", self.post_batch)
+
+        # timer never fires here: the final flush is explicit
+        buffer = ResponseBuffer(max_size=self.buffer_size, max_age=60)
+        views.response_buffer = buffer
+        try:
+            self.run_load(
+                f"batch endpoint, ResponseBuffer of {self.buffer_size}", 
+                self.post_batch, 
+                buffer.flush
+            )
+        finally:
+            views.response_buffer = None
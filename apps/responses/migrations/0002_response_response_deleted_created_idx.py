@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0002_eventattendee_attendee_deleted_created_idx'),
+        ('questions', '0001_initial'),
+        ('responses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='response',
+            index=models.Index(fields=['is_deleted', 'created_at'], name='response_deleted_created_idx'),
+        ),
+    ]
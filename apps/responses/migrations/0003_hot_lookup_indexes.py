@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendees', '0003_hot_lookup_indexes'),
+        ('questions', '0001_initial'),
+        ('responses', '0002_response_response_deleted_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='response',
+            index=models.Index(fields=['event_attendee', 'question', 'is_deleted'], name='response_attendee_question_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='response',
+            index=models.Index(fields=['question', 'is_deleted', 'event_attendee'], name='response_question_attendee_idx'),
+        ),
+    ]
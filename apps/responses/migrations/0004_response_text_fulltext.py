@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+# FULLTEXT index for the __search lookup (apps.common.lookups); MySQL/MariaDB only,
+# other backends search with a substring match & need no index
+def create_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "mysql":
+        schema_editor.execute("CREATE FULLTEXT INDEX response_text_fulltext ON responses_response (text)")
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "mysql":
+        schema_editor.execute("DROP INDEX response_text_fulltext ON responses_response")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('responses', '0003_hot_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -17,10 +17,36 @@ class Response(BaseModel):
         on_delete=models.CASCADE, 
         related_name="responses"
     )
+    # client-generated key (e.g. a UUID) so retried & offline-synced submissions 
+    # are written once; optional for clients that don't retry
+    idempotency_key = models.CharField(
+        max_length=64, 
+        unique=True, 
+        null=True, 
+        blank=True
+    )
     
     def __str__(self):
         return f"Response to '{self.question.text}': {self.text}"
     
     class Meta:
+        indexes = [
+            # live rows filtered & ordered on every list request
+            models.Index(
+                fields=["is_deleted", "created_at"], 
+                name="response_deleted_created_idx"
+            ),
+            # an attendee's responses, per question (batch validation, pivots);
+            # is_deleted included so live-row lookups never touch the table
+            models.Index(
+                fields=["event_attendee", "question", "is_deleted"], 
+                name="response_attendee_question_idx"
+            ),
+            # per-question counts grouped by attendee (reports, rebuilds)
+            models.Index(
+                fields=["question", "is_deleted", "event_attendee"], 
+                name="response_question_attendee_idx"
+            ),
+        ]
         verbose_name = "Response"
         verbose_name_plural = "Responses"
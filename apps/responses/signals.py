@@ -0,0 +1,46 @@
+from .models import Response
+from .utils import invalidate_event_membership, publish_responses
+from apps.attendees.models import EventAttendee
+from apps.common.signals import post_restore, post_soft_delete
+from apps.events.models import Event
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+
+# drop cached event membership when attendees or questions change
+@receiver(post_save, sender=EventAttendee)
+def event_attendee_saved(sender, instance, **kwargs):
+    invalidate_event_membership(instance.event_id)
+
+
+@receiver(post_soft_delete, sender=EventAttendee)
+@receiver(post_restore, sender=EventAttendee)
+def event_attendees_bulk_soft_deleted(sender, pks, **kwargs):
+    for event_id in EventAttendee.objects.all_with_deleted().filter(
+        pk__in=pks
+    ).values_list("event_id", flat=True).distinct():
+        invalidate_event_membership(event_id)
+
+
+@receiver(m2m_changed, sender=Event.questions.through)
+def event_questions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    # reverse: question.events changed, so pk_set holds event ids
+    if reverse:
+        for event_id in pk_set or []:
+            invalidate_event_membership(event_id)
+    else:
+        invalidate_event_membership(instance.pk)
+
+
+# push individually created responses (e.g. via /api/response/) to live streams
+@receiver(post_save, sender=Response)
+def response_saved(sender, instance, created, **kwargs):
+    if not created:
+        return
+    event_id = EventAttendee.objects.all_with_deleted().filter(
+        pk=instance.event_attendee_id
+    ).values_list("event_id", flat=True).first()
+    transaction.on_commit(lambda: publish_responses(event_id, [instance]))
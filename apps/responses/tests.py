@@ -1,3 +1,157 @@
-from django.test import TestCase
+from apps.attendees.models import EventAttendee, Participant
+from apps.events.models import Event
+from apps.organizations.models import Organization
+from apps.questions.models import Question
+from apps.responses.models import Response
+from apps.responses.utils import ResponseBuffer
+from django.test import TransactionTestCase
+from rest_framework.test import APITestCase
+import datetime
 
-# Create your tests here.
+
+# a deleted response keeps its idempotency key, so a replay is rejected, not a 500
+class SoftDeletedIdempotencyKeyTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(name="Org")
+        event = Event.objects.create(name="Event", date=datetime.date.today())
+        event.organizations.add(organization)
+        cls.question = Question.objects.create(text="Question?", organization=organization)
+        event.questions.add(cls.question)
+        cls.event_attendee = EventAttendee.objects.create(
+            event=event, 
+            participant=Participant.objects.create(organization=organization)
+        )
+
+    def test_idempotency_key_includes_deleted(self):
+        Response.objects.create(
+            text="First", 
+            event_attendee=self.event_attendee, 
+            question=self.question, 
+            idempotency_key="k1"
+        ).delete_record()
+
+        response = self.client.post(
+            "/api/response/", 
+            {
+                "text": "Again", 
+                "event_attendee": self.event_attendee.pk, 
+                "question": self.question.pk, 
+                "idempotency_key": "k1",
+            }, 
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("idempotency_key", response.json())
+
+
+# one stale item in an offline queue mustn't block the rest of it
+class ResponseSyncTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        organization = Organization.objects.create(name="Org")
+        cls.event = Event.objects.create(name="Event", date=datetime.date.today())
+        cls.event.organizations.add(organization)
+        cls.question = Question.objects.create(text="Question?", organization=organization)
+        cls.event.questions.add(cls.question)
+        cls.event_attendee, cls.removed_attendee = [
+            EventAttendee.objects.create(
+                event=cls.event, 
+                participant=Participant.objects.create(organization=organization)
+            )
+            for _ in range(2)
+        ]
+
+    def sync(self, responses):
+        return self.client.post(
+            f"/apps/responses/events/{self.event.pk}/sync/", 
+            {"responses": responses}, 
+            format="json"
+        )
+
+    def test_valid_items_synced_and_stale_items_rejected(self):
+        self.removed_attendee.delete_record()
+
+        response = self.sync([
+            {
+                "event_attendee": self.event_attendee.pk, 
+                "question": self.question.pk, 
+                "text": "Kept", 
+                "idempotency_key": "n1",
+            },
+            {
+                "event_attendee": self.removed_attendee.pk, 
+                "question": self.question.pk, 
+                "text": "Stale", 
+                "idempotency_key": "s1",
+            },
+            {"event_attendee": self.event_attendee.pk, "question": self.question.pk, "text": "No key"},
+        ])
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertEqual(result["synced"], ["n1"])
+        self.assertEqual(
+            [item["idempotency_key"] for item in result["rejected"]], 
+            ["s1", None]
+        )
+        self.assertEqual(
+            list(Response.objects.values_list("idempotency_key", flat=True)), 
+            ["n1"]
+        )
+
+        # replaying the queue writes nothing twice
+        response = self.sync([{
+            "event_attendee": self.event_attendee.pk, 
+            "question": self.question.pk, 
+            "text": "Kept", 
+            "idempotency_key": "n1",
+        }])
+        self.assertEqual(response.json()["duplicates"], 1)
+        self.assertEqual(Response.objects.count(), 1)
+
+
+# transactional: the timer flushes from its own thread & db connection
+class ResponseBufferTests(TransactionTestCase):
+    def setUp(self):
+        organization = Organization.objects.create(name="Org")
+        self.event = Event.objects.create(name="Event", date=datetime.date.today())
+        self.event.organizations.add(organization)
+        self.question = Question.objects.create(text="Question?", organization=organization)
+        self.event.questions.add(self.question)
+        self.event_attendee = EventAttendee.objects.create(
+            event=self.event, 
+            participant=Participant.objects.create(organization=organization)
+        )
+
+    def build_response(self, text, question_id=None):
+        return Response(
+            text=text, 
+            event_attendee_id=self.event_attendee.pk, 
+            question_id=question_id or self.question.pk
+        )
+
+    def test_timer_flushes_without_further_traffic(self):
+        buffer = ResponseBuffer(max_size=100, max_age=0.05)
+        buffer.add(self.event.pk, [self.build_response("Last one")])
+
+        # nothing else is added; the timer alone writes the response
+        buffer.timer.join(timeout=5)
+        self.assertEqual(Response.objects.count(), 1)
+        self.assertIsNone(buffer.timer)
+
+    def test_failed_event_batch_requeued_without_losing_others(self):
+        buffer = ResponseBuffer(max_size=100, max_age=60, max_attempts=2)
+        # unknown question: the FK check fails this event's batch only
+        buffer.add(0, [self.build_response("Broken", question_id=999999)])
+        buffer.add(self.event.pk, [self.build_response("Fine")])
+
+        with self.assertLogs("apps.responses.utils", "ERROR"):
+            buffer.flush()
+        self.assertEqual(list(Response.objects.values_list("text", flat=True)), ["Fine"])
+        self.assertEqual([response.text for _, response, _ in buffer.responses], ["Broken"])
+
+        # dropped once max_attempts is reached
+        with self.assertLogs("apps.responses.utils", "ERROR"):
+            buffer.flush()
+        self.assertEqual(buffer.responses, [])
+        self.assertIsNone(buffer.timer)
@@ -0,0 +1,10 @@
+from django.urls import path
+from .views import ResponseBatchView, ResponseSyncView, stream_responses
+
+app_name = 'responses'
+
+urlpatterns = [
+    path('events/<int:event_id>/batch/', ResponseBatchView.as_view(), name='response-batch'),
+    path('events/<int:event_id>/stream/', stream_responses, name='response-stream'),
+    path('events/<int:event_id>/sync/', ResponseSyncView.as_view(), name='response-sync'),
+]
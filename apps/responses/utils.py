@@ -0,0 +1,262 @@
+from .models import Response
+from apps.attendees.models import EventAttendee
+from apps.common.pubsub import get_pubsub
+from apps.common.signals import post_bulk_create
+from apps.events.models import Event
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from rest_framework import serializers
+import atexit
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+### BATCHED RESPONSE SUBMISSION ###
+# rows per INSERT when writing a batch of responses
+RESPONSE_BATCH_SIZE = 500
+
+# flushes a buffered batch is tried before it's dropped (& logged)
+RESPONSE_BUFFER_MAX_ATTEMPTS = 3
+
+IDEMPOTENCY_KEY_MAX_LENGTH = Response._meta.get_field("idempotency_key").max_length
+
+
+# cached per-event sets of attendee & question ids, 
+# so validating a batch costs no FK lookups
+def get_event_membership_cache_key(event_id):
+    return f"responses:event_membership:{event_id}"
+
+
+def get_event_membership(event_id, refresh=False):
+    key = get_event_membership_cache_key(event_id)
+    membership = None if refresh else cache.get(key)
+
+    if membership is None:
+        membership = {
+            "attendee_ids": frozenset(EventAttendee.objects.filter(
+                event_id=event_id
+            ).values_list("id", flat=True)),
+            "question_ids": frozenset(Event.questions.through.objects.filter(
+                event_id=event_id
+            ).values_list("question_id", flat=True)),
+        }
+        cache.set(key, membership, settings.EVENT_MEMBERSHIP_CACHE_TIMEOUT)
+
+    return membership
+
+
+def invalidate_event_membership(event_id):
+    cache.delete(get_event_membership_cache_key(event_id))
+
+
+# validate response payloads against the event & build unsaved Response objects;
+# raises for the whole batch if any payload is invalid
+def build_responses(event_id, responses_data):
+    responses, errors = validate_responses(event_id, responses_data)
+    if errors:
+        raise serializers.ValidationError(dict(sorted(errors.items())))
+    return list(responses.values())
+
+
+# {index: unsaved Response} for valid payloads & {index: error} for the rest
+def validate_responses(event_id, responses_data):
+    if not isinstance(responses_data, list):
+        raise serializers.ValidationError({"responses": "Expected a list of responses"})
+
+    membership = get_event_membership(event_id)
+    responses = {}
+    errors = {}
+
+    for i, response_data in enumerate(responses_data):
+        try:
+            event_attendee_id = int(response_data["event_attendee"])
+            question_id = int(response_data["question"])
+            text = str(response_data["text"])
+            idempotency_key = response_data.get("idempotency_key") or None
+        except (AttributeError, KeyError, TypeError, ValueError):
+            errors[i] = "event_attendee, question & text are required"
+            continue
+        if idempotency_key is not None:
+            idempotency_key = str(idempotency_key)
+            if len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+                errors[i] = (
+                    f"idempotency_key must be at most {IDEMPOTENCY_KEY_MAX_LENGTH} characters"
+                )
+                continue
+        responses[i] = Response(
+            event_attendee_id=event_attendee_id,
+            question_id=question_id,
+            text=text,
+            idempotency_key=idempotency_key,
+        )
+
+    # cache may predate attendees who just joined; reload once before rejecting
+    if any(not is_member(response, membership) for response in responses.values()):
+        membership = get_event_membership(event_id, refresh=True)
+
+    for i, response in list(responses.items()):
+        if not is_member(response, membership):
+            errors[i] = "Attendee or question does not belong to the event"
+            del responses[i]
+
+    return responses, errors
+
+
+def is_member(response, membership):
+    return (
+        response.event_attendee_id in membership["attendee_ids"]
+        and response.question_id in membership["question_ids"]
+    )
+
+
+# drop responses whose idempotency_key is already stored or repeated in the batch;
+# soft deleted rows count, so a deleted response isn't resubmitted by a retry
+def drop_duplicate_responses(responses):
+    keys = [response.idempotency_key for response in responses if response.idempotency_key]
+    existing = set()
+    for i in range(0, len(keys), RESPONSE_BATCH_SIZE):
+        existing.update(Response.objects.all_with_deleted().filter(
+            idempotency_key__in=keys[i:i + RESPONSE_BATCH_SIZE]
+        ).values_list("idempotency_key", flat=True))
+
+    new_responses = []
+    for response in responses:
+        if response.idempotency_key:
+            if response.idempotency_key in existing:
+                continue
+            existing.add(response.idempotency_key)
+        new_responses.append(response)
+    return new_responses
+
+
+# write validated responses in micro-batches within one transaction, 
+# skipping duplicate idempotency keys; returns the responses written
+# bulk_create skips post_save, so signal listeners & publish to live streams here
+def bulk_create_responses(event_id, responses):
+    for attempt in range(2):
+        new_responses = drop_duplicate_responses(responses)
+        try:
+            with transaction.atomic():
+                created = Response.objects.bulk_create(
+                    new_responses, 
+                    batch_size=RESPONSE_BATCH_SIZE
+                )
+                post_bulk_create.send(sender=Response, instances=created)
+                transaction.on_commit(lambda: publish_responses(event_id, created))
+            return created
+        except IntegrityError:
+            # a concurrent request stored one of the keys first; dedupe again
+            if attempt:
+                raise
+
+
+# optional server-side buffer: collects responses across requests & writes them 
+# once RESPONSE_BUFFER_SIZE are queued, or by a timer RESPONSE_BUFFER_MAX_AGE seconds
+# after the first one is queued, so the last responses don't wait for more traffic;
+# buffered responses are lost if the process dies before a flush
+class ResponseBuffer:
+    def __init__(self, max_size, max_age, max_attempts=RESPONSE_BUFFER_MAX_ATTEMPTS):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        # (event_id, response, failed attempts so far)
+        self.responses = []
+        self.timer = None
+
+    def add(self, event_id, responses):
+        with self.lock:
+            self.responses.extend((event_id, response, 0) for response in responses)
+            if len(self.responses) >= self.max_size:
+                self.flush_locked()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.max_age, self.flush_on_timer)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            self.flush_locked()
+
+    # runs in the timer's own thread, so close the db connection it opened
+    def flush_on_timer(self):
+        try:
+            self.flush()
+        finally:
+            connection.close()
+
+    # write each event's responses separately, so one event's failure doesn't 
+    # lose the others' or surface as a 500 in whichever request triggered the flush;
+    # failed batches are re-queued for the next flush, up to max_attempts
+    def flush_locked(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        queued, self.responses = self.responses, []
+        batches = {}
+        for event_id, response, attempts in queued:
+            batches.setdefault((event_id, attempts), []).append(response)
+
+        for (event_id, attempts), responses in batches.items():
+            try:
+                bulk_create_responses(event_id, responses)
+            except Exception:
+                attempts += 1
+                if attempts >= self.max_attempts:
+                    logger.exception(
+                        "Dropping %d buffered responses for event %s after %d attempts", 
+                        len(responses), event_id, attempts
+                    )
+                    continue
+                logger.exception(
+                    "Failed to write %d buffered responses for event %s; re-queued", 
+                    len(responses), event_id
+                )
+                self.responses.extend((event_id, response, attempts) for response in responses)
+
+        if self.responses:
+            self.timer = threading.Timer(self.max_age, self.flush_on_timer)
+            self.timer.daemon = True
+            self.timer.start()
+
+
+response_buffer = None
+
+if settings.RESPONSE_BUFFER_SIZE:
+    response_buffer = ResponseBuffer(
+        settings.RESPONSE_BUFFER_SIZE, 
+        settings.RESPONSE_BUFFER_MAX_AGE
+    )
+    # write whatever is left on worker shutdown
+    atexit.register(response_buffer.flush)
+
+
+### LIVE RESPONSE STREAMS ###
+# pub/sub channels per event & per question within an event
+def get_event_channel(event_id):
+    return f"responses:event:{event_id}"
+
+
+def get_question_channel(event_id, question_id):
+    return f"responses:event:{event_id}:question:{question_id}"
+
+
+# push saved responses to facilitator dashboards subscribed to the event/question
+# id is None for rows bulk created on backends that don't return pks (mysql)
+def publish_responses(event_id, responses):
+    pubsub = get_pubsub()
+    for response in responses:
+        message = {
+            "id": response.pk,
+            "text": response.text,
+            "event_attendee": response.event_attendee_id,
+            "question": response.question_id,
+            "created_at": response.created_at.isoformat() if response.created_at else None,
+        }
+        pubsub.publish(get_event_channel(event_id), message)
+        pubsub.publish(get_question_channel(event_id, response.question_id), message)
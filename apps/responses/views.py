@@ -1,3 +1,124 @@
-from django.shortcuts import render
+from .utils import (
+    build_responses, 
+    bulk_create_responses, 
+    get_event_channel, 
+    get_question_channel, 
+    response_buffer, 
+    validate_responses
+)
+from apps.common.pubsub import get_pubsub
+from apps.events.models import Event
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+import json
+import time
 
-# Create your views here.
+
+# submit many responses for one event in a single request; 
+# accepts a JSON array or {"responses": [...]}; responses with an 
+# idempotency_key already stored are skipped
+class ResponseBatchView(APIView):
+
+    def post(self, request, event_id):
+        get_object_or_404(Event, pk=event_id)
+
+        responses_data = request.data
+        if isinstance(responses_data, dict):
+            responses_data = responses_data.get("responses", [])
+
+        responses = build_responses(event_id, responses_data)
+
+        # queue server-side when buffering is enabled; written on next flush
+        if response_buffer is not None:
+            response_buffer.add(event_id, responses)
+            return Response({"queued": len(responses)}, status=status.HTTP_202_ACCEPTED)
+
+        created = bulk_create_responses(event_id, responses)
+        return Response(
+            {"created": len(created), "duplicates": len(responses) - len(created)}, 
+            status=status.HTTP_201_CREATED
+        )
+
+
+# drain a client's offline queue in one request: every response carries an
+# idempotency_key, so replayed queues are written once; always written directly
+# (never buffered) so "synced" keys are safe for the client to drop from its queue
+# valid responses are written even if others aren't: invalid ones (e.g. an attendee 
+# since removed from the event) come back in "rejected" & will never sync, 
+# so the client drops them too rather than retrying the whole queue forever
+class ResponseSyncView(APIView):
+
+    def post(self, request, event_id):
+        get_object_or_404(Event, pk=event_id)
+
+        responses_data = request.data
+        if isinstance(responses_data, dict):
+            responses_data = responses_data.get("responses", [])
+
+        responses, errors = validate_responses(event_id, responses_data)
+        for i, response in list(responses.items()):
+            if not response.idempotency_key:
+                errors[i] = "idempotency_key is required"
+                del responses[i]
+
+        created = bulk_create_responses(event_id, list(responses.values()))
+        return Response({
+            "created": len(created),
+            "duplicates": len(responses) - len(created),
+            "synced": [response.idempotency_key for response in responses.values()],
+            "rejected": [
+                {
+                    "idempotency_key": get_payload_key(responses_data[i]), 
+                    "error": errors[i],
+                } 
+                for i in sorted(errors)
+            ],
+        })
+
+
+# idempotency_key of a raw payload, whether or not it's valid
+def get_payload_key(response_data):
+    if isinstance(response_data, dict):
+        return response_data.get("idempotency_key")
+    return None
+
+
+# server-sent events stream of new responses for an event, 
+# or one of its questions with ?question=<id>; serve via obwob.asgi
+# stream closes after RESPONSE_STREAM_MAX_AGE & EventSource reconnects
+async def stream_responses(request, event_id):
+    question_id = request.GET.get("question")
+    if question_id is not None and question_id.isdigit():
+        channel = get_question_channel(event_id, int(question_id))
+    else:
+        channel = get_event_channel(event_id)
+
+    response = StreamingHttpResponse(
+        stream_messages(channel), 
+        content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # stop nginx buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def stream_messages(channel):
+    subscription = get_pubsub().subscribe(channel)
+    closes_at = time.monotonic() + settings.RESPONSE_STREAM_MAX_AGE
+    try:
+        # reconnect delay (ms) for EventSource once the stream closes
+        yield "retry: 1000\n\n"
+        while time.monotonic() < closes_at:
+            message = await subscription.get(timeout=settings.RESPONSE_STREAM_KEEPALIVE)
+            # comment line keeps idle connections open through proxies
+            if message is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: response\ndata: {json.dumps(message)}\n\n"
+    finally:
+        subscription.close()
@@ -1,23 +1,35 @@
 import { useState } from 'react';
+import { drainQueue, enqueueResponse, queuedCount } from './responseQueue';
 
-function ResponseForm({ eventId, questionId }) {
+function ResponseForm({ eventId, eventAttendeeId, questionId }) {
     const [response, setResponse] = useState('');
+    const [pending, setPending] = useState(queuedCount());
 
     const handleSubmit = (e) => {
         e.preventDefault();
 
-        fetch(`/api/events/${eventId}/questions/${questionId}/response`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ response }),
-        })
-            .then((res) => res.json())
-            .then((data) => {
-                alert('Thank you for submitting your response!');
-                setResponse('');
-            });
+        // queue first so nothing is lost on flaky Wi-Fi; the queue is
+        // sent in one request & retried when the device comes back online
+        enqueueResponse(eventId, {
+            event_attendee: eventAttendeeId,
+            question: questionId,
+            text: response,
+        });
+        setResponse('');
+        setPending(queuedCount());
+
+        drainQueue()
+            .then((rejected) => {
+                if (rejected.length) {
+                    alert(`${rejected.length} response(s) could not be accepted and were discarded.`);
+                } else {
+                    alert('Thank you for submitting your response!');
+                }
+            })
+            .catch(() => {
+                alert('You appear to be offline. Your response will be sent once you reconnect.');
+            })
+            .finally(() => setPending(queuedCount()));
     };
 
     return (
@@ -28,8 +40,9 @@ function ResponseForm({ eventId, questionId }) {
                 placeholder="Please enter your response here"
             />
             <button type="submit">Submit</button>
+            {pending > 0 && <p>{pending} response(s) waiting to be sent</p>}
         </form>
     );
 }
 
-export default ResponseForm;
\ No newline at end of file
+export default ResponseForm;
@@ -0,0 +1,93 @@
+// offline queue of responses, drained in bulk to the backend sync endpoint //
+
+const QUEUE_KEY = 'responseQueue';
+
+// every queued response carries a client-generated idempotency key,
+// so a queue replayed after a dropped connection is only stored once
+function readQueue() {
+    try {
+        return JSON.parse(localStorage.getItem(QUEUE_KEY)) || [];
+    } catch {
+        return [];
+    }
+}
+
+function writeQueue(queue) {
+    localStorage.setItem(QUEUE_KEY, JSON.stringify(queue));
+}
+
+export function enqueueResponse(eventId, response) {
+    const queue = readQueue();
+    queue.push({
+        eventId,
+        response: { ...response, idempotency_key: crypto.randomUUID() },
+    });
+    writeQueue(queue);
+}
+
+// send everything queued, one request per event; synced & rejected keys are 
+// dropped from the queue; network errors & server errors (5xx) throw & leave 
+// the rest for the next drain; resolves with the rejected responses
+let draining = null;
+
+export function drainQueue() {
+    if (!draining) {
+        draining = sendQueue().finally(() => {
+            draining = null;
+        });
+    }
+    return draining;
+}
+
+async function sendQueue() {
+    const byEvent = {};
+    for (const item of readQueue()) {
+        (byEvent[item.eventId] = byEvent[item.eventId] || []).push(item.response);
+    }
+
+    const rejected = [];
+    for (const [eventId, responses] of Object.entries(byEvent)) {
+        const res = await fetch(`/apps/responses/events/${eventId}/sync/`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ responses }),
+        });
+        if (res.status >= 500) {
+            throw new Error(`Sync failed with status ${res.status}`);
+        }
+
+        let doneKeys;
+        if (res.ok) {
+            const result = await res.json();
+            rejected.push(...result.rejected);
+            doneKeys = new Set([
+                ...result.synced,
+                ...result.rejected.map((item) => item.idempotency_key),
+            ]);
+        } else {
+            // the whole batch was refused (e.g. the event no longer exists);
+            // resending won't change that, so don't let it block the queue
+            rejected.push(...responses.map((response) => ({
+                idempotency_key: response.idempotency_key,
+                error: `Sync failed with status ${res.status}`,
+            })));
+            doneKeys = new Set(responses.map((response) => response.idempotency_key));
+        }
+        // re-read: responses may have been queued while the request was in flight
+        writeQueue(readQueue().filter(
+            (item) => !doneKeys.has(item.response.idempotency_key)
+        ));
+    }
+    return rejected;
+}
+
+export function queuedCount() {
+    return readQueue().length;
+}
+
+// retry whenever the device comes back online
+window.addEventListener('online', () => {
+    drainQueue().catch(() => {});
+});
@@ -1,17 +1,41 @@
-import { useState } from 'react';
+import { useRef, useState } from 'react';
 import QrReader from 'react-qr-reader';
 
-function QRScanner({ onScanComplete }) {
+function QRScanner({ eventId, onScanComplete }) {
     const [error, setError] = useState(null);
+    // the reader fires on every frame the code stays in view; only check in once
+    const lastToken = useRef(null);
 
-    const handleScan = (data) => {
-        if (data) {
-            onScanComplete(data); // process the scanned data
+    const handleScan = async (data) => {
+        if (!data || data === lastToken.current) {
+            return;
+        }
+        lastToken.current = data;
+
+        try {
+            // the token is the whole check-in payload; no attendee lookup needed
+            const res = await fetch(`/apps/attendees/events/${eventId}/check-in/`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({ token: data }),
+            });
+            const result = await res.json();
+            if (!res.ok) {
+                throw new Error(result.token || result.detail || 'Check-in failed');
+            }
+            setError(null);
+            onScanComplete(result); // process the checked in attendee
+        } catch (err) {
+            // let the same code be scanned again after a failure
+            lastToken.current = null;
+            setError(err.message);
         }
     };
 
     const handleError = (err) => {
-        setError(err);
+        setError(err.message || String(err));
     };
 
     return (
@@ -27,4 +51,4 @@ function QRScanner({ onScanComplete }) {
     );
 }
 
-export default QRScanner;
\ No newline at end of file
+export default QRScanner;
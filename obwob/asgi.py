@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'obwob.settings')
+# read by settings (persistent db connections are off by default under ASGI)
+os.environ.setdefault('DJANGO_ASGI', 'True')
 
 application = get_asgi_application()
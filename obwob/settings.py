@@ -65,12 +65,15 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    # before anything reading or writing response bodies
+    "apps.common.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.common.routers.StickyPrimaryMiddleware",
 ]
 
 CORS_ORIGIN_WHITELIST = [
@@ -101,17 +104,104 @@ WSGI_APPLICATION = "obwob.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
+# MariaDB by default; DB_ENGINE=django.db.backends.sqlite3 for a local stand-in 
+# (DB_NAME is then the file path, default db.sqlite3 in BASE_DIR)
+DB_ENGINE = config("DB_ENGINE", default="django.db.backends.mysql")
+
+if DB_ENGINE == "django.db.backends.sqlite3":
+    DATABASES = {
+        "default": {
+            "ENGINE": DB_ENGINE,
+            "NAME": config("DB_NAME", default=os.path.join(BASE_DIR, "db.sqlite3")),
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": DB_ENGINE, # using MariaDB
+            "NAME": config("DB_NAME"),
+            "USER": config("DB_USER"),
+            "PASSWORD": config("DB_PASSWORD"),
+            "HOST": config("DB_HOST", default="localhost"),
+            "PORT": config("DB_PORT", default="3306"),
+        }
+    }
+
+# set by obwob.asgi when serving over ASGI (e.g. the response streams)
+DJANGO_ASGI = config("DJANGO_ASGI", default=False, cast=bool)
+
+# persistent connections: seconds to reuse a connection across requests 
+# (0 closes after each request, None keeps it open indefinitely), 
+# with a liveness check before reuse so dropped connections are replaced
+# off by default under ASGI: sync code runs in a thread pool there & Django 
+# only closes connections from the request's own thread, so persistent 
+# connections leak (see Django's ASGI deployment docs)
+DATABASES["default"]["CONN_MAX_AGE"] = config(
+    "DB_CONN_MAX_AGE", 
+    default=0 if DJANGO_ASGI else 60, 
+    cast=lambda value: int(value) if value != "None" else None
+)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = config(
+    "DB_CONN_HEALTH_CHECKS", 
+    default=True, 
+    cast=bool
+)
+
+# pooling: Django has no built-in MySQL pool, so DB_POOL_SIZE > 0 switches to the 
+# optional django-db-connection-pool backend (pip install django-db-connection-pool[mysql]); 
+# the pool owns connection lifetime, so Django closes its handle after each request
+DB_POOL_SIZE = config("DB_POOL_SIZE", default=0, cast=int)
+
+if DB_POOL_SIZE and DB_ENGINE == "django.db.backends.mysql":
+    DATABASES["default"].update({
+        "ENGINE": "dj_db_conn_pool.backends.mysql",
+        "CONN_MAX_AGE": 0,
+        "POOL_OPTIONS": {
+            "POOL_SIZE": DB_POOL_SIZE,
+            "MAX_OVERFLOW": config("DB_POOL_MAX_OVERFLOW", default=10, cast=int),
+            # recycle before MariaDB's wait_timeout drops idle connections
+            "RECYCLE": config("DB_POOL_RECYCLE", default=3600, cast=int),
+            "PRE_PING": True,
+        },
+    })
+
+# read replica for list/retrieve & report queries (apps.common.routers); 
+# set DB_REPLICA_NAME (& DB_REPLICA_HOST/PORT if they differ) to enable, 
+# for SQLite a copy of the migrated primary file (replicas are never migrated);
+# in tests the alias mirrors the primary (set it to run ReplicaRoutingTests)
+DB_REPLICA_NAME = config("DB_REPLICA_NAME", default="")
+
+if DB_REPLICA_NAME:
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": DB_REPLICA_NAME,
+        "TEST": {"MIRROR": "default"},
+    }
+    if DB_ENGINE != "django.db.backends.sqlite3":
+        DATABASES["replica"]["HOST"] = config("DB_REPLICA_HOST", default=DATABASES["default"]["HOST"])
+        DATABASES["replica"]["PORT"] = config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"])
+
+DATABASE_ROUTERS = ["apps.common.routers.PrimaryReplicaRouter"]
+
+# seconds a client's reads stay on the primary after it writes, covering replica lag
+REPLICA_STICKY_SECONDS = config("REPLICA_STICKY_SECONDS", default=5, cast=int)
+
+
+# Cache
+# per-process locmem by default; set REDIS_URL to share caches between workers
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.mysql", # using MariaDB
-        "NAME": config("DB_NAME"),
-        "USER": config("DB_USER"),
-        "PASSWORD": config("DB_PASSWORD"),
-        "HOST": "localhost",
-        "PORT": "3306",
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
     }
 }
 
+if config("REDIS_URL", default=""):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("REDIS_URL"),
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -153,6 +243,47 @@ STATIC_URL = "/static/"
 #     os.path.join(BASE_DIR, "static"),
 # ]
 
+# Django REST framework
+REST_FRAMEWORK = {
+    # keyset pagination on (created_at, id); per-model limits in apps.common.utils
+    "DEFAULT_PAGINATION_CLASS": "apps.common.pagination.KeysetPagination",
+    "PAGE_SIZE": 50,
+}
+
+# Response compression (apps.common.middleware.CompressionMiddleware)
+# bytes below which responses are sent uncompressed
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+# 0-11; 5 compresses close to the maximum at a fraction of the CPU
+BROTLI_QUALITY = config("BROTLI_QUALITY", default=5, cast=int)
+
+# Events
+# id of the default (General Feedback) event for new attendees;
+# unset uses the first event, cached per process for DEFAULT_EVENT_CACHE_TIMEOUT seconds
+DEFAULT_EVENT_ID = config(
+    "DEFAULT_EVENT_ID", 
+    default=None, 
+    cast=lambda value: int(value) if value else None
+)
+DEFAULT_EVENT_CACHE_TIMEOUT = config("DEFAULT_EVENT_CACHE_TIMEOUT", default=300, cast=int)
+# seconds to keep an event's serialized bootstrap payload (event, questions, demographics);
+# invalidated by events.signals on change, so this only bounds staleness from missed signals
+EVENT_BOOTSTRAP_CACHE_TIMEOUT = config("EVENT_BOOTSTRAP_CACHE_TIMEOUT", default=3600, cast=int)
+
+# Response submission
+# seconds to cache each event's attendee & question ids for batch validation
+EVENT_MEMBERSHIP_CACHE_TIMEOUT = config("EVENT_MEMBERSHIP_CACHE_TIMEOUT", default=300, cast=int)
+
+# buffer batched responses server-side & write in bulk; 0 writes every request
+RESPONSE_BUFFER_SIZE = config("RESPONSE_BUFFER_SIZE", default=0, cast=int)
+RESPONSE_BUFFER_MAX_AGE = config("RESPONSE_BUFFER_MAX_AGE", default=2, cast=float)
+
+# Realtime streams
+# dotted path to the pub/sub backend fanning out live responses
+PUBSUB_BACKEND = config("PUBSUB_BACKEND", default="apps.common.pubsub.InProcessPubSub")
+# seconds between keepalives & before an idle stream is closed for reconnect
+RESPONSE_STREAM_KEEPALIVE = config("RESPONSE_STREAM_KEEPALIVE", default=15, cast=int)
+RESPONSE_STREAM_MAX_AGE = config("RESPONSE_STREAM_MAX_AGE", default=300, cast=int)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
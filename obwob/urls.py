@@ -33,10 +33,10 @@ router = routers.DefaultRouter()
 
 # register each viewset dynamically with the router using custom utils functionality
 # lazy loading serializers & viewsets until explicitly needed to avoid import issues
+# shared registry: reuses the viewsets already built in BaseModelConfig.ready()
 def register_viewsets():
-    from apps.common.utils import generate_serializers, generate_viewsets
-    serializers_dict = generate_serializers()
-    viewsets_dict = generate_viewsets(serializers_dict)
+    from apps.common.utils import get_viewsets
+    viewsets_dict = get_viewsets()
 
     for model_name, viewset_class in viewsets_dict.items():
         router.register(model_name.lower(), viewset_class, basename=model_name.lower())
@@ -45,7 +45,10 @@ register_viewsets()
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("apps/attendees/", include("apps.attendees.urls")),
     path("apps/events/", include("apps.events.urls")),
+    path("apps/reports/", include("apps.reports.urls")),
+    path("apps/responses/", include("apps.responses.urls")),
 
     # api routes
     path('api/', include(router.urls)),